@@ -8,14 +8,25 @@ native vector support matters for similarity-search workloads.
 Groups:
 - ``vector-insert``  — INSERT a row with a 16-dimensional embedding
 - ``vector-ann``     — ANN SELECT (coodie) vs full-scan SELECT (cqlengine)
+- ``vector-buffer``  — build a 1536-dim document from a list, from
+  ``ndarray.tolist()`` and from a float32 ``numpy.ndarray`` / ``array.array``
+  and produce its bind values (no database)
+- ``vector-hydrate`` — validate a 1536-dim row into a ``list[float]`` field vs a
+  ``Vector(as_array=True)`` field (no database)
 """
 
 from __future__ import annotations
 
+import array
 import random
-from uuid import uuid4
+from typing import Annotated
+from uuid import UUID, uuid4
 
 import pytest
+from pydantic import Field
+
+from coodie.fields import PrimaryKey, Vector
+from coodie.sync.document import Document
 
 # Dimension constant matching the model definition in models_coodie.py
 DIMS = 16
@@ -112,3 +123,80 @@ def test_cqlengine_list_select(benchmark, bench_env):
         return list(CqlVectorProduct.objects.limit(5))
 
     benchmark(_scan)
+
+
+# ---------------------------------------------------------------------------
+# Vector buffer benchmarks (no database)
+# ---------------------------------------------------------------------------
+
+# Embedding-model sized vectors, where per-element work dominates.
+LARGE_DIMS = 1536
+
+
+class _BufferVectorDoc(Document):
+    id: Annotated[UUID, PrimaryKey()] = Field(default_factory=uuid4)
+    embedding: Annotated[list[float], Vector(dimensions=LARGE_DIMS)]
+
+    class Settings:
+        name = "bench_buffer_vectors"
+        keyspace = "bench_vector_ks"
+
+
+class _ArrayVectorDoc(Document):
+    id: Annotated[UUID, PrimaryKey()] = Field(default_factory=uuid4)
+    embedding: Annotated[list[float], Vector(dimensions=LARGE_DIMS, as_array=True)]
+
+    class Settings:
+        name = "bench_array_vectors"
+        keyspace = "bench_vector_ks"
+
+
+def _bind_values(doc: Document) -> list:
+    from coodie.types import _vector_to_list
+
+    return [doc.id, _vector_to_list(doc.embedding)]
+
+
+@pytest.mark.benchmark(group="vector-buffer")
+def test_vector_buffer_from_list(benchmark):
+    """coodie: build a 1536-dim document from a ``list[float]`` (per-element validation)."""
+    vec = _random_vec(LARGE_DIMS)
+    benchmark(lambda: _bind_values(_BufferVectorDoc(embedding=vec)))
+
+
+@pytest.mark.benchmark(group="vector-buffer")
+def test_vector_buffer_from_ndarray_tolist(benchmark):
+    """coodie: build a 1536-dim document from ``ndarray.tolist()`` (the pre-buffer workaround)."""
+    np = pytest.importorskip("numpy")
+    vec = np.asarray(_random_vec(LARGE_DIMS), dtype=np.float32)
+    benchmark(lambda: _bind_values(_BufferVectorDoc(embedding=vec.tolist())))
+
+
+@pytest.mark.benchmark(group="vector-buffer")
+def test_vector_buffer_from_ndarray(benchmark):
+    """coodie: build a 1536-dim document from a float32 ``numpy.ndarray`` (kept as-is)."""
+    np = pytest.importorskip("numpy")
+    vec = np.asarray(_random_vec(LARGE_DIMS), dtype=np.float32)
+    benchmark(lambda: _bind_values(_BufferVectorDoc(embedding=vec)))
+
+
+@pytest.mark.benchmark(group="vector-buffer")
+def test_vector_buffer_from_array(benchmark):
+    """coodie: build a 1536-dim document from an ``array.array("f")`` (kept as-is)."""
+    vec = array.array("f", _random_vec(LARGE_DIMS))
+    benchmark(lambda: _bind_values(_BufferVectorDoc(embedding=vec)))
+
+
+@pytest.mark.benchmark(group="vector-hydrate")
+def test_vector_hydrate_list(benchmark):
+    """coodie: validate a row with a 1536-dim vector into a ``list[float]`` field."""
+    row = {"id": uuid4(), "embedding": _random_vec(LARGE_DIMS)}
+    benchmark(_BufferVectorDoc.model_validate, row)
+
+
+@pytest.mark.benchmark(group="vector-hydrate")
+def test_vector_hydrate_float32_array(benchmark):
+    """coodie: validate a row with a 1536-dim vector into a ``Vector(as_array=True)`` field."""
+    pytest.importorskip("numpy")
+    row = {"id": uuid4(), "embedding": _random_vec(LARGE_DIMS)}
+    benchmark(_ArrayVectorDoc.model_validate, row)
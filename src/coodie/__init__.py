@@ -21,7 +21,8 @@ from coodie.aio import (
     create_keyspace,
     drop_keyspace,
 )
-from coodie.batch import BatchQuery, AsyncBatchQuery
+from coodie.ann import merge_ann_results
+from coodie.batch import BatchQuery, AsyncBatchQuery, BatchWriter, AsyncBatchWriter
 from coodie.exceptions import (
     CoodieError,
     DocumentNotFound,
@@ -51,7 +52,7 @@ from coodie.fields import (
     VectorIndex,
 )
 from coodie.lazy import LazyDocument
-from coodie.results import LWTResult, PagedResult
+from coodie.results import BatchResult, ExecutionResult, LWTResult, PagedResult
 from coodie.types import CqlDuration
 from coodie.usertype import UserType
 
@@ -61,12 +62,15 @@ __all__ = [
     "MaterializedView",
     "QuerySet",
     "LazyDocument",
+    "merge_ann_results",
     "init_coodie",
     "execute_raw",
     "create_keyspace",
     "drop_keyspace",
     "BatchQuery",
     "AsyncBatchQuery",
+    "BatchWriter",
+    "AsyncBatchWriter",
     "CoodieError",
     "DocumentNotFound",
     "MultipleDocumentsFound",
@@ -94,6 +98,8 @@ __all__ = [
     "CqlDuration",
     "LWTResult",
     "PagedResult",
+    "ExecutionResult",
+    "BatchResult",
     "UserType",
     "Vector",
     "VectorIndex",
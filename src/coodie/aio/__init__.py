@@ -4,8 +4,9 @@ from typing import Any
 
 from coodie.aio.document import Document, CounterDocument, MaterializedView
 from coodie.aio.query import QuerySet
-from coodie.batch import AsyncBatchQuery
+from coodie.batch import AsyncBatchQuery, AsyncBatchWriter
 from coodie.drivers import init_coodie_async as init_coodie
+from coodie.write_behind import WriteBehindQueue, configure_write_behind, get_write_behind
 
 
 async def execute_raw(stmt: str, params: list[Any] | None = None) -> list[dict[str, Any]]:
@@ -83,6 +84,10 @@ __all__ = [
     "MaterializedView",
     "QuerySet",
     "AsyncBatchQuery",
+    "AsyncBatchWriter",
+    "WriteBehindQueue",
+    "configure_write_behind",
+    "get_write_behind",
     "init_coodie",
     "execute_raw",
     "create_keyspace",
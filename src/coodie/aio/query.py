@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import asyncio
+import inspect
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
 from typing import Any, AsyncIterator, TYPE_CHECKING
 
+from coodie.ann import _QUERY_VECTOR, _ann_params, _ann_rows
+from coodie.columnar import _ArrowTableBuilder, _NumpyColumnsBuilder, _import_pandas
 from coodie.cql_builder import (
     build_select,
     build_select_json,
@@ -12,23 +17,32 @@ from coodie.cql_builder import (
     build_update,
     build_insert,
     build_aggregate,
-    parse_filter_kwargs,
-    parse_update_kwargs,
+    token_ranges,
 )
+from coodie.exceptions import InvalidQueryError
 from coodie.lazy import LazyDocument
+from coodie.lookups import check_conditions, compile_filters, compile_updates
+from coodie.read_cache import _clear_caches
+from coodie.scan import scan_token_ranges_async
+from coodie.sync.query import _build_docs, _select_values
 from coodie.results import LWTResult, PagedResult
-from coodie.schema import (
-    _find_discriminator_column,
-    _resolve_polymorphic_base,
-    _build_subclass_map,
-)
-from coodie.types import _collection_fields
+from coodie.schema import _partition_key_columns
+from coodie.types import _vector_to_list
 from coodie.drivers import get_driver as _get_driver_impl
+from coodie.drivers.base import _DEFAULT_CONCURRENCY
 
 if TYPE_CHECKING:
     from coodie.aio.document import Document
 
 
+# Page size used by ``stream()`` when none is given (the cassandra-driver default).
+_DEFAULT_STREAM_FETCH_SIZE = 5000
+
+# ``scan()`` splits the token ring into this many ranges per worker unless
+# told otherwise, so one slow range does not stall the whole window.
+_SCAN_RANGES_PER_WORKER = 4
+
+
 class QuerySet:
     """Asynchronous chainable query builder."""
 
@@ -147,7 +161,7 @@ class QuerySet:
     # ------------------------------------------------------------------
 
     def filter(self, **kwargs: Any) -> QuerySet:
-        triples = parse_filter_kwargs(kwargs)
+        triples = compile_filters(self._doc_cls, kwargs)
         return self._clone(where=self._where + triples)
 
     def limit(self, n: int) -> QuerySet:
@@ -156,16 +170,18 @@ class QuerySet:
     def order_by(self, *cols: str) -> QuerySet:
         return self._clone(order_by_val=list(cols))
 
-    def order_by_ann(self, column: str, vector: list[float]) -> QuerySet:
+    def order_by_ann(self, column: str, vector: Any) -> QuerySet:
         """Order results by approximate nearest neighbor (ANN) similarity.
 
         Generates ``ORDER BY "column" ANN OF ?`` in the CQL query.
 
         Args:
             column: The vector column name.
-            vector: The query vector to compare against.
+            vector: The query vector to compare against — a ``list[float]``
+                or a float buffer (``numpy.ndarray``, ``array.array``,
+                ``memoryview``).
         """
-        return self._clone(ann_of_val=(column, vector))
+        return self._clone(ann_of_val=(column, _vector_to_list(vector)))
 
     def allow_filtering(self) -> QuerySet:
         return self._clone(allow_filtering_val=True)
@@ -277,12 +293,12 @@ class QuerySet:
             return [c for c in all_cols if c not in self._defer_val]
         return None
 
-    async def all(self, *, lazy: bool = False) -> list[Document] | list[LazyDocument] | list[tuple[Any, ...]]:
-        columns = self._resolve_columns()
-        cql, params = build_select(
+    def _select_cql(self) -> tuple[str, list[Any]]:
+        """Build the ``SELECT`` for this queryset (shared by :meth:`all` and :meth:`stream`)."""
+        return build_select(
             self._table(),
             self._keyspace(),
-            columns=columns,
+            columns=self._resolve_columns(),
             where=self._where or None,
             limit=self._limit_val,
             order_by=self._order_by_val or None,
@@ -294,75 +310,236 @@ class QuerySet:
             cast=self._cast_val,
             ann_of=self._ann_of_val,
         )
-        rows = await self._get_driver().execute_async(
-            cql, params, consistency=self._consistency_val, timeout=self._timeout_val
-        )
+
+    def _hydrate(
+        self, columns: list[str], rows: list[tuple[Any, ...]], lazy: bool
+    ) -> list[Document] | list[LazyDocument] | list[tuple[Any, ...]]:
         if self._values_list_val is not None:
-            vl_cols = self._values_list_val
-            return [tuple(row.get(c) for c in vl_cols) for row in rows]
+            return _select_values(columns, rows, self._values_list_val)
         if lazy:
             doc_cls = self._doc_cls
-            return [LazyDocument(doc_cls, row) for row in rows]
-        return self._rows_to_docs(rows)
-
-    def _rows_to_docs(self, rows: list[dict[str, Any]]) -> list[Document]:
-        doc_cls = self._doc_cls
-        disc_col = _find_discriminator_column(doc_cls)
-        if disc_col is not None:
-            base = _resolve_polymorphic_base(doc_cls) or doc_cls
-            subclass_map = _build_subclass_map(base)
-            result = []
-            for row in rows:
-                disc_value = row.get(disc_col)
-                target_cls = subclass_map.get(disc_value, doc_cls)
-                coll = _collection_fields(target_cls)
-                if coll:
-                    for key, factory in coll.items():
-                        if key in row and row[key] is None:
-                            row[key] = factory()
-                known = target_cls.model_fields
-                filtered = {k: v for k, v in row.items() if k in known}
-                result.append(target_cls.model_validate(filtered))
-            return result
-        # Fast non-polymorphic path
-        coll = _collection_fields(doc_cls)
+            validate = not self._use_construct()
+            return [LazyDocument(doc_cls, row, columns, validate) for row in rows]
+        return self._rows_to_docs(columns, rows)
+
+    async def all(self, *, lazy: bool = False) -> list[Document] | list[LazyDocument] | list[tuple[Any, ...]]:
+        cql, params = self._select_cql()
+        columns, rows = await self._get_driver().execute_tuples_async(
+            cql, params, consistency=self._consistency_val, timeout=self._timeout_val
+        )
+        return self._hydrate(columns, rows, lazy)
+
+    async def ann_search_many(
+        self,
+        column: str,
+        vectors: Iterable[Any],
+        concurrency: int = _DEFAULT_CONCURRENCY,
+        *,
+        lazy: bool = False,
+    ) -> list[list[Document] | list[LazyDocument] | list[tuple[Any, ...]]]:
+        """Run one ANN query per vector in *vectors*, up to *concurrency* at a time.
+
+        Every query is this queryset ordered by ``ANN OF`` the vector, so
+        filters, :meth:`limit` and :meth:`only` apply to each of them; the
+        SELECT is built and prepared once.  Returns one result list per
+        input vector, in input order.  Use
+        :func:`~coodie.ann.merge_ann_results` to combine them into one
+        deduplicated ranking.
+
+        Example::
+
+            per_vector = await Product.find().limit(10).ann_search_many("embedding", vectors)
+        """
+        if self._ann_of_val is not None:
+            raise InvalidQueryError("ann_search_many() cannot be combined with order_by_ann()")
+        vectors = list(vectors)
+        if not vectors:
+            return []
+        cql, params = self.order_by_ann(column, _QUERY_VECTOR)._select_cql()
+        results = await self._get_driver().execute_many_async(
+            cql,
+            _ann_params(self._doc_cls, column, params, vectors),
+            concurrency=concurrency,
+            consistency=self._consistency_val,
+            timeout=self._timeout_val,
+        )
+        return [self._hydrate(columns, rows, lazy) for columns, rows in _ann_rows(results)]
+
+    async def _fetch_page(
+        self, cql: str, params: list[Any], fetch_size: int, paging_state: bytes | None
+    ) -> tuple[list[str], list[tuple[Any, ...]], bytes | None]:
+        return await self._get_driver().execute_paged_tuples_async(
+            cql,
+            params,
+            consistency=self._consistency_val,
+            timeout=self._timeout_val,
+            fetch_size=fetch_size,
+            paging_state=paging_state,
+        )
+
+    async def scan(
+        self,
+        parallelism: int = 8,
+        ranges: int | None = None,
+        fetch_size: int | None = None,
+        resume_token: int | None = None,
+        checkpoint: Callable[[int], Awaitable[Any] | Any] | None = None,
+        *,
+        raw: bool = False,
+        lazy: bool = False,
+    ) -> AsyncIterator[Document | LazyDocument | dict[str, Any] | tuple[Any, ...]]:
+        """Scan the whole table with concurrent token sub-range queries.
+
+        The token ring is split into *ranges* sub-ranges (default:
+        ``4 * parallelism``) queried as ``TOKEN(pk) > ? AND TOKEN(pk) <= ?``
+        with up to *parallelism* ranges in flight, each range paging with
+        *fetch_size* rows per page.  Results are yielded in token order as
+        Documents (:class:`~coodie.lazy.LazyDocument` with *lazy*), or as row
+        dicts when *raw* is ``True``; filters, :meth:`only` and
+        :meth:`values_list` apply as usual.
+
+        After the last row of every range has been yielded, *checkpoint*
+        (a function or coroutine function) is called with the range's end
+        token.  Passing that token back as *resume_token* continues the
+        scan right after it.
+
+        Example::
+
+            async for event in Event.find().scan(parallelism=16, checkpoint=save_token):
+                await export(event)
+        """
+        if self._limit_val is not None or self._order_by_val or self._ann_of_val is not None:
+            raise InvalidQueryError("scan() cannot be combined with limit(), order_by() or order_by_ann()")
+        pk_cols = _partition_key_columns(self._doc_cls)
+        token_col: Any = pk_cols[0] if len(pk_cols) == 1 else pk_cols
+        # Token bounds go first so they are always params[0] and params[1].
+        scan_where = [(token_col, "TOKEN >", None), (token_col, "TOKEN <=", None), *self._where]
+        cql, params = self._clone(where=scan_where)._select_cql()
+        extra_params = params[2:]
+        page_size = fetch_size or self._fetch_size_val or _DEFAULT_STREAM_FETCH_SIZE
+        num_ranges = ranges or parallelism * _SCAN_RANGES_PER_WORKER
+        work = token_ranges(num_ranges) if resume_token is None else token_ranges(num_ranges, start=resume_token)
+        driver = self._get_driver()
+
+        async def fetch_page(lo: int, hi: int, paging_state: bytes | None) -> tuple[Any, bytes | None]:
+            columns, rows, next_state = await driver.execute_paged_tuples_async(
+                cql,
+                [lo, hi, *extra_params],
+                consistency=self._consistency_val,
+                timeout=self._timeout_val,
+                fetch_size=page_size,
+                paging_state=paging_state,
+            )
+            return (columns, rows), next_state
+
+        async for (columns, rows), completed_token in scan_token_ranges_async(fetch_page, work, parallelism):
+            if raw:
+                for row in rows:
+                    yield dict(zip(columns, row))
+            else:
+                for item in self._hydrate(columns, rows, lazy):
+                    yield item
+            if completed_token is not None and checkpoint is not None:
+                result = checkpoint(completed_token)
+                if inspect.isawaitable(result):
+                    await result
+
+    async def stream(
+        self, fetch_size: int | None = None, *, lazy: bool = False
+    ) -> AsyncIterator[Document | LazyDocument | tuple[Any, ...]]:
+        """Yield results one at a time, fetching the query page by page.
+
+        Only one page (*fetch_size* rows, defaulting to :meth:`fetch_size` or
+        5000) is held in memory at a time.  The request for page *k + 1* is
+        issued before page *k* is hydrated, so network latency overlaps with
+        model construction.  Starts from :meth:`page` when a paging state was
+        given.
+
+        Example::
+
+            async for product in Product.find(category="books").stream(fetch_size=1000):
+                ...
+        """
+        pages = self._iter_pages(fetch_size)
+        try:
+            async for columns, rows in pages:
+                for item in self._hydrate(columns, rows, lazy):
+                    yield item
+        finally:
+            await pages.aclose()
+
+    async def _iter_pages(
+        self, fetch_size: int | None
+    ) -> AsyncGenerator[tuple[list[str], list[tuple[Any, ...]]], None]:
+        """Yield ``(columns, rows)`` page by page, prefetching the next page."""
+        cql, params = self._select_cql()
+        page_size = fetch_size or self._fetch_size_val or _DEFAULT_STREAM_FETCH_SIZE
+        pending: asyncio.Future[tuple[list[str], list[tuple[Any, ...]], bytes | None]] | None
+        pending = asyncio.ensure_future(self._fetch_page(cql, params, page_size, self._paging_state_val))
+        try:
+            while pending is not None:
+                columns, rows, paging_state = await pending
+                pending = None
+                if paging_state is not None:
+                    pending = asyncio.ensure_future(self._fetch_page(cql, params, page_size, paging_state))
+                    # Let the prefetch task send its request before the
+                    # consumer starts the CPU-bound work on the current page.
+                    await asyncio.sleep(0)
+                yield columns, rows
+        finally:
+            if pending is not None and not pending.done():
+                pending.cancel()
+
+    async def to_arrow(self, fetch_size: int | None = None) -> Any:
+        """Return the results as a ``pyarrow.Table`` without building Documents.
+
+        Pages are fetched as in :meth:`stream` and converted to Arrow
+        columns as they arrive.  Column types follow the document schema;
+        ``Vector`` fields become fixed-size ``float32`` lists.  Honours
+        :meth:`only`, :meth:`defer` and :meth:`values_list`.  Requires
+        pyarrow.
+
+        Example::
+
+            table = await Event.find(day=today).to_arrow(fetch_size=10_000)
+        """
+        builder = _ArrowTableBuilder(self._doc_cls, self._values_list_val or self._resolve_columns())
+        async for columns, rows in self._iter_pages(fetch_size):
+            builder.add_page(columns, rows)
+        return builder.finish()
+
+    async def to_columns(self, fetch_size: int | None = None) -> dict[str, Any]:
+        """Return the results as ``{column: numpy.ndarray}`` without building Documents.
+
+        Numeric and timestamp columns get a matching dtype (``float`` and
+        timestamp gaps become NaN/NaT); ``Vector`` fields become 2-D
+        ``float32`` arrays; everything else is an ``object`` array.
+        Requires NumPy.
+        """
+        builder = _NumpyColumnsBuilder(self._doc_cls, self._values_list_val or self._resolve_columns())
+        async for columns, rows in self._iter_pages(fetch_size):
+            builder.add_page(columns, rows)
+        return builder.finish()
+
+    async def to_pandas(self, fetch_size: int | None = None) -> Any:
+        """Return the results as a ``pandas.DataFrame`` built from :meth:`to_arrow`.
+
+        Requires pyarrow and pandas.
+        """
+        _import_pandas()
+        return (await self.to_arrow(fetch_size)).to_pandas()
+
+    def _rows_to_docs(self, columns: list[str], rows: list[tuple[Any, ...]]) -> list[Document]:
+        """Build Documents from the driver's tuple rows (see :func:`_build_docs`)."""
+        return _build_docs(self._doc_cls, columns, rows, self._use_construct())
+
+    def _use_construct(self) -> bool:
         # Determine whether to use model_construct (fast) or model_validate
         # (safe).  When validate_val is None (the default), auto-detect
         # based on the driver's needs_row_validation flag.
         if self._validate_val is None:
-            use_construct = not getattr(self._get_driver(), "needs_row_validation", False)
-        else:
-            use_construct = not self._validate_val
-        if use_construct:
-            # model_construct() fast path — skip Pydantic validation
-            construct = doc_cls.model_construct
-            if not rows:
-                return []
-            # All rows from the same CQL query share identical column sets,
-            # so we compute _fields_set once and reuse across the batch.
-            fields = set(rows[0].keys())
-            if not coll:
-                return [construct(_fields_set=fields, **row) for row in rows]
-            # Collection factories replace None→empty container in-place;
-            # they do not add/remove keys, so _fields_set stays correct.
-            result = []
-            for row in rows:
-                for key, factory in coll.items():
-                    if key in row and row[key] is None:
-                        row[key] = factory()
-                result.append(construct(_fields_set=fields, **row))
-            return result
-        # Default path — model_validate() with full type coercion
-        validate = doc_cls.model_validate
-        if not coll:
-            return [validate(row) for row in rows]
-        result = []
-        for row in rows:
-            for key, factory in coll.items():
-                if key in row and row[key] is None:
-                    row[key] = factory()
-            result.append(validate(row))
-        return result
+            return not getattr(self._get_driver(), "needs_row_validation", False)
+        return not self._validate_val
 
     async def paged_all(self) -> PagedResult:
         """Execute query returning a :class:`PagedResult` with documents and paging state.
@@ -380,8 +557,7 @@ class QuerySet:
             allow_filtering=self._allow_filtering_val,
             ann_of=self._ann_of_val,
         )
-        driver = self._get_driver()
-        rows = await driver.execute_async(
+        columns, rows, paging_state = await self._get_driver().execute_paged_tuples_async(
             cql,
             params,
             consistency=self._consistency_val,
@@ -389,8 +565,7 @@ class QuerySet:
             fetch_size=self._fetch_size_val,
             paging_state=self._paging_state_val,
         )
-        paging_state = getattr(driver, "_last_paging_state", None)
-        return PagedResult(data=self._rows_to_docs(rows), paging_state=paging_state)
+        return PagedResult(data=self._rows_to_docs(columns, rows), paging_state=paging_state)
 
     async def first(self) -> Document | None:
         results = await self.limit(1).all()
@@ -497,6 +672,7 @@ class QuerySet:
         return None
 
     async def delete(self, if_conditions: dict[str, Any] | None = None) -> LWTResult | None:
+        check_conditions(self._doc_cls, if_conditions)
         cql, params = build_delete(
             self._table(),
             self._keyspace(),
@@ -508,6 +684,7 @@ class QuerySet:
         rows = await self._get_driver().execute_async(
             cql, params, consistency=self._consistency_val, timeout=self._timeout_val
         )
+        _clear_caches(self._doc_cls)
         if self._if_exists_val or if_conditions:
             return _parse_lwt_result(rows)
         return None
@@ -524,6 +701,7 @@ class QuerySet:
             timestamp=self._timestamp_val,
         )
         rows = await self._get_driver().execute_async(cql, params)
+        _clear_caches(self._doc_cls)
         if self._if_not_exists_val:
             return _parse_lwt_result(rows)
         return None
@@ -535,23 +713,24 @@ class QuerySet:
         **kwargs: Any,
     ) -> None:
         """Bulk UPDATE matching rows. TTL may be provided as a parameter or via the ``ttl()`` chain modifier."""
-        set_data, collection_ops = parse_update_kwargs(kwargs)
+        set_data, collection_ops = compile_updates(self._doc_cls, kwargs)
+        check_conditions(self._doc_cls, if_conditions)
         if not set_data and not collection_ops:
             return
         cql, params = build_update(
             self._table(),
             self._keyspace(),
-            set_data,
+            {k: _vector_to_list(v) for k, v in set_data.items()},
             self._where,
             ttl=ttl if ttl is not None else self._ttl_val,
             if_conditions=if_conditions,
             collection_ops=collection_ops or None,
         )
         await self._get_driver().execute_async(cql, params)
+        _clear_caches(self._doc_cls)
 
-    async def __aiter__(self) -> AsyncIterator[Document]:
-        for doc in await self.all():
-            yield doc
+    def __aiter__(self) -> AsyncIterator[Document]:
+        return self.stream()  # type: ignore[return-value]
 
 
 def _parse_lwt_result(rows: list[dict[str, Any]]) -> LWTResult:
@@ -0,0 +1,115 @@
+"""Multi-vector ANN search — ``QuerySet.ann_search_many()`` and result merging.
+
+``ann_search_many()`` builds one ``ORDER BY "col" ANN OF ? LIMIT ?`` SELECT
+with :func:`~coodie.cql_builder.build_select`, then sends it once per query
+vector through the driver's ``execute_many`` pipeline, so the statement is
+prepared once and at most ``concurrency`` queries are in flight.  Results
+come back aligned to the input vectors; :func:`merge_ann_results` folds them
+into one deduplicated, re-ranked candidate list.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable, Iterator, Sequence
+from typing import Any
+
+from coodie.drivers.base import _dicts_to_tuples
+from coodie.exceptions import InvalidQueryError
+from coodie.lazy import LazyDocument
+from coodie.results import ExecutionResult
+from coodie.schema import _pk_columns, _vector_columns
+from coodie.types import _vector_to_list
+
+# Stand-in for the query vector while the shared SELECT is built; its
+# position in the bind parameters is where each vector goes.
+_QUERY_VECTOR = object()
+
+# Rank offset of reciprocal rank fusion (Cormack et al., 2009).
+_RRF_K = 60
+
+
+def _ann_params(doc_cls: type, column: str, params: list[Any], vectors: Sequence[Any]) -> Iterator[list[Any]]:
+    """Yield *params* once per vector, with the vector in the ``ANN OF ?`` slot."""
+    index = next(i for i, p in enumerate(params) if p is _QUERY_VECTOR)
+    dims = dict(_vector_columns(doc_cls)).get(column)
+    for vector in vectors:
+        if dims is not None and len(vector) != dims:
+            raise InvalidQueryError(f"Vector field '{column}' expects {dims} dimensions, got {len(vector)}")
+        bound = list(params)
+        bound[index] = _vector_to_list(vector)
+        yield bound
+
+
+def _ann_rows(results: list[ExecutionResult]) -> Iterator[tuple[list[str], list[tuple[Any, ...]]]]:
+    """Yield ``(columns, rows)`` per query, raising the first failed query's error."""
+    for result in results:
+        if not result.success:
+            assert result.error is not None
+            raise result.error
+        yield _dicts_to_tuples(result.rows)
+
+
+def _key_function(doc_cls: Any, sample: Any) -> Callable[[Any], Hashable]:
+    """Return how to key a result for deduplication.
+
+    Documents and :class:`~coodie.lazy.LazyDocument` proxies are keyed by
+    the primary key of *doc_cls* — by default the class the proxies were
+    queried for, or the class of *sample*.  ``values_list()`` rows have no
+    key columns of their own and are keyed by their values.
+    """
+    if isinstance(sample, tuple):
+        return _row_key
+    if doc_cls is None:
+        doc_cls = sample._doc_cls if isinstance(sample, LazyDocument) else type(sample)
+    pk = _pk_columns(doc_cls)
+    return lambda doc: tuple(getattr(doc, c) for c in pk)
+
+
+def _row_key(row: tuple[Any, ...]) -> Hashable:
+    try:
+        hash(row)
+    except TypeError:
+        raise InvalidQueryError("values_list() rows can only be merged when all their values are hashable") from None
+    return row
+
+
+def merge_ann_results(
+    results: Sequence[Sequence[Any]],
+    limit: int | None = None,
+    rerank: Callable[[Any], float] | None = None,
+    doc_cls: type | None = None,
+) -> list[Any]:
+    """Merge per-vector ANN results into one list of unique documents.
+
+    Documents are deduplicated by primary key (of *doc_cls* when given,
+    otherwise of the queried class of the results); ``values_list()`` rows
+    are deduplicated by value.  By default they are ranked
+    by reciprocal rank fusion — each query contributes ``1 / (60 + rank)``
+    to every document it returned — so candidates that several query
+    vectors agree on come first.  Pass *rerank* to score each unique
+    document yourself instead (higher is better), e.g. with the exact
+    similarity to a reference vector.  Ties keep first-seen order.
+
+    Example::
+
+        per_vector = Product.ann_search_many("embedding", vectors, limit=20)
+        top = merge_ann_results(per_vector, limit=10)
+    """
+    docs: dict[Hashable, Any] = {}
+    scores: dict[Hashable, float] = {}
+    doc_key: Callable[[Any], Hashable] | None = None
+    for hits in results:
+        for rank, doc in enumerate(hits, start=1):
+            if doc_key is None:
+                doc_key = _key_function(doc_cls, doc)
+            key = doc_key(doc)
+            if key not in docs:
+                docs[key] = doc
+                scores[key] = 0.0
+            scores[key] += 1.0 / (_RRF_K + rank)
+    if rerank is not None:
+        scores = {key: rerank(doc) for key, doc in docs.items()}
+    ranked = sorted(docs, key=scores.__getitem__, reverse=True)
+    if limit is not None:
+        ranked = ranked[:limit]
+    return [docs[key] for key in ranked]
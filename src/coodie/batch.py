@@ -1,14 +1,34 @@
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+from collections import deque
+from collections.abc import Hashable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from types import TracebackType
+from typing import TYPE_CHECKING, Any
 
-from coodie.cql_builder import build_batch
+from pydantic import BaseModel
+
+from coodie.read_cache import _invalidate
+from coodie.results import BatchResult
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+# Default flush thresholds of the batch writers.  5 KiB is Cassandra's
+# default ``batch_size_warn_threshold_in_kb`` (ScyllaDB warns at 128 KiB),
+# so default-sized sub-batches stay below the warning on both.
+_WRITER_MAX_STATEMENTS = 50
+_WRITER_MAX_BYTES = 5 * 1024
+_WRITER_CONCURRENCY = 16
 
 
 class BatchQuery:
     """Synchronous batch context manager.
 
-    Accumulates CQL statements and executes them as a single batch on exit.
+    Accumulates CQL statements and executes them as a single batch on exit,
+    through the driver's native batch API where it has one, so each member
+    reuses its own prepared statement.
 
     Example::
 
@@ -19,7 +39,7 @@ class BatchQuery:
             Product(name="B").save(batch=batch)
     """
 
-    __slots__ = ("_logged", "_batch_type", "_timestamp", "_statements")
+    __slots__ = ("_logged", "_batch_type", "_timestamp", "_statements", "_docs")
 
     def __init__(
         self,
@@ -31,13 +51,23 @@ class BatchQuery:
         self._batch_type = batch_type
         self._timestamp = timestamp
         self._statements: list[tuple[str, list[Any]]] = []
+        # Documents written by the batch, dropped from the read cache once it ran.
+        self._docs: list[Any] = []
 
-    def add(self, stmt: str, params: list[Any]) -> None:
-        """Add a CQL statement to the batch."""
+    def add(self, stmt: str, params: list[Any], partition_key: Hashable | None = None, doc: Any = None) -> None:
+        """Add a CQL statement to the batch.
+
+        *partition_key* is accepted for parity with :class:`BatchWriter`
+        and ignored: everything added is sent as one batch.  *doc*, if
+        given, is dropped from the read cache once the batch has executed.
+        """
         self._statements.append((stmt, params))
+        if doc is not None:
+            self._docs.append(doc)
 
     def __enter__(self) -> BatchQuery:
         self._statements.clear()
+        self._docs.clear()
         return self
 
     def __exit__(
@@ -55,20 +85,24 @@ class BatchQuery:
             return
         from coodie.drivers import get_driver
 
-        cql, params = build_batch(
-            self._statements,
-            logged=self._logged,
-            batch_type=self._batch_type,
-            timestamp=self._timestamp,
-        )
-        get_driver().execute(cql, params)
+        try:
+            get_driver().execute_batch(
+                self._statements,
+                logged=self._logged,
+                batch_type=self._batch_type,
+                timestamp=self._timestamp,
+            )
+        finally:
+            _invalidate_all(self._docs)
         self._statements.clear()
 
 
 class AsyncBatchQuery:
     """Asynchronous batch context manager.
 
-    Accumulates CQL statements and executes them as a single batch on exit.
+    Accumulates CQL statements and executes them as a single batch on exit,
+    through the driver's native batch API where it has one, so each member
+    reuses its own prepared statement.
 
     Example::
 
@@ -89,13 +123,23 @@ class AsyncBatchQuery:
         self._batch_type = batch_type
         self._timestamp = timestamp
         self._statements: list[tuple[str, list[Any]]] = []
+        # Documents written by the batch, dropped from the read cache once it ran.
+        self._docs: list[Any] = []
+
+    def add(self, stmt: str, params: list[Any], partition_key: Hashable | None = None, doc: Any = None) -> None:
+        """Add a CQL statement to the batch.
 
-    def add(self, stmt: str, params: list[Any]) -> None:
-        """Add a CQL statement to the batch."""
+        *partition_key* is accepted for parity with :class:`BatchWriter`
+        and ignored: everything added is sent as one batch.  *doc*, if
+        given, is dropped from the read cache once the batch has executed.
+        """
         self._statements.append((stmt, params))
+        if doc is not None:
+            self._docs.append(doc)
 
     async def __aenter__(self) -> AsyncBatchQuery:
         self._statements.clear()
+        self._docs.clear()
         return self
 
     async def __aexit__(
@@ -113,11 +157,380 @@ class AsyncBatchQuery:
             return
         from coodie.drivers import get_driver
 
-        cql, params = build_batch(
-            self._statements,
-            logged=self._logged,
-            batch_type=self._batch_type,
-            timestamp=self._timestamp,
-        )
-        await get_driver().execute_async(cql, params)
+        try:
+            await get_driver().execute_batch_async(
+                self._statements,
+                logged=self._logged,
+                batch_type=self._batch_type,
+                timestamp=self._timestamp,
+            )
+        finally:
+            _invalidate_all(self._docs)
         self._statements.clear()
+
+
+def _invalidate_all(docs: list[Any]) -> None:
+    """Drop *docs* from the read cache; a read since they were queued may have cached the old rows."""
+    for doc in docs:
+        _invalidate(doc)
+    docs.clear()
+
+
+def _value_size(value: Any) -> int:
+    """Rough serialized size of a bind value, in bytes."""
+    if value is None:
+        return 0
+    if isinstance(value, str):
+        return len(value.encode())
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return len(value)
+    if isinstance(value, (bool, int, float)):
+        return 8
+    if isinstance(value, dict):
+        return sum(_value_size(k) + _value_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sum(_value_size(v) for v in value)
+    if isinstance(value, BaseModel):
+        return _value_size(value.model_dump())
+    # UUID, datetime, Decimal, ...
+    return 16
+
+
+class _Group:
+    """Statements buffered for one partition.
+
+    *slot* is the hashable key the group is tracked under; *key* is the
+    partition key as given.
+    """
+
+    __slots__ = ("docs", "key", "size", "slot", "statements")
+
+    def __init__(self, slot: Hashable, key: Any) -> None:
+        self.slot = slot
+        self.key = key
+        self.size = 0
+        self.statements: list[tuple[str, list[Any]]] = []
+        self.docs: list[Any] = []
+
+
+class _PartitionGroups:
+    """Buffer statements per partition key and cut them into sub-batches.
+
+    A sub-batch is closed once it holds *max_statements* statements or its
+    estimated bind-value size reaches *max_bytes*; a statement that would
+    push an open sub-batch past *max_bytes* starts the next one instead.
+    """
+
+    __slots__ = ("_groups", "max_bytes", "max_statements")
+
+    def __init__(self, max_statements: int, max_bytes: int) -> None:
+        self.max_statements = max(1, max_statements)
+        self.max_bytes = max_bytes
+        self._groups: dict[Hashable, _Group] = {}
+
+    def add(self, stmt: str, params: list[Any], partition_key: Any, doc: Any = None) -> list[_Group]:
+        """Buffer one statement; return the sub-batches it closed."""
+        slot: Hashable = partition_key
+        try:
+            hash(slot)
+        except TypeError:
+            # Unhashable key values cannot be grouped; the statement is sent alone.
+            slot = object()
+        size = sum(_value_size(p) for p in params)
+        closed = []
+        group = self._groups.get(slot)
+        if group is not None and group.size + size > self.max_bytes:
+            closed.append(self._groups.pop(slot))
+            group = None
+        if group is None:
+            group = self._groups[slot] = _Group(slot, partition_key)
+        group.statements.append((stmt, params))
+        if doc is not None:
+            group.docs.append(doc)
+        group.size += size
+        if len(group.statements) >= self.max_statements or group.size >= self.max_bytes:
+            closed.append(self._groups.pop(slot))
+        return closed
+
+    def drain(self) -> list[_Group]:
+        """Return every open sub-batch and forget them."""
+        groups = list(self._groups.values())
+        self._groups.clear()
+        return groups
+
+
+class BatchWriter:
+    """Synchronous partition-aware batch writer.
+
+    Unlike :class:`BatchQuery`, which sends everything it accumulated as a
+    single batch, a writer groups statements by partition key and sends each
+    group as its own sub-batch as soon as it reaches *max_statements*
+    statements or about *max_bytes* of bind values.  Up to *concurrency*
+    sub-batches are in flight on a thread pool; :meth:`add` blocks while the
+    window is full.  Sub-batches of one partition are sent in order.
+
+    Documents pass their partition key when given ``batch=writer``; pass
+    *partition_key* to :meth:`add` yourself for raw statements (statements
+    without one are grouped together).  Sub-batches are ``UNLOGGED`` by
+    default — a single-partition batch is applied atomically without the
+    batch log.
+
+    Every sub-batch produces a :class:`~coodie.results.BatchResult` in
+    :attr:`results`; a failure does not stop the others, so check
+    :attr:`failed` afterwards.
+
+    Example::
+
+        from coodie.sync import BatchWriter
+
+        with BatchWriter(max_statements=20) as writer:
+            for event in events:
+                event.save(batch=writer)
+        for result in writer.failed:
+            log.error("batch for %s failed: %s", result.partition_key, result.error)
+    """
+
+    __slots__ = (
+        "_batch_type",
+        "_concurrency",
+        "_consistency",
+        "_groups",
+        "_logged",
+        "_pending",
+        "_pool",
+        "_tails",
+        "_timeout",
+        "_timestamp",
+        "results",
+    )
+
+    def __init__(
+        self,
+        max_statements: int = _WRITER_MAX_STATEMENTS,
+        max_bytes: int = _WRITER_MAX_BYTES,
+        concurrency: int = _WRITER_CONCURRENCY,
+        logged: bool = False,
+        batch_type: str | None = None,
+        timestamp: int | None = None,
+        consistency: str | None = None,
+        timeout: float | None = None,
+    ) -> None:
+        self._groups = _PartitionGroups(max_statements, max_bytes)
+        self._concurrency = max(1, concurrency)
+        self._logged = logged
+        self._batch_type = batch_type
+        self._timestamp = timestamp
+        self._consistency = consistency
+        self._timeout = timeout
+        self._pool: ThreadPoolExecutor | None = None
+        self._pending: deque[Future[BatchResult]] = deque()
+        # Last sub-batch submitted per partition, so the next one waits for it.
+        self._tails: dict[Hashable, Future[BatchResult]] = {}
+        self.results: list[BatchResult] = []
+
+    @property
+    def failed(self) -> list[BatchResult]:
+        """The sub-batches that raised."""
+        return [r for r in self.results if not r.success]
+
+    def add(self, stmt: str, params: list[Any], partition_key: Hashable | None = None, doc: Any = None) -> None:
+        """Buffer a CQL statement, sending the sub-batch it completes.
+
+        *doc*, if given, is dropped from the read cache once its sub-batch has been sent.
+        """
+        for group in self._groups.add(stmt, params, partition_key, doc):
+            self._submit(group)
+
+    def _send(self, group: _Group, previous: Future[BatchResult] | None) -> BatchResult:
+        from coodie.drivers import get_driver
+
+        if previous is not None:
+            wait([previous])
+        try:
+            rows = get_driver().execute_batch(
+                group.statements,
+                logged=self._logged,
+                batch_type=self._batch_type,
+                timestamp=self._timestamp,
+                consistency=self._consistency,
+                timeout=self._timeout,
+            )
+        except Exception as exc:  # noqa: BLE001
+            return BatchResult(success=False, statements=group.statements, partition_key=group.key, error=exc)
+        finally:
+            _invalidate_all(group.docs)
+        return BatchResult(success=True, statements=group.statements, partition_key=group.key, rows=rows)
+
+    def _collect(self) -> None:
+        """Move finished sub-batches off the head of the queue, keeping submission order."""
+        while self._pending and self._pending[0].done():
+            self.results.append(self._pending.popleft().result())
+
+    def _submit(self, group: _Group) -> None:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self._concurrency, thread_name_prefix="coodie-batch")
+        self._collect()
+        while sum(not f.done() for f in self._pending) >= self._concurrency:
+            wait(self._pending, return_when=FIRST_COMPLETED)
+            self._collect()
+        # A worker only waits on a sub-batch submitted before its own, which
+        # has already been picked up, so the pool cannot deadlock.
+        future = self._pool.submit(self._send, group, self._tails.get(group.slot))
+        self._pending.append(future)
+        self._tails[group.slot] = future
+
+    def flush(self) -> None:
+        """Send every buffered statement and wait for all sub-batches in flight."""
+        for group in self._groups.drain():
+            self._submit(group)
+        wait(self._pending)
+        self._collect()
+        self._tails.clear()
+
+    def close(self) -> None:
+        """Wait for in-flight sub-batches and stop the thread pool; buffered statements are dropped."""
+        self._groups.drain()
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        self._collect()
+        self._tails.clear()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        try:
+            if exc_type is None:
+                self.flush()
+        finally:
+            self.close()
+
+
+class AsyncBatchWriter:
+    """Asynchronous partition-aware batch writer.
+
+    Async version of :class:`BatchWriter`: full sub-batches are scheduled
+    as tasks on the running loop, at most *concurrency* of them executing at
+    once.  :meth:`add` never blocks, so call ``await writer.flush()`` now and
+    then when writing a very large stream.
+
+    Example::
+
+        from coodie.aio import AsyncBatchWriter
+
+        async with AsyncBatchWriter(max_statements=20) as writer:
+            for event in events:
+                await event.save(batch=writer)
+        for result in writer.failed:
+            log.error("batch for %s failed: %s", result.partition_key, result.error)
+    """
+
+    __slots__ = (
+        "_batch_type",
+        "_consistency",
+        "_groups",
+        "_logged",
+        "_semaphore",
+        "_tails",
+        "_tasks",
+        "_timeout",
+        "_timestamp",
+        "results",
+    )
+
+    def __init__(
+        self,
+        max_statements: int = _WRITER_MAX_STATEMENTS,
+        max_bytes: int = _WRITER_MAX_BYTES,
+        concurrency: int = _WRITER_CONCURRENCY,
+        logged: bool = False,
+        batch_type: str | None = None,
+        timestamp: int | None = None,
+        consistency: str | None = None,
+        timeout: float | None = None,
+    ) -> None:
+        self._groups = _PartitionGroups(max_statements, max_bytes)
+        self._semaphore = asyncio.Semaphore(max(1, concurrency))
+        self._logged = logged
+        self._batch_type = batch_type
+        self._timestamp = timestamp
+        self._consistency = consistency
+        self._timeout = timeout
+        self._tasks: list[asyncio.Task[BatchResult]] = []
+        # Last sub-batch scheduled per partition, so the next one waits for it.
+        self._tails: dict[Hashable, asyncio.Task[BatchResult]] = {}
+        self.results: list[BatchResult] = []
+
+    @property
+    def failed(self) -> list[BatchResult]:
+        """The sub-batches that raised."""
+        return [r for r in self.results if not r.success]
+
+    def add(self, stmt: str, params: list[Any], partition_key: Hashable | None = None, doc: Any = None) -> None:
+        """Buffer a CQL statement, scheduling the sub-batch it completes.
+
+        *doc*, if given, is dropped from the read cache once its sub-batch has been sent.
+        """
+        for group in self._groups.add(stmt, params, partition_key, doc):
+            self._submit(group)
+
+    async def _send(self, group: _Group, previous: asyncio.Task[BatchResult] | None) -> BatchResult:
+        from coodie.drivers import get_driver
+
+        if previous is not None:
+            await asyncio.wait([previous])
+        async with self._semaphore:
+            try:
+                rows = await get_driver().execute_batch_async(
+                    group.statements,
+                    logged=self._logged,
+                    batch_type=self._batch_type,
+                    timestamp=self._timestamp,
+                    consistency=self._consistency,
+                    timeout=self._timeout,
+                )
+            except Exception as exc:  # noqa: BLE001
+                return BatchResult(success=False, statements=group.statements, partition_key=group.key, error=exc)
+            finally:
+                _invalidate_all(group.docs)
+        return BatchResult(success=True, statements=group.statements, partition_key=group.key, rows=rows)
+
+    def _submit(self, group: _Group) -> None:
+        task = asyncio.get_running_loop().create_task(self._send(group, self._tails.get(group.slot)))
+        self._tasks.append(task)
+        self._tails[group.slot] = task
+
+    async def flush(self) -> None:
+        """Send every buffered statement and wait for all sub-batches in flight."""
+        for group in self._groups.drain():
+            self._submit(group)
+        tasks, self._tasks = self._tasks, []
+        self.results.extend(await asyncio.gather(*tasks))
+        self._tails.clear()
+
+    async def close(self) -> None:
+        """Wait for in-flight sub-batches; buffered statements are dropped."""
+        self._groups.drain()
+        tasks, self._tasks = self._tasks, []
+        self.results.extend(await asyncio.gather(*tasks))
+        self._tails.clear()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            await self.flush()
+        else:
+            await self.close()
@@ -0,0 +1,236 @@
+"""Bounded LRU cache shared by the drivers' prepared-statement caches."""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import threading
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Any
+
+# Shared get_or_create_async() calls in flight; the event loop only keeps
+# weak references to tasks, and one may outlive the caller that started it.
+_shared_tasks: set[asyncio.Future[Any]] = set()
+
+
+@dataclass(frozen=True, slots=True)
+class CacheInfo:
+    """Snapshot of an :class:`LRUCache`'s counters.
+
+    ``maxsize`` is ``None`` for an unbounded cache.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int | None
+    currsize: int
+
+
+class LRUCache:
+    """Thread-safe mapping that evicts its least recently used entry when full.
+
+    Every operation holds a lock for a few dictionary operations only and
+    never awaits, so one cache can be shared by threads and coroutines alike.
+    ``maxsize=None`` disables eviction; ``maxsize=0`` disables caching.
+
+    :meth:`get_or_create` and :meth:`get_or_create_async` are single-flight:
+    concurrent misses on one key run the factory once and share its result.
+    """
+
+    __slots__ = ("_data", "_evictions", "_hits", "_inflight", "_lock", "_maxsize", "_misses")
+
+    def __init__(self, maxsize: int | None = 128) -> None:
+        if maxsize is not None and maxsize < 0:
+            raise ValueError(f"maxsize must be >= 0 or None, got {maxsize}")
+        self._maxsize = maxsize
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._inflight: dict[Hashable, concurrent.futures.Future[Any]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def maxsize(self) -> int | None:
+        return self._maxsize
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the value cached for *key* and mark it most recently used."""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self._misses += 1
+                return default
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Cache *value* under *key*, evicting the oldest entries if over ``maxsize``."""
+        with self._lock:
+            self._store(key, value)
+
+    def get_or_create(
+        self,
+        key: Hashable,
+        factory: Callable[[], Any],
+        cache_if: Callable[[Any], bool] | None = None,
+    ) -> Any:
+        """Return the value cached for *key*, calling *factory* on a miss.
+
+        Threads that miss on a key while another thread's *factory* call for
+        it is running wait for that call instead of starting their own.  If
+        *cache_if* is given, the new value is only stored when
+        ``cache_if(value)`` is true; the waiters get it either way.
+        """
+        value, future, leader = self._lookup(key)
+        if future is None:
+            return value
+        if not leader:
+            return future.result()
+        try:
+            value = factory()
+        except BaseException as exc:
+            self._finish(key, future, exc=exc)
+            raise
+        self._finish(key, future, value=value, cache_if=cache_if)
+        return value
+
+    async def get_or_create_async(
+        self,
+        key: Hashable,
+        factory: Callable[[], Awaitable[Any]],
+        cache_if: Callable[[Any], bool] | None = None,
+    ) -> Any:
+        """Async version of :meth:`get_or_create`; *factory* returns an awaitable.
+
+        Waiters may run on any thread or event loop.  The shared call runs
+        in a task of its own, so cancelling a waiter — or the caller that
+        started it — does not cancel it for the others.
+        """
+        value, future, leader = self._lookup(key)
+        if future is None:
+            return value
+        if not leader:
+            return await asyncio.shield(asyncio.wrap_future(future))
+        try:
+            task = asyncio.ensure_future(factory())
+        except BaseException as exc:
+            self._finish(key, future, exc=exc)
+            raise
+        _shared_tasks.add(task)
+        task.add_done_callback(lambda t: self._finish_task(key, future, t, cache_if))
+        return await asyncio.shield(task)
+
+    def _finish_task(
+        self,
+        key: Hashable,
+        future: concurrent.futures.Future[Any],
+        task: asyncio.Future[Any],
+        cache_if: Callable[[Any], bool] | None,
+    ) -> None:
+        _shared_tasks.discard(task)
+        if task.cancelled():
+            self._finish(key, future, exc=asyncio.CancelledError())
+        elif task.exception() is not None:
+            self._finish(key, future, exc=task.exception())
+        else:
+            self._finish(key, future, value=task.result(), cache_if=cache_if)
+
+    def _lookup(self, key: Hashable) -> tuple[Any, concurrent.futures.Future[Any] | None, bool]:
+        """Return ``(value, future, leader)`` for *key*.
+
+        On a hit *future* is ``None``.  On a miss the caller either waits
+        for *future* or, as the *leader*, must produce the value and resolve
+        it through :meth:`_finish`.
+        """
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self._hits += 1
+                return self._data[key], None, False
+            self._misses += 1
+            inflight = self._inflight.get(key)
+            if inflight is not None:
+                return None, inflight, False
+            future: concurrent.futures.Future[Any] = concurrent.futures.Future()
+            self._inflight[key] = future
+            return None, future, True
+
+    def _finish(
+        self,
+        key: Hashable,
+        future: concurrent.futures.Future[Any],
+        value: Any = None,
+        exc: BaseException | None = None,
+        cache_if: Callable[[Any], bool] | None = None,
+    ) -> None:
+        with self._lock:
+            del self._inflight[key]
+            # *cache_if* runs under the lock, so nothing can read the value
+            # from the cache before it has been accepted.
+            if exc is None and (cache_if is None or cache_if(value)):
+                self._store(key, value)
+        if exc is None:
+            future.set_result(value)
+        else:
+            future.set_exception(exc)
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        # Caller holds self._lock.
+        if self._maxsize == 0:
+            return
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if self._maxsize is not None:
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def resize(self, maxsize: int | None) -> None:
+        """Change ``maxsize``, evicting the oldest entries if the cache shrinks."""
+        if maxsize is not None and maxsize < 0:
+            raise ValueError(f"maxsize must be >= 0 or None, got {maxsize}")
+        with self._lock:
+            self._maxsize = maxsize
+            if maxsize is not None:
+                while len(self._data) > maxsize:
+                    self._data.popitem(last=False)
+                    self._evictions += 1
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove *key* and return its value (or *default*)."""
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._data.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def keys(self) -> list[Hashable]:
+        """Return the cached keys, least recently used first."""
+        with self._lock:
+            return list(self._data)
+
+    def info(self) -> CacheInfo:
+        """Return the current hit/miss/eviction counters and size."""
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                maxsize=self._maxsize,
+                currsize=len(self._data),
+            )
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -0,0 +1,256 @@
+"""Columnar export of query results — ``QuerySet.to_arrow()`` / ``to_columns()`` / ``to_pandas()``.
+
+Rows are taken straight from the driver's tuple-row pages and transposed
+into per-column value lists; no Document is built.  Column types come from
+the document's :func:`~coodie.schema.build_schema` (the
+:func:`~coodie.types.python_type_to_cql_type_str` mapping), so an empty
+result still has a typed schema.  ``vector<float, N>`` columns become
+fixed-size lists in Arrow and 2-D ``float32`` arrays in NumPy.
+
+pyarrow, NumPy and pandas are optional and imported on first use.
+"""
+
+from __future__ import annotations
+
+import re
+from datetime import date
+from typing import Any
+
+from coodie.schema import build_schema
+
+_VECTOR_RE = re.compile(r"^vector<\s*float\s*,\s*(\d+)\s*>$")
+
+# CQL type -> pyarrow type factory name (and arguments).  Types not listed
+# here (collections, UDTs, decimal, varint, duration, ...) are inferred by
+# pyarrow from the values.
+_ARROW_TYPES: dict[str, tuple[str, tuple[Any, ...]]] = {
+    "text": ("string", ()),
+    "varchar": ("string", ()),
+    "ascii": ("string", ()),
+    "inet": ("string", ()),
+    "uuid": ("string", ()),
+    "timeuuid": ("string", ()),
+    "int": ("int32", ()),
+    "bigint": ("int64", ()),
+    "counter": ("int64", ()),
+    "smallint": ("int16", ()),
+    "tinyint": ("int8", ()),
+    "float": ("float32", ()),
+    "double": ("float64", ()),
+    "boolean": ("bool_", ()),
+    "blob": ("binary", ()),
+    "timestamp": ("timestamp", ("ms",)),
+    "date": ("date32", ()),
+}
+
+# CQL type -> NumPy dtype.  Anything else is kept as an ``object`` array.
+_NUMPY_DTYPES: dict[str, str] = {
+    "int": "int32",
+    "bigint": "int64",
+    "counter": "int64",
+    "smallint": "int16",
+    "tinyint": "int8",
+    "float": "float32",
+    "double": "float64",
+    "boolean": "bool",
+    "timestamp": "datetime64[ms]",
+}
+
+# Float dtypes store a missing value as NaN; other typed columns fall back
+# to ``object`` when they contain ``None``.
+_NAN_DTYPES = frozenset({"float32", "float64", "datetime64[ms]"})
+
+
+def _import_pyarrow() -> Any:
+    try:
+        import pyarrow  # type: ignore[import-untyped]
+    except ImportError as exc:
+        raise ImportError("pyarrow is required for QuerySet.to_arrow(). Install it with: pip install pyarrow") from exc
+    return pyarrow
+
+
+def _import_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError as exc:
+        raise ImportError("numpy is required for QuerySet.to_columns(). Install it with: pip install numpy") from exc
+    return numpy
+
+
+def _import_pandas() -> Any:
+    try:
+        import pandas  # type: ignore[import-untyped]
+    except ImportError as exc:
+        raise ImportError("pandas is required for QuerySet.to_pandas(). Install it with: pip install pandas") from exc
+    return pandas
+
+
+def _vector_dims(cql_type: str | None) -> int | None:
+    match = _VECTOR_RE.match(cql_type or "")
+    return int(match.group(1)) if match else None
+
+
+def _to_text(value: Any) -> Any:
+    return None if value is None else str(value)
+
+
+def _to_date(value: Any) -> Any:
+    # cassandra-driver returns ``cassandra.util.Date`` for ``date`` columns.
+    if value is None or isinstance(value, date):
+        return value
+    return value.date()
+
+
+_ARROW_CONVERTERS = {
+    "inet": _to_text,
+    "uuid": _to_text,
+    "timeuuid": _to_text,
+    "date": _to_date,
+}
+
+
+class _ColumnCollector:
+    """Transpose tuple-row pages into per-column value lists in a fixed column order.
+
+    The order is *columns* when given, otherwise the document's schema order
+    followed by any extra columns of the first page (e.g. the subclass
+    columns of a polymorphic table).  A column missing from a page is
+    filled with ``None``.
+    """
+
+    __slots__ = ("_extend", "_page_columns", "_positions", "cql_types", "names")
+
+    def __init__(self, doc_cls: type, columns: list[str] | None = None) -> None:
+        schema = {col.name: col.cql_type for col in build_schema(doc_cls)}
+        self.names: list[str] = list(columns) if columns else list(schema)
+        self.cql_types: dict[str, str | None] = {name: schema.get(name) for name in self.names}
+        self._extend = not columns
+        self._page_columns: list[str] | None = None
+        self._positions: list[int | None] = []
+
+    def _align(self, columns: list[str]) -> list[int | None]:
+        if columns != self._page_columns:
+            if self._extend:
+                for name in columns:
+                    if name not in self.cql_types:
+                        self.names.append(name)
+                        self.cql_types[name] = None
+                self._extend = False
+            index = {name: i for i, name in enumerate(columns)}
+            self._positions = [index.get(name) for name in self.names]
+            self._page_columns = list(columns)
+        return self._positions
+
+    def split(self, columns: list[str], rows: list[tuple[Any, ...]]) -> list[list[Any]]:
+        """Return one value list per column in :attr:`names` for this page."""
+        if not rows:
+            return [[] for _ in self.names]
+        by_column = list(zip(*rows))
+        return [list(by_column[pos]) if pos is not None else [None] * len(rows) for pos in self._align(columns)]
+
+
+class _ArrowTableBuilder:
+    """Build a ``pyarrow.Table`` one chunk per page.
+
+    Each page is converted as soon as it arrives, so the Python row values
+    of a page can be freed before the next one is fetched.
+    """
+
+    __slots__ = ("_chunks", "_collector", "_pa")
+
+    def __init__(self, doc_cls: type, columns: list[str] | None = None) -> None:
+        self._pa = _import_pyarrow()
+        self._collector = _ColumnCollector(doc_cls, columns)
+        self._chunks: list[Any] = []
+
+    def _arrow_type(self, cql_type: str | None) -> Any:
+        pa = self._pa
+        dims = _vector_dims(cql_type)
+        if dims is not None:
+            return pa.list_(pa.float32(), dims)
+        spec = _ARROW_TYPES.get(cql_type or "")
+        if spec is None:
+            return None
+        factory, args = spec
+        return getattr(pa, factory)(*args)
+
+    def add_page(self, columns: list[str], rows: list[tuple[Any, ...]]) -> None:
+        if not rows:
+            return
+        pa = self._pa
+        collector = self._collector
+        arrays = []
+        for name, values in zip(collector.names, collector.split(columns, rows)):
+            cql_type = collector.cql_types[name]
+            convert = _ARROW_CONVERTERS.get(cql_type or "")
+            if convert is not None:
+                values = [convert(v) for v in values]
+            arrays.append(pa.array(values, type=self._arrow_type(cql_type)))
+        self._chunks.append(pa.Table.from_arrays(arrays, names=list(collector.names)))
+
+    def finish(self) -> Any:
+        pa = self._pa
+        if not self._chunks:
+            collector = self._collector
+            fields = [
+                pa.field(name, self._arrow_type(collector.cql_types[name]) or pa.null()) for name in collector.names
+            ]
+            return pa.schema(fields).empty_table()
+        # Columns with an inferred type may come out as ``null`` on an
+        # all-None page; "default" promotion unifies them with later pages.
+        return pa.concat_tables(self._chunks, promote_options="default")
+
+
+class _NumpyColumnsBuilder:
+    """Build a ``{column: numpy.ndarray}`` mapping from tuple-row pages.
+
+    Like :class:`_ArrowTableBuilder`, each page is converted to arrays as
+    soon as it arrives; ``finish()`` concatenates the per-page arrays.
+    """
+
+    __slots__ = ("_chunks", "_collector", "_np")
+
+    def __init__(self, doc_cls: type, columns: list[str] | None = None) -> None:
+        self._np = _import_numpy()
+        self._collector = _ColumnCollector(doc_cls, columns)
+        self._chunks: dict[str, list[Any]] = {}
+
+    def add_page(self, columns: list[str], rows: list[tuple[Any, ...]]) -> None:
+        if not rows:
+            return
+        collector = self._collector
+        for name, values in zip(collector.names, collector.split(columns, rows)):
+            self._chunks.setdefault(name, []).append(self._array(collector.cql_types[name], values))
+
+    def _array(self, cql_type: str | None, values: list[Any]) -> Any:
+        np = self._np
+        dims = _vector_dims(cql_type)
+        if dims is not None:
+            if not values:
+                return np.empty((0, dims), dtype=np.float32)
+            nan_row = [float("nan")] * dims
+            return np.asarray([nan_row if v is None else v for v in values], dtype=np.float32)
+        dtype = _NUMPY_DTYPES.get(cql_type or "")
+        if dtype is None or (dtype not in _NAN_DTYPES and None in values):
+            array = np.empty(len(values), dtype=object)
+            array[:] = values
+            return array
+        return np.asarray(values, dtype=dtype)
+
+    def finish(self) -> dict[str, Any]:
+        np = self._np
+        collector = self._collector
+        result = {}
+        for name in collector.names:
+            chunks = self._chunks.get(name)
+            if not chunks:
+                result[name] = self._array(collector.cql_types[name], [])
+            elif len(chunks) == 1:
+                result[name] = chunks[0]
+            else:
+                # A page with a None in a typed column came out as ``object``;
+                # the whole column then becomes ``object``, as if built at once.
+                if any(chunk.dtype == object for chunk in chunks):
+                    chunks = [chunk.astype(object) for chunk in chunks]
+                result[name] = np.concatenate(chunks)
+        return result
@@ -1,9 +1,54 @@
 from __future__ import annotations
 
+import functools
 from typing import Any
 
+from coodie.cache import CacheInfo, LRUCache
 from coodie.schema import ColumnDefinition
 
+# CQL templates cached per statement kind, keyed by query shape.  Each cache
+# is bounded so that shapes with unbounded variety (IN-list lengths, literal
+# TTLs and timestamps) cannot grow a long-running process without limit.
+_CQL_CACHE_MAXSIZE = 1024
+
+_select_cql_cache = LRUCache(_CQL_CACHE_MAXSIZE)
+_count_cql_cache = LRUCache(_CQL_CACHE_MAXSIZE)
+_aggregate_cql_cache = LRUCache(_CQL_CACHE_MAXSIZE)
+_insert_cql_cache = LRUCache(_CQL_CACHE_MAXSIZE)
+_update_cql_cache = LRUCache(_CQL_CACHE_MAXSIZE)
+_delete_cql_cache = LRUCache(_CQL_CACHE_MAXSIZE)
+
+_CQL_CACHES: dict[str, LRUCache] = {
+    "select": _select_cql_cache,
+    "count": _count_cql_cache,
+    "aggregate": _aggregate_cql_cache,
+    "insert": _insert_cql_cache,
+    "update": _update_cql_cache,
+    "delete": _delete_cql_cache,
+}
+
+
+def cache_info() -> dict[str, CacheInfo]:
+    """Return hit/miss/eviction counters and size of every CQL template cache."""
+    return {name: cache.info() for name, cache in _CQL_CACHES.items()}
+
+
+def cache_clear() -> None:
+    """Empty every CQL template cache and reset its counters."""
+    for cache in _CQL_CACHES.values():
+        cache.clear()
+
+
+def set_cache_size(maxsize: int | None, name: str | None = None) -> None:
+    """Bound the CQL template cache *name* (or all of them) to *maxsize* entries.
+
+    ``None`` makes a cache unbounded and ``0`` disables it.
+    """
+    if name is not None and name not in _CQL_CACHES:
+        raise ValueError(f"Unknown CQL cache {name!r}. Known caches: {', '.join(_CQL_CACHES)}")
+    for cache in _CQL_CACHES.values() if name is None else (_CQL_CACHES[name],):
+        cache.resize(maxsize)
+
 
 def build_create_keyspace(
     keyspace: str,
@@ -189,27 +234,32 @@ def build_drop_materialized_view(view_name: str, keyspace: str) -> str:
     return f"DROP MATERIALIZED VIEW IF EXISTS {keyspace}.{view_name}"
 
 
+# Filter kwarg suffix -> CQL operator, e.g. ``price__gt`` -> ``(price, ">")``.
+_FILTER_OPS: dict[str, str] = {
+    "gt": ">",
+    "gte": ">=",
+    "lt": "<",
+    "lte": "<=",
+    "in": "IN",
+    "contains": "CONTAINS",
+    "contains_key": "CONTAINS KEY",
+    "like": "LIKE",
+    "ne": "!=",
+    "isnull": "ISNULL",
+}
+_TOKEN_FILTER_OPS: dict[str, str] = {
+    "token__gt": "TOKEN >",
+    "token__gte": "TOKEN >=",
+    "token__lt": "TOKEN <",
+    "token__lte": "TOKEN <=",
+}
+
+
 def parse_filter_kwargs(
     kwargs: dict[str, Any],
 ) -> list[tuple[str, str, Any]]:
-    operators = {
-        "gt": ">",
-        "gte": ">=",
-        "lt": "<",
-        "lte": "<=",
-        "in": "IN",
-        "contains": "CONTAINS",
-        "contains_key": "CONTAINS KEY",
-        "like": "LIKE",
-        "ne": "!=",
-        "isnull": "ISNULL",
-    }
-    token_operators = {
-        "token__gt": "TOKEN >",
-        "token__gte": "TOKEN >=",
-        "token__lt": "TOKEN <",
-        "token__lte": "TOKEN <=",
-    }
+    operators = _FILTER_OPS
+    token_operators = _TOKEN_FILTER_OPS
     result = []
     for key, value in kwargs.items():
         parts2 = key.rsplit("__", 2)
@@ -229,7 +279,7 @@ def parse_filter_kwargs(
 
 
 def build_where_clause(
-    filter_triples: list[tuple[str, str, Any]],
+    filter_triples: list[tuple[Any, str, Any]],
 ) -> tuple[str, list[Any]]:
     if not filter_triples:
         return "", []
@@ -243,7 +293,9 @@ def build_where_clause(
                 parts.append(f'"{col}" IS NOT NULL')
         elif op.startswith("TOKEN "):
             actual_op = op[len("TOKEN ") :]
-            parts.append(f'TOKEN("{col}") {actual_op} ?')
+            # A tuple of columns renders TOKEN("a", "b") for composite partition keys.
+            token_cols = ", ".join(f'"{c}"' for c in col) if isinstance(col, tuple) else f'"{col}"'
+            parts.append(f"TOKEN({token_cols}) {actual_op} ?")
             params.append(value)
         elif op == "IN":
             placeholders = ", ".join("?" * len(value))
@@ -255,6 +307,27 @@ def build_where_clause(
     return "WHERE " + " AND ".join(parts), params
 
 
+# Murmur3Partitioner token ring (the Cassandra / ScyllaDB default).
+_TOKEN_MIN = -(2**63)
+_TOKEN_MAX = 2**63 - 1
+
+
+def token_ranges(num_ranges: int, start: int = _TOKEN_MIN, end: int = _TOKEN_MAX) -> list[tuple[int, int]]:
+    """Split the token interval ``(start, end]`` into *num_ranges* contiguous sub-ranges.
+
+    Each ``(lo, hi)`` pair is meant for ``TOKEN(pk) > lo AND TOKEN(pk) <= hi``;
+    the default bounds cover the whole ring.  Pass the last completed token
+    as *start* to resume a scan.
+    """
+    span = end - start
+    if span <= 0:
+        return []
+    num_ranges = max(1, min(num_ranges, span))
+    bounds = [start + span * i // num_ranges for i in range(num_ranges)]
+    bounds.append(end)
+    return [(bounds[i], bounds[i + 1]) for i in range(num_ranges)]
+
+
 # ---------------------------------------------------------------------------
 # Shared helpers for CQL template caching
 # ---------------------------------------------------------------------------
@@ -284,9 +357,6 @@ def _extract_where_params(where: list[tuple[str, str, Any]], params: list[Any])
             params.append(value)
 
 
-_select_cql_cache: dict[tuple, str] = {}
-
-
 def build_select(
     table: str,
     keyspace: str,
@@ -303,16 +373,18 @@ def build_select(
     ann_of: tuple[str, list[float]] | None = None,
 ) -> tuple[str, list[Any]]:
     # Build the cache key from the query *shape* (excludes actual values).
+    # LIMIT and PER PARTITION LIMIT are bound as markers, so only their
+    # presence is part of the shape.
     where_shape = _where_to_shape(where) if where else ()
     cache_key = (
         table,
         keyspace,
         tuple(columns) if columns else None,
         where_shape,
-        limit,
+        limit is not None,
         None if ann_of else (tuple(order_by) if order_by else None),
         allow_filtering,
-        per_partition_limit,
+        per_partition_limit is not None,
         distinct,
         tuple(group_by) if group_by else None,
         tuple(select_token) if select_token else None,
@@ -324,9 +396,14 @@ def build_select(
     if where:
         _extract_where_params(where, params)
 
-    # ANN vector param is appended after WHERE params.
+    # ANN vector param is appended after WHERE params, followed by the
+    # limits in clause order.
     if ann_of is not None:
         params.append(ann_of[1])
+    if per_partition_limit is not None:
+        params.append(per_partition_limit)
+    if limit is not None:
+        params.append(limit)
 
     cached_cql = _select_cql_cache.get(cache_key)
     if cached_cql is not None:
@@ -366,22 +443,18 @@ def build_select(
         cql += " ORDER BY " + ", ".join(order_parts)
 
     if per_partition_limit is not None:
-        cql += f" PER PARTITION LIMIT {per_partition_limit}"
+        cql += " PER PARTITION LIMIT ?"
 
     if limit is not None:
-        cql += f" LIMIT {limit}"
+        cql += " LIMIT ?"
 
     if allow_filtering:
         cql += " ALLOW FILTERING"
 
-    _select_cql_cache[cache_key] = cql
+    _select_cql_cache.put(cache_key, cql)
     return cql, params
 
 
-# Cache for COUNT CQL templates keyed by query shape.
-_count_cql_cache: dict[tuple, str] = {}
-
-
 def build_count(
     table: str,
     keyspace: str,
@@ -409,14 +482,10 @@ def build_count(
     if allow_filtering:
         cql += " ALLOW FILTERING"
 
-    _count_cql_cache[cache_key] = cql
+    _count_cql_cache.put(cache_key, cql)
     return cql, params
 
 
-# Cache for aggregate CQL templates keyed by query shape.
-_aggregate_cql_cache: dict[tuple, str] = {}
-
-
 def build_aggregate(
     table: str,
     keyspace: str,
@@ -446,7 +515,7 @@ def build_aggregate(
     if allow_filtering:
         cql += " ALLOW FILTERING"
 
-    _aggregate_cql_cache[cache_key] = cql
+    _aggregate_cql_cache.put(cache_key, cql)
     return cql, params
 
 
@@ -483,9 +552,6 @@ def build_insert(
     return cql, vals
 
 
-_insert_cql_cache: dict[tuple, str] = {}
-
-
 def build_insert_from_columns(
     table: str,
     keyspace: str,
@@ -503,7 +569,7 @@ def build_insert_from_columns(
         base_cql = f"INSERT INTO {keyspace}.{table} ({cols_str}) VALUES ({placeholders})"
         if if_not_exists:
             base_cql += " IF NOT EXISTS"
-        _insert_cql_cache[cache_key] = base_cql
+        _insert_cql_cache.put(cache_key, base_cql)
     cql = base_cql + _build_using_clause(ttl=ttl, timestamp=timestamp)
     return cql, values
 
@@ -550,7 +616,8 @@ def build_select_json(
             params.extend(where_params)
 
     if limit is not None:
-        cql += f" LIMIT {limit}"
+        cql += " LIMIT ?"
+        params.append(limit)
 
     if allow_filtering:
         cql += " ALLOW FILTERING"
@@ -604,6 +671,9 @@ def build_select_column_ttl(
     return cql, params
 
 
+_COLLECTION_OPS = frozenset({"add", "remove", "append", "prepend", "update", "put", "setindex"})
+
+
 def parse_update_kwargs(
     kwargs: dict[str, Any],
 ) -> tuple[dict[str, Any], list[tuple[str, str, Any]]]:
@@ -617,7 +687,7 @@ def parse_update_kwargs(
     For ``put`` and ``setindex`` the *value* must be a ``(key_or_index, val)``
     tuple which generates ``"col"[?] = ?``.
     """
-    collection_operators = {"add", "remove", "append", "prepend", "update", "put", "setindex"}
+    collection_operators = _COLLECTION_OPS
     set_data: dict[str, Any] = {}
     collection_ops: list[tuple[str, str, Any]] = []
     for key, value in kwargs.items():
@@ -630,9 +700,6 @@ def parse_update_kwargs(
     return set_data, collection_ops
 
 
-# Cache for UPDATE CQL templates keyed by query shape.
-_update_cql_cache: dict[tuple, str] = {}
-
 _IF_OPS: dict[str, str] = {"ne": "!=", "gt": ">", "lt": "<", "gte": ">=", "lte": "<=", "in": "IN"}
 
 
@@ -648,23 +715,26 @@ def _parse_if_conditions(
     parts: list[str] = []
     params: list[Any] = []
     for key, value in conditions.items():
-        pieces = key.rsplit("__", 1)
-        if len(pieces) == 2 and pieces[1] in _IF_OPS:
-            col, op_key = pieces
-            op = _IF_OPS[op_key]
-            if op == "IN":
-                placeholders = ", ".join("?" * len(value))
-                parts.append(f'"{col}" IN ({placeholders})')
-                params.extend(value)
-            else:
-                parts.append(f'"{col}" {op} ?')
-                params.append(value)
+        col, op = _split_if_key(key)
+        if op == "IN":
+            placeholders = ", ".join("?" * len(value))
+            parts.append(f'"{col}" IN ({placeholders})')
+            params.extend(value)
         else:
-            parts.append(f'"{key}" = ?')
+            parts.append(f'"{col}" {op} ?')
             params.append(value)
     return " IF " + " AND ".join(parts), params
 
 
+@functools.lru_cache(maxsize=1024)
+def _split_if_key(key: str) -> tuple[str, str]:
+    """Split an ``if_conditions`` key into ``(column, operator)``; memoized per key."""
+    pieces = key.rsplit("__", 1)
+    if len(pieces) == 2 and pieces[1] in _IF_OPS:
+        return pieces[0], _IF_OPS[pieces[1]]
+    return key, "="
+
+
 def build_update(
     table: str,
     keyspace: str,
@@ -737,14 +807,10 @@ def build_update(
         cond_clause, _ = _parse_if_conditions(if_conditions)
         cql += cond_clause
 
-    _update_cql_cache[cache_key] = cql
+    _update_cql_cache.put(cache_key, cql)
     return cql, params
 
 
-# Cache for DELETE CQL templates keyed by query shape.
-_delete_cql_cache: dict[tuple, str] = {}
-
-
 def build_delete(
     table: str,
     keyspace: str,
@@ -800,7 +866,7 @@ def build_delete(
         cql += cond_clause
         params.extend(cond_params)
 
-    _delete_cql_cache[cache_key] = cql
+    _delete_cql_cache.put(cache_key, cql)
     return cql, params
 
 
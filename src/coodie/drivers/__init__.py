@@ -3,7 +3,7 @@ from __future__ import annotations
 import ssl as _ssl
 from typing import Any
 
-from coodie.drivers.base import AbstractDriver
+from coodie.drivers.base import _DEFAULT_PREPARED_CACHE_SIZE, AbstractDriver
 from coodie.drivers.lazy import LazyDriver
 from coodie.exceptions import ConfigurationError
 
@@ -39,20 +39,23 @@ def init_coodie(
     lazy: bool = False,
     compression: str | bool | None = None,
     speculative_execution_policy: Any | None = None,
+    prepared_cache_size: int | None = _DEFAULT_PREPARED_CACHE_SIZE,
     **kwargs: Any,
 ) -> AbstractDriver:
     if driver_type == "acsylla":
         from coodie.drivers.acsylla import AcsyllaDriver
 
         if session is None and hosts is not None:
-            driver: AbstractDriver = AcsyllaDriver.connect_sync(hosts, keyspace=keyspace, **kwargs)
+            driver: AbstractDriver = AcsyllaDriver.connect_sync(
+                hosts, keyspace=keyspace, prepared_cache_size=prepared_cache_size, **kwargs
+            )
         elif session is None:
             raise ConfigurationError(
                 "AcsyllaDriver requires hosts or a pre-created acsylla session. "
                 "Pass hosts= or session=, or use init_coodie_async() with hosts."
             )
         else:
-            driver = AcsyllaDriver(session=session, default_keyspace=keyspace)
+            driver = AcsyllaDriver(session=session, default_keyspace=keyspace, prepared_cache_size=prepared_cache_size)
     elif driver_type == "python-rs":
         from coodie.drivers.python_rs import PythonRsDriver
 
@@ -72,18 +75,25 @@ def init_coodie(
             driver = PythonRsDriver.connect(
                 session_factory=_make_session,
                 default_keyspace=keyspace,
+                prepared_cache_size=prepared_cache_size,
             )
         elif session is None:
             raise ConfigurationError(
                 "PythonRsDriver requires a pre-created python-rs-driver session or hosts. Pass session= or hosts=."
             )
         else:
-            driver = PythonRsDriver(session=session, default_keyspace=keyspace)
+            driver = PythonRsDriver(session=session, default_keyspace=keyspace, prepared_cache_size=prepared_cache_size)
     elif driver_type in ("scylla", "cassandra"):
         if lazy and session is None:
             from coodie.drivers.lazy import LazyDriver
 
-            driver = LazyDriver(hosts=hosts, keyspace=keyspace, ssl_context=ssl_context, kwargs=kwargs)
+            driver = LazyDriver(
+                hosts=hosts,
+                keyspace=keyspace,
+                ssl_context=ssl_context,
+                kwargs=kwargs,
+                prepared_cache_size=prepared_cache_size,
+            )
         else:
             from coodie.drivers.cassandra import CassandraDriver
 
@@ -104,7 +114,9 @@ def init_coodie(
                 cluster = Cluster(hosts or ["127.0.0.1"], **kwargs)
                 session = cluster.connect(keyspace)
 
-            driver = CassandraDriver(session=session, default_keyspace=keyspace)
+            driver = CassandraDriver(
+                session=session, default_keyspace=keyspace, prepared_cache_size=prepared_cache_size
+            )
     else:
         raise ConfigurationError(
             f"Unknown driver_type={driver_type!r}. Supported: 'scylla', 'cassandra', 'acsylla', 'python-rs'."
@@ -126,6 +138,7 @@ async def init_coodie_async(
     ssl_cert: str | None = None,
     ssl_private_key: str | None = None,
     ssl_verify_flags: int | None = None,
+    prepared_cache_size: int | None = _DEFAULT_PREPARED_CACHE_SIZE,
     **kwargs: Any,
 ) -> AbstractDriver:
     if driver_type == "acsylla" and session is None and hosts is not None:
@@ -153,6 +166,7 @@ async def init_coodie_async(
         driver: AbstractDriver = AcsyllaDriver.connect(
             session_factory=_make_session,
             default_keyspace=keyspace,
+            prepared_cache_size=prepared_cache_size,
         )
         register_driver(name, driver, default=True)
         return driver
@@ -165,7 +179,7 @@ async def init_coodie_async(
                 "AcsyllaDriver requires a pre-created acsylla session. "
                 "Pass session= or use init_coodie_async() with hosts."
             )
-        driver = AcsyllaDriver(session=session, default_keyspace=keyspace)
+        driver = AcsyllaDriver(session=session, default_keyspace=keyspace, prepared_cache_size=prepared_cache_size)
         register_driver(name, driver, default=True)
         return driver
 
@@ -186,6 +200,7 @@ async def init_coodie_async(
         driver = PythonRsDriver.connect(
             session_factory=_make_python_rs_session,
             default_keyspace=keyspace,
+            prepared_cache_size=prepared_cache_size,
         )
         register_driver(name, driver, default=True)
         return driver
@@ -198,7 +213,7 @@ async def init_coodie_async(
                 "PythonRsDriver requires a pre-created python-rs-driver session. "
                 "Pass session= or use init_coodie_async() with hosts."
             )
-        driver = PythonRsDriver(session=session, default_keyspace=keyspace)
+        driver = PythonRsDriver(session=session, default_keyspace=keyspace, prepared_cache_size=prepared_cache_size)
         register_driver(name, driver, default=True)
         return driver
 
@@ -209,6 +224,7 @@ async def init_coodie_async(
         driver_type=driver_type,
         name=name,
         ssl_context=ssl_context,
+        prepared_cache_size=prepared_cache_size,
         **kwargs,
     )
 
@@ -3,10 +3,20 @@ from __future__ import annotations
 import asyncio
 import threading
 import warnings
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable
 from typing import Any
 
-from coodie.drivers.base import AbstractDriver, _is_ddl
+from coodie.cache import LRUCache
+from coodie.cql_builder import build_batch
+from coodie.drivers.base import (
+    _DEFAULT_CONCURRENCY,
+    _DEFAULT_PREPARED_CACHE_SIZE,
+    AbstractDriver,
+    _batch_kind,
+    _is_ddl,
+    _run_concurrent,
+)
+from coodie.results import ExecutionResult
 
 
 class AcsyllaDriver(AbstractDriver):
@@ -89,6 +99,7 @@ class AcsyllaDriver(AbstractDriver):
         self,
         session: Any,
         default_keyspace: str | None = None,
+        prepared_cache_size: int | None = _DEFAULT_PREPARED_CACHE_SIZE,
     ) -> None:
         try:
             import acsylla  # type: ignore[import-untyped]
@@ -97,7 +108,7 @@ class AcsyllaDriver(AbstractDriver):
         self._acsylla = acsylla
         self._session = session
         self._default_keyspace = default_keyspace
-        self._prepared: dict[str, Any] = {}
+        self._prepared = LRUCache(prepared_cache_size)
         self._last_paging_state: bytes | None = None
         self._known_tables: dict[str, frozenset[str]] = {}
         # Spin up a dedicated background event loop in a daemon thread for the
@@ -128,6 +139,7 @@ class AcsyllaDriver(AbstractDriver):
         cls,
         session_factory: Callable[[], Awaitable[Any]],
         default_keyspace: str | None = None,
+        prepared_cache_size: int | None = _DEFAULT_PREPARED_CACHE_SIZE,
     ) -> "AcsyllaDriver":
         """Create a driver whose acsylla session lives on the background loop.
 
@@ -171,7 +183,7 @@ class AcsyllaDriver(AbstractDriver):
         driver._acsylla = acsylla
         driver._session = session
         driver._default_keyspace = default_keyspace
-        driver._prepared = {}
+        driver._prepared = LRUCache(prepared_cache_size)
         driver._last_paging_state = None
         driver._known_tables = {}
         driver._bg_loop = bg_loop
@@ -184,6 +196,7 @@ class AcsyllaDriver(AbstractDriver):
         cls,
         hosts: list[str],
         keyspace: str | None = None,
+        prepared_cache_size: int | None = _DEFAULT_PREPARED_CACHE_SIZE,
         **kwargs: Any,
     ) -> "AcsyllaDriver":
         """Blocking factory that creates a sync-capable driver from *hosts*.
@@ -211,16 +224,18 @@ class AcsyllaDriver(AbstractDriver):
             cluster = acsylla.create_cluster(hosts, **kwargs)
             return await cluster.create_session(keyspace=keyspace)
 
-        return cls.connect(session_factory=_make_session, default_keyspace=keyspace)
+        return cls.connect(
+            session_factory=_make_session,
+            default_keyspace=keyspace,
+            prepared_cache_size=prepared_cache_size,
+        )
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
     async def _prepare(self, cql: str) -> Any:
-        if cql not in self._prepared:
-            self._prepared[cql] = await self._session.create_prepared(cql)
-        return self._prepared[cql]
+        return await self._prepared.get_or_create_async(cql, lambda: self._session.create_prepared(cql))
 
     @staticmethod
     def _rows_to_dicts(result: Any) -> list[dict[str, Any]]:
@@ -261,9 +276,28 @@ class AcsyllaDriver(AbstractDriver):
         fetch_size: int | None = None,
         paging_state: bytes | None = None,
     ) -> list[dict[str, Any]]:
+        rows, self._last_paging_state = await self._execute_paged_async_impl(
+            stmt,
+            params,
+            consistency=consistency,
+            timeout=timeout,
+            fetch_size=fetch_size,
+            paging_state=paging_state,
+        )
+        return rows
+
+    async def _execute_paged_async_impl(
+        self,
+        stmt: str,
+        params: list[Any],
+        consistency: str | None = None,
+        timeout: float | None = None,
+        fetch_size: int | None = None,
+        paging_state: bytes | None = None,
+    ) -> tuple[list[dict[str, Any]], bytes | None]:
         if not params and _is_ddl(stmt):
             result = await self._session.execute(self._cql_to_statement(stmt))
-            return self._rows_to_dicts(result)
+            return self._rows_to_dicts(result), None
         prepared = await self._prepare(stmt)
         bind_kwargs: dict[str, Any] = {}
         if consistency is not None:
@@ -276,12 +310,32 @@ class AcsyllaDriver(AbstractDriver):
         if paging_state is not None:
             statement.set_page_state(paging_state)
         result = await self._session.execute(statement)
-        if fetch_size is not None:
-            has_more = result.has_more_pages()
-            self._last_paging_state = result.page_state() if has_more else None
-        else:
-            self._last_paging_state = None
-        return self._rows_to_dicts(result)
+        next_state = None
+        if fetch_size is not None and result.has_more_pages():
+            next_state = result.page_state()
+        return self._rows_to_dicts(result), next_state
+
+    async def _execute_batch_async_impl(
+        self,
+        statements: Iterable[tuple[str, list[Any]]],
+        logged: bool = True,
+        batch_type: str | None = None,
+        timestamp: int | None = None,
+        consistency: str | None = None,
+        timeout: float | None = None,
+    ) -> list[dict[str, Any]]:
+        if timestamp is not None:
+            # Keep the batch-level USING TIMESTAMP of the CQL form.
+            cql, params = build_batch(list(statements), logged=logged, batch_type=batch_type, timestamp=timestamp)
+            return await self._execute_async_impl(cql, params, consistency=consistency, timeout=timeout)
+        create_batch = getattr(self._acsylla, f"create_batch_{_batch_kind(logged, batch_type).lower()}")
+        batch = create_batch(timeout=timeout) if timeout is not None else create_batch()
+        for stmt, params in statements:
+            prepared = await self._prepare(stmt)
+            batch.add_statement(prepared.bind(params))
+        if consistency is not None:
+            batch.set_consistency(consistency)
+        return self._rows_to_dicts(await self._session.execute_batch(batch))
 
     async def _get_existing_columns_async(self, table: str, keyspace: str) -> set[str]:
         """Introspect the existing column names via system_schema."""
@@ -425,6 +479,54 @@ class AcsyllaDriver(AbstractDriver):
             return await self._run_on_bg_loop(coro)
         return await coro
 
+    async def execute_paged_async(
+        self,
+        stmt: str,
+        params: list[Any],
+        consistency: str | None = None,
+        timeout: float | None = None,
+        fetch_size: int | None = None,
+        paging_state: bytes | None = None,
+    ) -> tuple[list[dict[str, Any]], bytes | None]:
+        coro = self._execute_paged_async_impl(
+            stmt,
+            params,
+            consistency=consistency,
+            timeout=timeout,
+            fetch_size=fetch_size,
+            paging_state=paging_state,
+        )
+        if self._bridge_to_bg_loop:
+            return await self._run_on_bg_loop(coro)
+        return await coro
+
+    async def execute_concurrent_async(
+        self,
+        statements: Iterable[tuple[str, list[Any]]],
+        concurrency: int = _DEFAULT_CONCURRENCY,
+        consistency: str | None = None,
+        timeout: float | None = None,
+    ) -> list[ExecutionResult]:
+        coro = _run_concurrent(self._execute_async_impl, statements, concurrency, consistency, timeout)
+        if self._bridge_to_bg_loop:
+            return await self._run_on_bg_loop(coro)
+        return await coro
+
+    async def execute_batch_async(
+        self,
+        statements: Iterable[tuple[str, list[Any]]],
+        logged: bool = True,
+        batch_type: str | None = None,
+        timestamp: int | None = None,
+        consistency: str | None = None,
+        timeout: float | None = None,
+    ) -> list[dict[str, Any]]:
+        """Execute *statements* as one native acsylla batch of prepared statements."""
+        coro = self._execute_batch_async_impl(statements, logged, batch_type, timestamp, consistency, timeout)
+        if self._bridge_to_bg_loop:
+            return await self._run_on_bg_loop(coro)
+        return await coro
+
     async def sync_table_async(
         self,
         table: str,
@@ -482,6 +584,54 @@ class AcsyllaDriver(AbstractDriver):
             self._bg_loop,
         ).result()
 
+    def execute_paged(
+        self,
+        stmt: str,
+        params: list[Any],
+        consistency: str | None = None,
+        timeout: float | None = None,
+        fetch_size: int | None = None,
+        paging_state: bytes | None = None,
+    ) -> tuple[list[dict[str, Any]], bytes | None]:
+        return asyncio.run_coroutine_threadsafe(
+            self._execute_paged_async_impl(
+                stmt,
+                params,
+                consistency=consistency,
+                timeout=timeout,
+                fetch_size=fetch_size,
+                paging_state=paging_state,
+            ),
+            self._bg_loop,
+        ).result()
+
+    def execute_concurrent(
+        self,
+        statements: Iterable[tuple[str, list[Any]]],
+        concurrency: int = _DEFAULT_CONCURRENCY,
+        consistency: str | None = None,
+        timeout: float | None = None,
+    ) -> list[ExecutionResult]:
+        """Pipeline *statements* on the background loop with a bounded in-flight window."""
+        return asyncio.run_coroutine_threadsafe(
+            _run_concurrent(self._execute_async_impl, statements, concurrency, consistency, timeout),
+            self._bg_loop,
+        ).result()
+
+    def execute_batch(
+        self,
+        statements: Iterable[tuple[str, list[Any]]],
+        logged: bool = True,
+        batch_type: str | None = None,
+        timestamp: int | None = None,
+        consistency: str | None = None,
+        timeout: float | None = None,
+    ) -> list[dict[str, Any]]:
+        return asyncio.run_coroutine_threadsafe(
+            self._execute_batch_async_impl(statements, logged, batch_type, timestamp, consistency, timeout),
+            self._bg_loop,
+        ).result()
+
     def sync_table(
         self,
         table: str,
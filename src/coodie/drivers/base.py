@@ -1,16 +1,85 @@
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable, Iterable
 from typing import Any
 
+from coodie.cache import CacheInfo
+from coodie.cql_builder import build_batch
+from coodie.results import ExecutionResult
+
 _DDL_PREFIXES = ("CREATE ", "DROP ", "ALTER ", "TRUNCATE ")
 
+# Default number of in-flight requests for the bulk execution helpers.
+_DEFAULT_CONCURRENCY = 100
+
+# Default number of prepared statements each driver keeps before evicting
+# the least recently used one.
+_DEFAULT_PREPARED_CACHE_SIZE = 1000
+
+
+def _dicts_to_tuples(rows: list[dict[str, Any]]) -> tuple[list[str], list[tuple[Any, ...]]]:
+    """Split dict *rows* into ``(columns, row_tuples)``.
+
+    Columns are taken in first-seen order across all rows; a row missing a
+    column gets ``None`` in its slot.
+    """
+    if not rows:
+        return [], []
+    columns = list(rows[0])
+    width = len(columns)
+    if all(len(row) == width for row in rows):
+        try:
+            return columns, [tuple([row[c] for c in columns]) for row in rows]
+        except KeyError:
+            pass
+    columns = list(dict.fromkeys(c for row in rows for c in row))
+    return columns, [tuple([row.get(c) for c in columns]) for row in rows]
+
+
+def _batch_kind(logged: bool, batch_type: str | None) -> str:
+    """Return ``"LOGGED"``, ``"UNLOGGED"`` or ``"COUNTER"`` for a batch request."""
+    if batch_type is not None:
+        return batch_type.upper()
+    return "LOGGED" if logged else "UNLOGGED"
+
 
 def _is_ddl(cql: str) -> bool:
     """Return ``True`` if *cql* is a DDL statement (cannot be prepared)."""
     return cql.lstrip().upper().startswith(_DDL_PREFIXES)
 
 
+async def _run_concurrent(
+    execute: Callable[..., Awaitable[list[dict[str, Any]]]],
+    statements: Iterable[tuple[str, list[Any]]],
+    concurrency: int,
+    consistency: str | None = None,
+    timeout: float | None = None,
+) -> list[ExecutionResult]:
+    """Run *statements* through the coroutine function *execute* with a bounded window.
+
+    At most *concurrency* worker coroutines pull from a shared iterator, so
+    only that many requests are ever in flight and no per-statement task is
+    created up front.  Results are returned in input order.
+    """
+    items = list(statements)
+    results: list[ExecutionResult] = [ExecutionResult(success=False)] * len(items)
+    pending = iter(enumerate(items))
+
+    async def worker() -> None:
+        for index, (stmt, params) in pending:
+            try:
+                rows = await execute(stmt, params, consistency=consistency, timeout=timeout)
+            except Exception as exc:  # noqa: BLE001
+                results[index] = ExecutionResult(success=False, error=exc)
+            else:
+                results[index] = ExecutionResult(success=True, rows=rows)
+
+    await asyncio.gather(*(worker() for _ in range(min(max(1, concurrency), len(items)))))
+    return results
+
+
 class AbstractDriver(ABC):
     """Abstract base class for coodie execution backends."""
 
@@ -114,6 +183,282 @@ class AbstractDriver(ABC):
             return next(iter(rows[0].values()))
         return None
 
+    # ------------------------------------------------------------------
+    # Paged execution (default implementations; drivers may override)
+    # ------------------------------------------------------------------
+
+    def execute_paged(
+        self,
+        stmt: str,
+        params: list[Any],
+        consistency: str | None = None,
+        timeout: float | None = None,
+        fetch_size: int | None = None,
+        paging_state: bytes | None = None,
+    ) -> tuple[list[dict[str, Any]], bytes | None]:
+        """Fetch one page of *stmt* and return ``(rows, paging_state)``.
+
+        The returned *paging_state* belongs to this call (``None`` on the
+        last page), so concurrent paged queries sharing a driver never see
+        each other's cursor.
+
+        The default implementation reads ``_last_paging_state`` after
+        :meth:`execute` and is only safe when the driver is not shared;
+        the built-in drivers override it.
+        """
+        rows = self.execute(
+            stmt,
+            params,
+            consistency=consistency,
+            timeout=timeout,
+            fetch_size=fetch_size,
+            paging_state=paging_state,
+        )
+        return rows, getattr(self, "_last_paging_state", None)
+
+    async def execute_paged_async(
+        self,
+        stmt: str,
+        params: list[Any],
+        consistency: str | None = None,
+        timeout: float | None = None,
+        fetch_size: int | None = None,
+        paging_state: bytes | None = None,
+    ) -> tuple[list[dict[str, Any]], bytes | None]:
+        """Async version of :meth:`execute_paged`."""
+        rows = await self.execute_async(
+            stmt,
+            params,
+            consistency=consistency,
+            timeout=timeout,
+            fetch_size=fetch_size,
+            paging_state=paging_state,
+        )
+        return rows, getattr(self, "_last_paging_state", None)
+
+    # ------------------------------------------------------------------
+    # Tuple-row execution (default implementations; drivers may override)
+    # ------------------------------------------------------------------
+
+    def execute_tuples(
+        self,
+        stmt: str,
+        params: list[Any],
+        consistency: str | None = None,
+        timeout: float | None = None,
+        fetch_size: int | None = None,
+        paging_state: bytes | None = None,
+    ) -> tuple[list[str], list[tuple[Any, ...]]]:
+        """Execute *stmt* and return ``(columns, rows)`` with one tuple per row.
+
+        The column names are returned once instead of being repeated as the
+        keys of a dict per row, which is what the QuerySet hydration path
+        consumes.  The default implementation converts the rows of
+        :meth:`execute`; drivers that can skip building dicts override it.
+        """
+        rows = self.execute(
+            stmt,
+            params,
+            consistency=consistency,
+            timeout=timeout,
+            fetch_size=fetch_size,
+            paging_state=paging_state,
+        )
+        return _dicts_to_tuples(rows)
+
+    async def execute_tuples_async(
+        self,
+        stmt: str,
+        params: list[Any],
+        consistency: str | None = None,
+        timeout: float | None = None,
+        fetch_size: int | None = None,
+        paging_state: bytes | None = None,
+    ) -> tuple[list[str], list[tuple[Any, ...]]]:
+        """Async version of :meth:`execute_tuples`."""
+        rows = await self.execute_async(
+            stmt,
+            params,
+            consistency=consistency,
+            timeout=timeout,
+            fetch_size=fetch_size,
+            paging_state=paging_state,
+        )
+        return _dicts_to_tuples(rows)
+
+    def execute_paged_tuples(
+        self,
+        stmt: str,
+        params: list[Any],
+        consistency: str | None = None,
+        timeout: float | None = None,
+        fetch_size: int | None = None,
+        paging_state: bytes | None = None,
+    ) -> tuple[list[str], list[tuple[Any, ...]], bytes | None]:
+        """Tuple-row version of :meth:`execute_paged`: ``(columns, rows, paging_state)``."""
+        rows, next_state = self.execute_paged(
+            stmt,
+            params,
+            consistency=consistency,
+            timeout=timeout,
+            fetch_size=fetch_size,
+            paging_state=paging_state,
+        )
+        return (*_dicts_to_tuples(rows), next_state)
+
+    async def execute_paged_tuples_async(
+        self,
+        stmt: str,
+        params: list[Any],
+        consistency: str | None = None,
+        timeout: float | None = None,
+        fetch_size: int | None = None,
+        paging_state: bytes | None = None,
+    ) -> tuple[list[str], list[tuple[Any, ...]], bytes | None]:
+        """Async version of :meth:`execute_paged_tuples`."""
+        rows, next_state = await self.execute_paged_async(
+            stmt,
+            params,
+            consistency=consistency,
+            timeout=timeout,
+            fetch_size=fetch_size,
+            paging_state=paging_state,
+        )
+        return (*_dicts_to_tuples(rows), next_state)
+
+    # ------------------------------------------------------------------
+    # Prepared-statement cache
+    # ------------------------------------------------------------------
+
+    def prepared_cache_info(self) -> CacheInfo:
+        """Return hit/miss/eviction counters of the prepared-statement cache.
+
+        Drivers that do not cache prepared statements report an empty cache.
+        """
+        cache = getattr(self, "_prepared", None)
+        if cache is None:
+            return CacheInfo(hits=0, misses=0, evictions=0, maxsize=0, currsize=0)
+        return cache.info()
+
+    # ------------------------------------------------------------------
+    # Bulk execution (default implementations; drivers may override)
+    # ------------------------------------------------------------------
+
+    def execute_concurrent(
+        self,
+        statements: Iterable[tuple[str, list[Any]]],
+        concurrency: int = _DEFAULT_CONCURRENCY,
+        consistency: str | None = None,
+        timeout: float | None = None,
+    ) -> list[ExecutionResult]:
+        """Execute many ``(stmt, params)`` pairs, keeping up to *concurrency* in flight.
+
+        Returns one :class:`~coodie.results.ExecutionResult` per statement,
+        in input order.  A failing statement is reported in its result and
+        does not stop the remaining ones.
+
+        The default implementation runs the statements one after another;
+        drivers with a native pipelining API override it.
+        """
+        results: list[ExecutionResult] = []
+        for stmt, params in statements:
+            try:
+                rows = self.execute(stmt, params, consistency=consistency, timeout=timeout)
+            except Exception as exc:  # noqa: BLE001
+                results.append(ExecutionResult(success=False, error=exc))
+            else:
+                results.append(ExecutionResult(success=True, rows=rows))
+        return results
+
+    async def execute_concurrent_async(
+        self,
+        statements: Iterable[tuple[str, list[Any]]],
+        concurrency: int = _DEFAULT_CONCURRENCY,
+        consistency: str | None = None,
+        timeout: float | None = None,
+    ) -> list[ExecutionResult]:
+        """Async version of :meth:`execute_concurrent`.
+
+        The default implementation keeps at most *concurrency*
+        :meth:`execute_async` calls in flight.
+        """
+        return await _run_concurrent(self.execute_async, statements, concurrency, consistency, timeout)
+
+    def execute_many(
+        self,
+        stmt: str,
+        params_seq: Iterable[list[Any]],
+        concurrency: int = _DEFAULT_CONCURRENCY,
+        consistency: str | None = None,
+        timeout: float | None = None,
+    ) -> list[ExecutionResult]:
+        """Execute the same *stmt* once per parameter list in *params_seq*.
+
+        Shorthand for :meth:`execute_concurrent`; the statement is prepared
+        once and reused for every row.
+        """
+        return self.execute_concurrent(
+            ((stmt, params) for params in params_seq),
+            concurrency=concurrency,
+            consistency=consistency,
+            timeout=timeout,
+        )
+
+    async def execute_many_async(
+        self,
+        stmt: str,
+        params_seq: Iterable[list[Any]],
+        concurrency: int = _DEFAULT_CONCURRENCY,
+        consistency: str | None = None,
+        timeout: float | None = None,
+    ) -> list[ExecutionResult]:
+        """Async version of :meth:`execute_many`."""
+        return await self.execute_concurrent_async(
+            ((stmt, params) for params in params_seq),
+            concurrency=concurrency,
+            consistency=consistency,
+            timeout=timeout,
+        )
+
+    # ------------------------------------------------------------------
+    # Batches (default implementations; drivers may override)
+    # ------------------------------------------------------------------
+
+    def execute_batch(
+        self,
+        statements: Iterable[tuple[str, list[Any]]],
+        logged: bool = True,
+        batch_type: str | None = None,
+        timestamp: int | None = None,
+        consistency: str | None = None,
+        timeout: float | None = None,
+    ) -> list[dict[str, Any]]:
+        """Execute ``(stmt, params)`` pairs as one CQL batch; return its rows.
+
+        *batch_type* (``"LOGGED"``, ``"UNLOGGED"`` or ``"COUNTER"``)
+        overrides *logged*.  Rows are only returned by conditional batches.
+
+        The default implementation joins the statements into one
+        ``BEGIN BATCH ... APPLY BATCH`` string, which is prepared anew for
+        every distinct batch composition; drivers with a native batch API
+        override it to reuse the prepared statement of each member.
+        """
+        cql, params = build_batch(list(statements), logged=logged, batch_type=batch_type, timestamp=timestamp)
+        return self.execute(cql, params, consistency=consistency, timeout=timeout)
+
+    async def execute_batch_async(
+        self,
+        statements: Iterable[tuple[str, list[Any]]],
+        logged: bool = True,
+        batch_type: str | None = None,
+        timestamp: int | None = None,
+        consistency: str | None = None,
+        timeout: float | None = None,
+    ) -> list[dict[str, Any]]:
+        """Async version of :meth:`execute_batch`."""
+        cql, params = build_batch(list(statements), logged=logged, batch_type=batch_type, timestamp=timestamp)
+        return await self.execute_async(cql, params, consistency=consistency, timeout=timeout)
+
     @abstractmethod
     async def close_async(self) -> None:
         """Release async resources."""
@@ -2,13 +2,93 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import threading
 import warnings
+import weakref
+from collections.abc import Iterable
 from typing import Any
 
-from coodie.drivers.base import AbstractDriver, _is_ddl
+from coodie.cache import LRUCache
+from coodie.drivers.base import (
+    _DEFAULT_CONCURRENCY,
+    _DEFAULT_PREPARED_CACHE_SIZE,
+    AbstractDriver,
+    _batch_kind,
+    _dicts_to_tuples,
+    _is_ddl,
+)
+from coodie.results import ExecutionResult
 
 logger = logging.getLogger("coodie")
 
+# Set while the current thread submits a request whose rows should stay
+# tuples; see _on_request_init().  The flag is per thread, not per driver:
+# it is only set around one execute_async() call on this thread.
+_tuple_rows = threading.local()
+# Sessions _on_request_init() is registered on, so drivers sharing a session
+# add it once.
+_listening_sessions: weakref.WeakSet[Any] = weakref.WeakSet()
+_listening_lock = threading.Lock()
+
+
+def _on_request_init(response_future: Any, tuple_factory: Any) -> None:
+    # Request-init listeners run synchronously inside execute_async(),
+    # before the request is sent, so the row factory is swapped for this
+    # one request only; the session keeps dict_factory for everything else.
+    if getattr(_tuple_rows, "active", False):
+        response_future.row_factory = tuple_factory
+
+
+class _PagedResponse:
+    """Drive a cassandra-driver ``ResponseFuture`` page by page from asyncio.
+
+    The driver re-invokes the callbacks registered with ``add_callbacks`` for
+    every page requested through ``start_fetching_next_page()``, so a single
+    callback pair is registered up front and each page resolves whichever
+    asyncio future is current when it arrives.  The paging state is read in
+    the callback, on the driver's event thread, before the next page can
+    replace it.
+    """
+
+    __slots__ = ("_loop", "_response", "_waiter")
+
+    def __init__(self, response: Any, loop: asyncio.AbstractEventLoop) -> None:
+        self._response = response
+        self._loop = loop
+        self._waiter: asyncio.Future[tuple[Any, bytes | None]] = loop.create_future()
+        response.add_callbacks(self._on_page, self._on_error)
+
+    def _on_page(self, rows: Any) -> None:
+        paging_state = getattr(self._response, "_paging_state", None)
+        self._loop.call_soon_threadsafe(self._resolve, self._waiter, (rows, paging_state), None)
+
+    def _on_error(self, exc: BaseException) -> None:
+        self._loop.call_soon_threadsafe(self._resolve, self._waiter, None, exc)
+
+    @staticmethod
+    def _resolve(waiter: asyncio.Future[Any], result: Any, exc: BaseException | None) -> None:
+        if waiter.done():  # the awaiting coroutine was cancelled
+            return
+        if exc is not None:
+            waiter.set_exception(exc)
+        else:
+            waiter.set_result(result)
+
+    @property
+    def column_names(self) -> Any:
+        """Column names of the result, known once the first page has arrived."""
+        return getattr(self._response, "_col_names", None)
+
+    async def page(self) -> tuple[Any, bytes | None]:
+        """Wait for the current page; return ``(rows, paging_state)``."""
+        return await self._waiter
+
+    async def next_page(self) -> tuple[Any, bytes | None]:
+        """Request the next page without blocking a thread and wait for it."""
+        self._waiter = self._loop.create_future()
+        self._response.start_fetching_next_page()
+        return await self._waiter
+
 
 class CassandraDriver(AbstractDriver):
     """Driver backed by cassandra-driver / scylla-driver."""
@@ -19,16 +99,21 @@ class CassandraDriver(AbstractDriver):
         self,
         session: Any,
         default_keyspace: str | None = None,
+        prepared_cache_size: int | None = _DEFAULT_PREPARED_CACHE_SIZE,
     ) -> None:
         self._session = session
         self._default_keyspace = default_keyspace
-        self._prepared: dict[str, Any] = {}
+        self._prepared = LRUCache(prepared_cache_size)
         self._last_paging_state: bytes | None = None
         self._known_tables: dict[str, frozenset[str]] = {}
         try:
-            from cassandra.query import dict_factory  # type: ignore[import-untyped]
+            from cassandra.query import dict_factory, tuple_factory  # type: ignore[import-untyped]
 
             session.row_factory = dict_factory
+            with _listening_lock:
+                if session not in _listening_sessions:
+                    session.add_request_init_listener(_on_request_init, tuple_factory)
+                    _listening_sessions.add(session)
         except ImportError:
             logger.warning(
                 "Could not import cassandra.query.dict_factory; "
@@ -39,10 +124,52 @@ class CassandraDriver(AbstractDriver):
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _submit_tuple_rows(self, bound: Any, **execute_kwargs: Any) -> Any:
+        """``session.execute_async(bound)`` with rows decoded as plain tuples."""
+        _tuple_rows.active = True
+        try:
+            return self._session.execute_async(bound, **execute_kwargs)
+        finally:
+            _tuple_rows.active = False
+
     def _prepare(self, cql: str) -> Any:
-        if cql not in self._prepared:
-            self._prepared[cql] = self._session.prepare(cql)
-        return self._prepared[cql]
+        return self._prepared.get_or_create(cql, lambda: self._session.prepare(cql))
+
+    def _bind(
+        self,
+        cql: str,
+        params: list[Any],
+        consistency: str | None = None,
+        fetch_size: int | None = None,
+    ) -> Any:
+        """Prepare *cql* (cached) and return a bound statement for *params*."""
+        bound = self._prepare(cql).bind(params)
+        if consistency is not None:
+            from cassandra import ConsistencyLevel  # type: ignore[import-untyped]
+
+            bound.consistency_level = getattr(ConsistencyLevel, consistency)
+        if fetch_size is not None:
+            bound.fetch_size = fetch_size
+        return bound
+
+    def _batch(
+        self,
+        statements: Iterable[tuple[str, list[Any]]],
+        logged: bool,
+        batch_type: str | None,
+        consistency: str | None,
+    ) -> Any:
+        """Build a ``BatchStatement`` from the cached prepared statement of each member."""
+        from cassandra.query import BatchStatement, BatchType
+
+        batch = BatchStatement(batch_type=getattr(BatchType, _batch_kind(logged, batch_type)))
+        for stmt, params in statements:
+            batch.add(self._bind(stmt, params))
+        if consistency is not None:
+            from cassandra import ConsistencyLevel
+
+            batch.consistency_level = getattr(ConsistencyLevel, consistency)
+        return batch
 
     @staticmethod
     def _rows_to_dicts(result_set: Any) -> list[dict[str, Any]]:
@@ -59,6 +186,18 @@ class CassandraDriver(AbstractDriver):
         else:
             return [{k: v for k, v in r.__dict__.items() if not k.startswith("_")} for r in rows]
 
+    @staticmethod
+    def _rows_to_tuples(rows: Any, column_names: Any) -> tuple[list[str], list[tuple[Any, ...]]]:
+        rows = list(rows) if rows is not None else []
+        if not rows:
+            return [], []
+        sample = rows[0]
+        if isinstance(sample, dict):
+            return _dicts_to_tuples(rows)
+        if hasattr(sample, "_fields"):
+            return list(sample._fields), rows
+        return list(column_names), rows
+
     # ------------------------------------------------------------------
     # Synchronous interface
     # ------------------------------------------------------------------
@@ -76,14 +215,17 @@ class CassandraDriver(AbstractDriver):
             result = self._session.execute(stmt)
             self._last_paging_state = None
             return self._rows_to_dicts(result)
-        prepared = self._prepare(stmt)
-        bound = prepared.bind(params)
-        if consistency is not None:
-            from cassandra import ConsistencyLevel  # type: ignore[import-untyped]
-
-            bound.consistency_level = getattr(ConsistencyLevel, consistency)
         if fetch_size is not None:
-            bound.fetch_size = fetch_size
+            rows, self._last_paging_state = self.execute_paged(
+                stmt,
+                params,
+                consistency=consistency,
+                timeout=timeout,
+                fetch_size=fetch_size,
+                paging_state=paging_state,
+            )
+            return rows
+        bound = self._bind(stmt, params, consistency=consistency)
         execute_kwargs: dict[str, Any] = {}
         if timeout is not None:
             execute_kwargs["timeout"] = timeout
@@ -91,10 +233,77 @@ class CassandraDriver(AbstractDriver):
             execute_kwargs["paging_state"] = paging_state
         result = self._session.execute(bound, **execute_kwargs)
         self._last_paging_state = getattr(result, "paging_state", None)
-        if fetch_size is not None:
-            return self._rows_to_dicts(result.current_rows)
         return self._rows_to_dicts(result)
 
+    def execute_paged(
+        self,
+        stmt: str,
+        params: list[Any],
+        consistency: str | None = None,
+        timeout: float | None = None,
+        fetch_size: int | None = None,
+        paging_state: bytes | None = None,
+    ) -> tuple[list[dict[str, Any]], bytes | None]:
+        bound = self._bind(stmt, params, consistency=consistency, fetch_size=fetch_size)
+        execute_kwargs: dict[str, Any] = {}
+        if timeout is not None:
+            execute_kwargs["timeout"] = timeout
+        if paging_state is not None:
+            execute_kwargs["paging_state"] = paging_state
+        result = self._session.execute(bound, **execute_kwargs)
+        return self._rows_to_dicts(result.current_rows), result.paging_state
+
+    def execute_tuples(
+        self,
+        stmt: str,
+        params: list[Any],
+        consistency: str | None = None,
+        timeout: float | None = None,
+        fetch_size: int | None = None,
+        paging_state: bytes | None = None,
+    ) -> tuple[list[str], list[tuple[Any, ...]]]:
+        """Execute *stmt* with the driver's rows kept as tuples (no per-row dict)."""
+        if not params and _is_ddl(stmt):
+            return _dicts_to_tuples(self.execute(stmt, params))
+        if fetch_size is not None:
+            columns, rows, self._last_paging_state = self.execute_paged_tuples(
+                stmt,
+                params,
+                consistency=consistency,
+                timeout=timeout,
+                fetch_size=fetch_size,
+                paging_state=paging_state,
+            )
+            return columns, rows
+        bound = self._bind(stmt, params, consistency=consistency)
+        execute_kwargs: dict[str, Any] = {}
+        if timeout is not None:
+            execute_kwargs["timeout"] = timeout
+        if paging_state is not None:
+            execute_kwargs["paging_state"] = paging_state
+        result = self._submit_tuple_rows(bound, **execute_kwargs).result()
+        self._last_paging_state = getattr(result, "paging_state", None)
+        return self._rows_to_tuples(result, getattr(result, "column_names", None))
+
+    def execute_paged_tuples(
+        self,
+        stmt: str,
+        params: list[Any],
+        consistency: str | None = None,
+        timeout: float | None = None,
+        fetch_size: int | None = None,
+        paging_state: bytes | None = None,
+    ) -> tuple[list[str], list[tuple[Any, ...]], bytes | None]:
+        bound = self._bind(stmt, params, consistency=consistency, fetch_size=fetch_size)
+        execute_kwargs: dict[str, Any] = {}
+        if timeout is not None:
+            execute_kwargs["timeout"] = timeout
+        if paging_state is not None:
+            execute_kwargs["paging_state"] = paging_state
+        result = self._submit_tuple_rows(bound, **execute_kwargs).result()
+        columns, rows = self._rows_to_tuples(result.current_rows, result.column_names)
+        return columns, rows, result.paging_state
+
     def sync_table(
         self,
         table: str,
@@ -279,12 +488,7 @@ class CassandraDriver(AbstractDriver):
         consistency: str | None = None,
         timeout: float | None = None,
     ) -> Any:
-        prepared = self._prepare(stmt)
-        bound = prepared.bind(params)
-        if consistency is not None:
-            from cassandra import ConsistencyLevel  # type: ignore[import-untyped]
-
-            bound.consistency_level = getattr(ConsistencyLevel, consistency)
+        bound = self._bind(stmt, params, consistency=consistency)
         execute_kwargs: dict[str, Any] = {}
         if timeout is not None:
             execute_kwargs["timeout"] = timeout
@@ -305,12 +509,7 @@ class CassandraDriver(AbstractDriver):
         consistency: str | None = None,
         timeout: float | None = None,
     ) -> Any:
-        prepared = self._prepare(stmt)
-        bound = prepared.bind(params)
-        if consistency is not None:
-            from cassandra import ConsistencyLevel  # type: ignore[import-untyped]
-
-            bound.consistency_level = getattr(ConsistencyLevel, consistency)
+        bound = self._bind(stmt, params, consistency=consistency)
         execute_kwargs: dict[str, Any] = {}
         if timeout is not None:
             execute_kwargs["timeout"] = timeout
@@ -332,7 +531,95 @@ class CassandraDriver(AbstractDriver):
             return next(iter(row._asdict().values()))
         return row[0]
 
+    def execute_concurrent(
+        self,
+        statements: Iterable[tuple[str, list[Any]]],
+        concurrency: int = _DEFAULT_CONCURRENCY,
+        consistency: str | None = None,
+        timeout: float | None = None,
+    ) -> list[ExecutionResult]:
+        """Pipeline *statements* over ``session.execute_async``.
+
+        A semaphore bounds the in-flight window to *concurrency* requests;
+        completion callbacks (run on the driver's IO threads) record each
+        result and free a slot for the next submission.
+        """
+        items = list(statements)
+        if not items:
+            return []
+        results: list[ExecutionResult] = [ExecutionResult(success=False)] * len(items)
+        window = threading.Semaphore(max(1, concurrency))
+        remaining = [len(items)]
+        lock = threading.Lock()
+        all_done = threading.Event()
+
+        def finish(index: int, result: ExecutionResult) -> None:
+            results[index] = result
+            window.release()
+            with lock:
+                remaining[0] -= 1
+                if remaining[0] == 0:
+                    all_done.set()
+
+        def on_success(rows: Any, index: int) -> None:
+            # Runs on a driver IO thread: an error here must still free the slot.
+            try:
+                result = ExecutionResult(success=True, rows=self._rows_to_dicts(rows))
+            except Exception as exc:  # noqa: BLE001
+                result = ExecutionResult(success=False, error=exc)
+            finish(index, result)
+
+        def on_error(exc: BaseException, index: int) -> None:
+            finish(index, ExecutionResult(success=False, error=exc))
+
+        execute_kwargs: dict[str, Any] = {}
+        if timeout is not None:
+            execute_kwargs["timeout"] = timeout
+        for index, (stmt, params) in enumerate(items):
+            window.acquire()
+            try:
+                if not params and _is_ddl(stmt):
+                    future = self._session.execute_async(stmt, **execute_kwargs)
+                else:
+                    bound = self._bind(stmt, params, consistency=consistency)
+                    future = self._session.execute_async(bound, **execute_kwargs)
+            except Exception as exc:  # noqa: BLE001
+                on_error(exc, index)
+                continue
+            future.add_callbacks(on_success, on_error, callback_args=(index,), errback_args=(index,))
+        all_done.wait()
+        return results
+
+    def execute_batch(
+        self,
+        statements: Iterable[tuple[str, list[Any]]],
+        logged: bool = True,
+        batch_type: str | None = None,
+        timestamp: int | None = None,
+        consistency: str | None = None,
+        timeout: float | None = None,
+    ) -> list[dict[str, Any]]:
+        """Execute *statements* as one native ``BatchStatement``.
+
+        Each member reuses its individually prepared statement.  The
+        driver has no per-request write timestamp, so a batch with
+        *timestamp* falls back to a ``BEGIN BATCH USING TIMESTAMP`` string.
+        """
+        if timestamp is not None:
+            return super().execute_batch(statements, logged, batch_type, timestamp, consistency, timeout)
+        batch = self._batch(statements, logged, batch_type, consistency)
+        execute_kwargs: dict[str, Any] = {}
+        if timeout is not None:
+            execute_kwargs["timeout"] = timeout
+        return self._rows_to_dicts(self._session.execute(batch, **execute_kwargs))
+
     def close(self) -> None:
+        with _listening_lock:
+            if self._session in _listening_sessions:
+                from cassandra.query import tuple_factory  # type: ignore[import-untyped]
+
+                self._session.remove_request_init_listener(_on_request_init, tuple_factory)
+                _listening_sessions.discard(self._session)
         self._session.cluster.shutdown()
 
     # ------------------------------------------------------------------
@@ -363,36 +650,125 @@ class CassandraDriver(AbstractDriver):
         paging_state: bytes | None = None,
     ) -> list[dict[str, Any]]:
         if fetch_size is not None:
-            # Paginated queries: delegate to the sync execute() via
-            # run_in_executor.  The cassandra-driver's async callback
-            # mechanism delivers a plain list to add_callbacks, not a
-            # ResultSet, so current_rows / paging_state are unavailable.
-            # The sync path (session.execute) returns a proper ResultSet.
-            loop = asyncio.get_running_loop()
-            return await loop.run_in_executor(
-                None,
-                lambda: self.execute(
-                    stmt,
-                    params,
-                    consistency=consistency,
-                    timeout=timeout,
-                    fetch_size=fetch_size,
-                    paging_state=paging_state,
-                ),
+            rows, self._last_paging_state = await self.execute_paged_async(
+                stmt,
+                params,
+                consistency=consistency,
+                timeout=timeout,
+                fetch_size=fetch_size,
+                paging_state=paging_state,
             )
-        prepared = self._prepare(stmt)
-        bound = prepared.bind(params)
-        if consistency is not None:
-            from cassandra import ConsistencyLevel  # type: ignore[import-untyped]
+            return rows
+        bound = self._bind(stmt, params, consistency=consistency)
+        execute_kwargs: dict[str, Any] = {}
+        if timeout is not None:
+            execute_kwargs["timeout"] = timeout
+        pager = _PagedResponse(self._session.execute_async(bound, **execute_kwargs), asyncio.get_running_loop())
+        page, next_state = await pager.page()
+        rows = self._rows_to_dicts(page)
+        # Unpaged callers expect the full result, as the sync execute() gives
+        # by iterating its ResultSet: follow the driver's default paging.
+        while next_state is not None:
+            page, next_state = await pager.next_page()
+            rows.extend(self._rows_to_dicts(page))
+        self._last_paging_state = None
+        return rows
 
-            bound.consistency_level = getattr(ConsistencyLevel, consistency)
+    async def execute_paged_async(
+        self,
+        stmt: str,
+        params: list[Any],
+        consistency: str | None = None,
+        timeout: float | None = None,
+        fetch_size: int | None = None,
+        paging_state: bytes | None = None,
+    ) -> tuple[list[dict[str, Any]], bytes | None]:
+        """Fetch a single page natively through ``ResponseFuture`` callbacks.
+
+        Returns ``(rows, paging_state)`` where *paging_state* is ``None`` on
+        the last page.
+        """
+        bound = self._bind(stmt, params, consistency=consistency, fetch_size=fetch_size)
         execute_kwargs: dict[str, Any] = {}
         if timeout is not None:
             execute_kwargs["timeout"] = timeout
-        future = self._session.execute_async(bound, **execute_kwargs)
-        result = await self._wrap_future(future)
+        if paging_state is not None:
+            execute_kwargs["paging_state"] = paging_state
+        pager = _PagedResponse(self._session.execute_async(bound, **execute_kwargs), asyncio.get_running_loop())
+        page, next_state = await pager.page()
+        return self._rows_to_dicts(page), next_state
+
+    async def execute_tuples_async(
+        self,
+        stmt: str,
+        params: list[Any],
+        consistency: str | None = None,
+        timeout: float | None = None,
+        fetch_size: int | None = None,
+        paging_state: bytes | None = None,
+    ) -> tuple[list[str], list[tuple[Any, ...]]]:
+        """Async version of :meth:`execute_tuples`."""
+        if fetch_size is not None:
+            columns, rows, self._last_paging_state = await self.execute_paged_tuples_async(
+                stmt,
+                params,
+                consistency=consistency,
+                timeout=timeout,
+                fetch_size=fetch_size,
+                paging_state=paging_state,
+            )
+            return columns, rows
+        bound = self._bind(stmt, params, consistency=consistency)
+        execute_kwargs: dict[str, Any] = {}
+        if timeout is not None:
+            execute_kwargs["timeout"] = timeout
+        pager = _PagedResponse(self._submit_tuple_rows(bound, **execute_kwargs), asyncio.get_running_loop())
+        page, next_state = await pager.page()
+        rows = list(page or ())
+        while next_state is not None:
+            page, next_state = await pager.next_page()
+            rows.extend(page or ())
         self._last_paging_state = None
-        return self._rows_to_dicts(result)
+        return self._rows_to_tuples(rows, pager.column_names)
+
+    async def execute_paged_tuples_async(
+        self,
+        stmt: str,
+        params: list[Any],
+        consistency: str | None = None,
+        timeout: float | None = None,
+        fetch_size: int | None = None,
+        paging_state: bytes | None = None,
+    ) -> tuple[list[str], list[tuple[Any, ...]], bytes | None]:
+        """Async version of :meth:`execute_paged_tuples`."""
+        bound = self._bind(stmt, params, consistency=consistency, fetch_size=fetch_size)
+        execute_kwargs: dict[str, Any] = {}
+        if timeout is not None:
+            execute_kwargs["timeout"] = timeout
+        if paging_state is not None:
+            execute_kwargs["paging_state"] = paging_state
+        pager = _PagedResponse(self._submit_tuple_rows(bound, **execute_kwargs), asyncio.get_running_loop())
+        page, next_state = await pager.page()
+        columns, rows = self._rows_to_tuples(page, pager.column_names)
+        return columns, rows, next_state
+
+    async def execute_batch_async(
+        self,
+        statements: Iterable[tuple[str, list[Any]]],
+        logged: bool = True,
+        batch_type: str | None = None,
+        timestamp: int | None = None,
+        consistency: str | None = None,
+        timeout: float | None = None,
+    ) -> list[dict[str, Any]]:
+        """Async version of :meth:`execute_batch`."""
+        if timestamp is not None:
+            return await super().execute_batch_async(statements, logged, batch_type, timestamp, consistency, timeout)
+        batch = self._batch(statements, logged, batch_type, consistency)
+        execute_kwargs: dict[str, Any] = {}
+        if timeout is not None:
+            execute_kwargs["timeout"] = timeout
+        return self._rows_to_dicts(await self._wrap_future(self._session.execute_async(batch, **execute_kwargs)))
 
     async def _execute_cql_async(self, cql: str) -> Any:
         """Execute a raw CQL string asynchronously via the callback bridge."""
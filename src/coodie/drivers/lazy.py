@@ -5,9 +5,12 @@ from __future__ import annotations
 import asyncio
 import ssl as _ssl
 import threading
+from collections.abc import Iterable
 from typing import TYPE_CHECKING, Any
 
-from coodie.drivers.base import AbstractDriver
+from coodie.cache import CacheInfo
+from coodie.drivers.base import _DEFAULT_CONCURRENCY, _DEFAULT_PREPARED_CACHE_SIZE, AbstractDriver
+from coodie.results import ExecutionResult
 
 if TYPE_CHECKING:
     from coodie.drivers.cassandra import CassandraDriver
@@ -22,7 +25,7 @@ class LazyDriver(AbstractDriver):
     or :meth:`sync_table_async`.
     """
 
-    __slots__ = ("_hosts", "_keyspace", "_ssl_context", "_kwargs", "_driver", "_lock")
+    __slots__ = ("_hosts", "_keyspace", "_ssl_context", "_kwargs", "_prepared_cache_size", "_driver", "_lock")
 
     def __init__(
         self,
@@ -30,11 +33,13 @@ class LazyDriver(AbstractDriver):
         keyspace: str | None,
         ssl_context: _ssl.SSLContext | None,
         kwargs: dict[str, Any],
+        prepared_cache_size: int | None = _DEFAULT_PREPARED_CACHE_SIZE,
     ) -> None:
         self._hosts = hosts
         self._keyspace = keyspace
         self._ssl_context = ssl_context
         self._kwargs = kwargs
+        self._prepared_cache_size = prepared_cache_size
         self._driver: CassandraDriver | None = None
         self._lock = threading.Lock()
 
@@ -59,7 +64,11 @@ class LazyDriver(AbstractDriver):
             session = cluster.connect(self._keyspace)
             from coodie.drivers.cassandra import CassandraDriver
 
-            self._driver = CassandraDriver(session=session, default_keyspace=self._keyspace)
+            self._driver = CassandraDriver(
+                session=session,
+                default_keyspace=self._keyspace,
+                prepared_cache_size=self._prepared_cache_size,
+            )
 
     async def _ensure_connected_async(self) -> None:
         """Async wrapper for :meth:`_ensure_connected` using a thread-pool executor."""
@@ -91,6 +100,102 @@ class LazyDriver(AbstractDriver):
             paging_state=paging_state,
         )
 
+    def execute_paged(
+        self,
+        stmt: str,
+        params: list[Any],
+        consistency: str | None = None,
+        timeout: float | None = None,
+        fetch_size: int | None = None,
+        paging_state: bytes | None = None,
+    ) -> tuple[list[dict[str, Any]], bytes | None]:
+        self._ensure_connected()
+        assert self._driver is not None
+        return self._driver.execute_paged(
+            stmt,
+            params,
+            consistency=consistency,
+            timeout=timeout,
+            fetch_size=fetch_size,
+            paging_state=paging_state,
+        )
+
+    def execute_tuples(
+        self,
+        stmt: str,
+        params: list[Any],
+        consistency: str | None = None,
+        timeout: float | None = None,
+        fetch_size: int | None = None,
+        paging_state: bytes | None = None,
+    ) -> tuple[list[str], list[tuple[Any, ...]]]:
+        self._ensure_connected()
+        assert self._driver is not None
+        return self._driver.execute_tuples(
+            stmt,
+            params,
+            consistency=consistency,
+            timeout=timeout,
+            fetch_size=fetch_size,
+            paging_state=paging_state,
+        )
+
+    def execute_paged_tuples(
+        self,
+        stmt: str,
+        params: list[Any],
+        consistency: str | None = None,
+        timeout: float | None = None,
+        fetch_size: int | None = None,
+        paging_state: bytes | None = None,
+    ) -> tuple[list[str], list[tuple[Any, ...]], bytes | None]:
+        self._ensure_connected()
+        assert self._driver is not None
+        return self._driver.execute_paged_tuples(
+            stmt,
+            params,
+            consistency=consistency,
+            timeout=timeout,
+            fetch_size=fetch_size,
+            paging_state=paging_state,
+        )
+
+    def execute_concurrent(
+        self,
+        statements: Iterable[tuple[str, list[Any]]],
+        concurrency: int = _DEFAULT_CONCURRENCY,
+        consistency: str | None = None,
+        timeout: float | None = None,
+    ) -> list[ExecutionResult]:
+        self._ensure_connected()
+        assert self._driver is not None
+        return self._driver.execute_concurrent(
+            statements,
+            concurrency=concurrency,
+            consistency=consistency,
+            timeout=timeout,
+        )
+
+    def execute_batch(
+        self,
+        statements: Iterable[tuple[str, list[Any]]],
+        logged: bool = True,
+        batch_type: str | None = None,
+        timestamp: int | None = None,
+        consistency: str | None = None,
+        timeout: float | None = None,
+    ) -> list[dict[str, Any]]:
+        self._ensure_connected()
+        assert self._driver is not None
+        return self._driver.execute_batch(
+            statements,
+            logged=logged,
+            batch_type=batch_type,
+            timestamp=timestamp,
+            consistency=consistency,
+            timeout=timeout,
+        )
+
     def sync_table(
         self,
         table: str,
@@ -115,6 +220,11 @@ class LazyDriver(AbstractDriver):
         if self._driver is not None:
             self._driver.close()
 
+    def prepared_cache_info(self) -> CacheInfo:
+        if self._driver is None:
+            return CacheInfo(hits=0, misses=0, evictions=0, maxsize=self._prepared_cache_size, currsize=0)
+        return self._driver.prepared_cache_info()
+
     # ------------------------------------------------------------------
     # Asynchronous interface
     # ------------------------------------------------------------------
@@ -139,6 +249,102 @@ class LazyDriver(AbstractDriver):
             paging_state=paging_state,
         )
 
+    async def execute_paged_async(
+        self,
+        stmt: str,
+        params: list[Any],
+        consistency: str | None = None,
+        timeout: float | None = None,
+        fetch_size: int | None = None,
+        paging_state: bytes | None = None,
+    ) -> tuple[list[dict[str, Any]], bytes | None]:
+        await self._ensure_connected_async()
+        assert self._driver is not None
+        return await self._driver.execute_paged_async(
+            stmt,
+            params,
+            consistency=consistency,
+            timeout=timeout,
+            fetch_size=fetch_size,
+            paging_state=paging_state,
+        )
+
+    async def execute_tuples_async(
+        self,
+        stmt: str,
+        params: list[Any],
+        consistency: str | None = None,
+        timeout: float | None = None,
+        fetch_size: int | None = None,
+        paging_state: bytes | None = None,
+    ) -> tuple[list[str], list[tuple[Any, ...]]]:
+        await self._ensure_connected_async()
+        assert self._driver is not None
+        return await self._driver.execute_tuples_async(
+            stmt,
+            params,
+            consistency=consistency,
+            timeout=timeout,
+            fetch_size=fetch_size,
+            paging_state=paging_state,
+        )
+
+    async def execute_paged_tuples_async(
+        self,
+        stmt: str,
+        params: list[Any],
+        consistency: str | None = None,
+        timeout: float | None = None,
+        fetch_size: int | None = None,
+        paging_state: bytes | None = None,
+    ) -> tuple[list[str], list[tuple[Any, ...]], bytes | None]:
+        await self._ensure_connected_async()
+        assert self._driver is not None
+        return await self._driver.execute_paged_tuples_async(
+            stmt,
+            params,
+            consistency=consistency,
+            timeout=timeout,
+            fetch_size=fetch_size,
+            paging_state=paging_state,
+        )
+
+    async def execute_concurrent_async(
+        self,
+        statements: Iterable[tuple[str, list[Any]]],
+        concurrency: int = _DEFAULT_CONCURRENCY,
+        consistency: str | None = None,
+        timeout: float | None = None,
+    ) -> list[ExecutionResult]:
+        await self._ensure_connected_async()
+        assert self._driver is not None
+        return await self._driver.execute_concurrent_async(
+            statements,
+            concurrency=concurrency,
+            consistency=consistency,
+            timeout=timeout,
+        )
+
+    async def execute_batch_async(
+        self,
+        statements: Iterable[tuple[str, list[Any]]],
+        logged: bool = True,
+        batch_type: str | None = None,
+        timestamp: int | None = None,
+        consistency: str | None = None,
+        timeout: float | None = None,
+    ) -> list[dict[str, Any]]:
+        await self._ensure_connected_async()
+        assert self._driver is not None
+        return await self._driver.execute_batch_async(
+            statements,
+            logged=logged,
+            batch_type=batch_type,
+            timestamp=timestamp,
+            consistency=consistency,
+            timeout=timeout,
+        )
+
     async def sync_table_async(
         self,
         table: str,
@@ -2,12 +2,14 @@ from __future__ import annotations
 
 import asyncio
 import threading
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable
 from typing import Any
 
 from pydantic import BaseModel
 
-from coodie.drivers.base import AbstractDriver
+from coodie.cache import LRUCache
+from coodie.drivers.base import _DEFAULT_CONCURRENCY, _DEFAULT_PREPARED_CACHE_SIZE, AbstractDriver, _run_concurrent
+from coodie.results import ExecutionResult
 
 _DDL_PREFIXES = ("CREATE ", "ALTER ", "DROP ", "TRUNCATE ")
 
@@ -70,6 +72,7 @@ class PythonRsDriver(AbstractDriver):
         session: Any,
         default_keyspace: str | None = None,
         loop: asyncio.AbstractEventLoop | None = None,
+        prepared_cache_size: int | None = _DEFAULT_PREPARED_CACHE_SIZE,
     ) -> None:
         try:
             import scylla  # noqa: F401  # type: ignore[import-untyped]
@@ -80,7 +83,7 @@ class PythonRsDriver(AbstractDriver):
             ) from exc
         self._session = session
         self._default_keyspace = default_keyspace
-        self._prepared: dict[str, Any] = {}
+        self._prepared = LRUCache(prepared_cache_size)
         self._last_paging_state: bytes | None = None
         self._known_tables: dict[str, frozenset[str]] = {}
         # Spin up a dedicated background event loop in a daemon thread for the
@@ -103,6 +106,7 @@ class PythonRsDriver(AbstractDriver):
         cls,
         session_factory: Callable[[], Awaitable[Any]],
         default_keyspace: str | None = None,
+        prepared_cache_size: int | None = _DEFAULT_PREPARED_CACHE_SIZE,
     ) -> "PythonRsDriver":
         """Create a driver whose python-rs session lives on the background loop.
 
@@ -148,7 +152,7 @@ class PythonRsDriver(AbstractDriver):
         driver: "PythonRsDriver" = cls.__new__(cls)
         driver._session = session
         driver._default_keyspace = default_keyspace
-        driver._prepared = {}
+        driver._prepared = LRUCache(prepared_cache_size)
         driver._last_paging_state = None
         driver._known_tables = {}
         driver._bg_loop = bg_loop
@@ -161,9 +165,7 @@ class PythonRsDriver(AbstractDriver):
     # ------------------------------------------------------------------
 
     async def _prepare(self, cql: str) -> Any:
-        if cql not in self._prepared:
-            self._prepared[cql] = await self._session.prepare(cql)
-        return self._prepared[cql]
+        return await self._prepared.get_or_create_async(cql, lambda: self._session.prepare(cql))
 
     @staticmethod
     def _serialize_param(p: Any) -> Any:
@@ -408,6 +410,32 @@ class PythonRsDriver(AbstractDriver):
 
         return planned
 
+    async def execute_paged_async(
+        self,
+        stmt: str,
+        params: list[Any],
+        consistency: str | None = None,
+        timeout: float | None = None,
+        fetch_size: int | None = None,
+        paging_state: bytes | None = None,
+    ) -> tuple[list[dict[str, Any]], bytes | None]:
+        # python-rs-driver does not expose paging state: the whole result is
+        # returned as a single, final page.
+        rows = await self.execute_async(stmt, params, consistency=consistency, timeout=timeout)
+        return rows, None
+
+    async def execute_concurrent_async(
+        self,
+        statements: Iterable[tuple[str, list[Any]]],
+        concurrency: int = _DEFAULT_CONCURRENCY,
+        consistency: str | None = None,
+        timeout: float | None = None,
+    ) -> list[ExecutionResult]:
+        coro = _run_concurrent(self._execute_async_impl, statements, concurrency, consistency, timeout)
+        if self._bridge_to_bg_loop:
+            return await self._run_on_bg_loop(coro)
+        return await coro
+
     async def sync_table_async(
         self,
         table: str,
@@ -466,6 +494,31 @@ class PythonRsDriver(AbstractDriver):
             self._bg_loop,
         ).result()
 
+    def execute_paged(
+        self,
+        stmt: str,
+        params: list[Any],
+        consistency: str | None = None,
+        timeout: float | None = None,
+        fetch_size: int | None = None,
+        paging_state: bytes | None = None,
+    ) -> tuple[list[dict[str, Any]], bytes | None]:
+        # See execute_paged_async(): always a single, final page.
+        return self.execute(stmt, params, consistency=consistency, timeout=timeout), None
+
+    def execute_concurrent(
+        self,
+        statements: Iterable[tuple[str, list[Any]]],
+        concurrency: int = _DEFAULT_CONCURRENCY,
+        consistency: str | None = None,
+        timeout: float | None = None,
+    ) -> list[ExecutionResult]:
+        """Pipeline *statements* on the background loop with a bounded in-flight window."""
+        return asyncio.run_coroutine_threadsafe(
+            _run_concurrent(self._execute_async_impl, statements, concurrency, consistency, timeout),
+            self._bg_loop,
+        ).result()
+
     def sync_table(
         self,
         table: str,
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Any
 
 
 @dataclass(frozen=True)
@@ -110,9 +111,41 @@ class Vector:
     Maps ``list[float]`` to the CQL ``vector<float, N>`` type::
 
         embedding: Annotated[list[float], Vector(dimensions=384)]
+
+    Besides lists, the field accepts one-dimensional float buffers —
+    ``numpy.ndarray``, ``array.array("f")`` or ``memoryview`` — and keeps
+    them as they are instead of copying them element by element into a
+    list.  With ``as_array=True`` values are stored, and read back from the
+    database, as ``float32`` ``numpy.ndarray`` (requires numpy).
     """
 
     dimensions: int
+    as_array: bool = False
+
+    def __get_pydantic_core_schema__(self, source: Any, handler: Any) -> Any:
+        from pydantic_core import core_schema
+
+        from coodie.types import _is_vector_buffer, _to_float32_array, _vector_to_list
+
+        as_array = self.as_array
+
+        def validate(value: Any, validate_list: Any) -> Any:
+            if as_array and value is not None:
+                try:
+                    value = _to_float32_array(value)
+                except (TypeError, ValueError) as exc:
+                    raise ValueError(f"invalid float vector: {exc}") from exc
+            elif not _is_vector_buffer(value):
+                return validate_list(value)
+            if getattr(value, "ndim", 1) != 1:
+                raise ValueError("vector buffers must be one-dimensional")
+            return value
+
+        return core_schema.no_info_wrap_validator_function(
+            validate,
+            handler(source),
+            serialization=core_schema.plain_serializer_function_ser_schema(_vector_to_list),
+        )
 
 
 _VALID_SIMILARITY_FUNCTIONS = frozenset({"COSINE", "DOT_PRODUCT", "EUCLIDEAN"})
@@ -2,47 +2,130 @@
 
 from __future__ import annotations
 
+import functools
+from collections.abc import Callable
 from typing import Any
 
+from coodie.types import _array_vector_fields, _collection_fields, _to_float32_array
+
+
+@functools.lru_cache(maxsize=256)
+def _field_slots(doc_cls: type, columns: tuple[str, ...]) -> dict[str, tuple[int, Callable[[], Any] | None, bool]]:
+    """Return ``{field: (row position, collection factory, is float32 array)}`` for the model fields in *columns*."""
+    known = doc_cls.model_fields  # type: ignore[attr-defined]
+    coll = _collection_fields(doc_cls)
+    arrays = _array_vector_fields(doc_cls)
+    return {c: (i, coll.get(c), c in arrays) for i, c in enumerate(columns) if c in known}
+
 
 class LazyDocument:
-    """Proxy that defers Pydantic ``model_validate()`` until a field is accessed.
+    """Proxy that defers building the Document until it is needed.
 
-    Returned by ``QuerySet.all(lazy=True)``.  The raw row dict from the
-    database is stored and only parsed into a full Document on first
-    attribute access, giving near-zero construction cost for rows that are
-    never inspected (common in exists-checks, pagination cursors and
-    status dashboards).
+    Returned by ``QuerySet.all(lazy=True)``.  The raw row from the database
+    is stored and only parsed into a full Document on demand, giving
+    near-zero construction cost for rows that are never inspected (common
+    in exists-checks, pagination cursors and status dashboards).
+
+    *raw_data* is either a row dict or, when *columns* is given, the row
+    tuple as returned by the driver's tuple-row path; the column names list
+    is shared by every row of a result.
+
+    With ``validate=False`` (what queries pass unless ``.validate()`` is
+    set or the driver needs row validation) fields are read per field: a
+    column of the row is returned straight from it, with the same ``None``
+    → empty collection and float32-array handling as ``model_construct()``
+    hydration, and the full Document is built with ``model_construct()``
+    only for anything else — methods, defaults of columns not selected,
+    ``model_dump()``.  Decoded collection and array values are kept, so
+    every read returns the same object and in-place changes stick.  With ``validate=True`` the first attribute access
+    runs ``model_validate()`` on the whole row.
     """
 
-    __slots__ = ("_doc_cls", "_raw_data", "_parsed")
+    __slots__ = ("_columns", "_decoded", "_doc_cls", "_parsed", "_raw_data", "_validate")
 
-    def __init__(self, doc_cls: type, raw_data: dict[str, Any]) -> None:
+    def __init__(
+        self,
+        doc_cls: type,
+        raw_data: dict[str, Any] | tuple[Any, ...],
+        columns: list[str] | None = None,
+        validate: bool = True,
+    ) -> None:
         self._doc_cls = doc_cls
         self._raw_data = raw_data
+        self._columns = columns
+        self._validate = validate
         self._parsed: Any = None
+        # Collection and array fields decoded so far, by field name.
+        self._decoded: dict[str, Any] | None = None
 
     # ------------------------------------------------------------------
 
+    def _row(self) -> dict[str, Any]:
+        raw: Any = self._raw_data
+        if self._columns is not None:
+            return dict(zip(self._columns, raw))
+        return dict(raw)
+
     def _resolve(self) -> Any:
         """Force parsing and return the full Document instance."""
         parsed = self._parsed
         if parsed is None:
-            from coodie.types import _collection_fields
-
-            coll = _collection_fields(self._doc_cls)
-            if coll:
-                raw = self._raw_data
-                for key, factory in coll.items():
-                    if key in raw and raw[key] is None:
-                        raw[key] = factory()
-            parsed = self._doc_cls.model_validate(self._raw_data)
+            raw = self._row()
+            if self._validate:
+                coll = _collection_fields(self._doc_cls)
+                if coll:
+                    for key, factory in coll.items():
+                        if key in raw and raw[key] is None:
+                            raw[key] = factory()
+                parsed = self._doc_cls.model_validate(raw)  # type: ignore[attr-defined]
+            else:
+                fields = {name: self._field(name, slot) for name, slot in self._slots().items()}
+                parsed = self._doc_cls.model_construct(_fields_set=set(fields), **fields)  # type: ignore[attr-defined]
             self._parsed = parsed
         return parsed
 
+    def _slots(self) -> dict[str, tuple[int, Callable[[], Any] | None, bool]]:
+        columns = self._columns if self._columns is not None else self._raw_data
+        return _field_slots(self._doc_cls, tuple(columns))
+
+    def _field(self, name: str, slot: tuple[int, Callable[[], Any] | None, bool]) -> Any:
+        index, factory, is_array = slot
+        value = self._raw_data[index] if self._columns is not None else self._raw_data[name]  # type: ignore[index,call-overload]
+        if factory is None and not is_array:
+            return value
+        decoded = self._decoded
+        if decoded is None:
+            decoded = self._decoded = {}
+        elif name in decoded:
+            return decoded[name]
+        if is_array:
+            value = _to_float32_array(value)
+        elif value is None and factory is not None:
+            value = factory()
+        decoded[name] = value
+        return value
+
     def __getattr__(self, name: str) -> Any:
+        # Dunder lookups (pickle, copy, ...) must not build the document,
+        # nor recurse through a slot that is not set yet.
+        if name.startswith("__") or name in LazyDocument.__slots__:
+            raise AttributeError(name)
+        if self._parsed is None and not self._validate:
+            slot = self._slots().get(name)
+            if slot is not None:
+                return self._field(name, slot)
         return getattr(self._resolve(), name)
 
+    def model_dump(self, **kwargs: Any) -> dict[str, Any]:
+        """Return ``model_dump(**kwargs)`` of the full Document."""
+        return self._resolve().model_dump(**kwargs)
+
+    def __getstate__(self) -> tuple[Any, ...]:
+        return self._doc_cls, self._raw_data, self._columns, self._validate, self._parsed, self._decoded
+
+    def __setstate__(self, state: tuple[Any, ...]) -> None:
+        self._doc_cls, self._raw_data, self._columns, self._validate, self._parsed, self._decoded = state
+
     def __repr__(self) -> str:
         if self._parsed is not None:
             return f"LazyDocument({self._parsed!r})"
@@ -0,0 +1,145 @@
+"""Per-class compiled keyword-argument lookups for ``filter()`` / ``update()`` / ``if_conditions``.
+
+:func:`~coodie.cql_builder.parse_filter_kwargs` and friends split every key
+on every call.  A :class:`_Lookups` table instead maps each key a document
+class accepts — ``col``, ``col__gt``, ``col__token__gt``, ``col__append``,
+… — to its pre-built ``(column, operator)`` pair once, so parsing is one
+dictionary lookup per key, and a key naming no column of the class fails
+fast with :class:`~coodie.exceptions.InvalidQueryError` instead of reaching
+the database.  Field aliases and the columns of every class sharing a
+polymorphic table are accepted too.
+"""
+
+from __future__ import annotations
+
+import difflib
+from typing import Any
+
+from coodie.cache import LRUCache
+from coodie.cql_builder import _COLLECTION_OPS, _FILTER_OPS, _IF_OPS, _TOKEN_FILTER_OPS
+from coodie.exceptions import InvalidQueryError
+from coodie.schema import _resolve_polymorphic_base, _subclass_map, build_schema
+
+
+def _hierarchy(doc_cls: Any) -> list[Any]:
+    """Return *doc_cls* plus every class sharing its polymorphic table."""
+    classes = [doc_cls]
+    base = _resolve_polymorphic_base(doc_cls)
+    if base is not None:
+        classes.append(base)
+        classes.extend(_subclass_map(base).values())
+    return classes
+
+
+def _table_columns(doc_cls: Any) -> dict[str, str]:
+    """Return ``{name: column}`` for every keyword name *doc_cls* accepts.
+
+    Names are the columns of every class in the polymorphic table (siblings
+    included — they share the table) plus each field's pydantic alias.
+    """
+    columns: dict[str, str] = {}
+    aliases: dict[str, str] = {}
+    for cls in _hierarchy(doc_cls):
+        fields = getattr(cls, "model_fields", {})
+        for col in build_schema(cls):
+            columns.setdefault(col.name, col.name)
+            alias = getattr(fields.get(col.name), "alias", None)
+            if alias and alias != col.name:
+                aliases.setdefault(alias, col.name)
+    for alias, name in aliases.items():
+        columns.setdefault(alias, name)
+    return columns
+
+
+class _Lookups:
+    """``kwarg -> (column, operator)`` tables for one document class."""
+
+    __slots__ = ("columns", "conditions", "filters", "updates")
+
+    def __init__(self, doc_cls: Any) -> None:
+        self.columns = _table_columns(doc_cls)
+        self.filters: dict[str, tuple[str, str]] = {}
+        self.updates: dict[str, tuple[str, str | None]] = {}
+        self.conditions: dict[str, tuple[str, str]] = {}
+        for name, col in self.columns.items():
+            self.filters[name] = (col, "=")
+            for suffix, op in _FILTER_OPS.items():
+                self.filters[f"{name}__{suffix}"] = (col, op)
+            for suffix, op in _TOKEN_FILTER_OPS.items():
+                self.filters[f"{name}__{suffix}"] = (col, op)
+            self.updates[name] = (col, None)
+            for op in _COLLECTION_OPS:
+                self.updates[f"{name}__{op}"] = (col, op)
+            self.conditions[name] = (col, "=")
+            for suffix, op in _IF_OPS.items():
+                self.conditions[f"{name}__{suffix}"] = (col, op)
+
+
+_tables = LRUCache(256)
+
+
+def _lookups(doc_cls: Any) -> _Lookups:
+    table = _tables.get(doc_cls)
+    if table is None:
+        table = _Lookups(doc_cls)
+        _tables.put(doc_cls, table)
+    return table
+
+
+def _resolve(doc_cls: Any, kind: str, key: str) -> Any:
+    """Look up *key* in *doc_cls*'s *kind* table, recompiling it once on a miss.
+
+    The recompile picks up polymorphic subclasses defined after the table
+    was built; a key that is still unknown raises.
+    """
+    entry = getattr(_lookups(doc_cls), kind).get(key)
+    if entry is not None:
+        return entry
+    table = _Lookups(doc_cls)
+    _tables.put(doc_cls, table)
+    entry = getattr(table, kind).get(key)
+    if entry is not None:
+        return entry
+    column = key.split("__", 1)[0]
+    if column in table.columns:
+        raise InvalidQueryError(f"Unsupported lookup '{key}' for {doc_cls.__name__}")
+    hint = difflib.get_close_matches(column, list(table.columns), n=1)
+    suggestion = f"; did you mean '{hint[0]}'?" if hint else ""
+    raise InvalidQueryError(f"Unknown column '{column}' for {doc_cls.__name__}{suggestion}")
+
+
+def compile_filters(doc_cls: Any, kwargs: dict[str, Any]) -> list[tuple[str, str, Any]]:
+    """Return the ``(column, operator, value)`` triples of filter *kwargs* for *doc_cls*."""
+    filters = _lookups(doc_cls).filters
+    result = []
+    for key, value in kwargs.items():
+        entry = filters.get(key) or _resolve(doc_cls, "filters", key)
+        result.append((entry[0], entry[1], value))
+    return result
+
+
+def compile_updates(doc_cls: Any, kwargs: dict[str, Any]) -> tuple[dict[str, Any], list[tuple[str, str, Any]]]:
+    """Split update *kwargs* for *doc_cls* into ``(set_data, collection_ops)``.
+
+    Same result as :func:`~coodie.cql_builder.parse_update_kwargs`, with
+    unknown columns rejected.
+    """
+    updates = _lookups(doc_cls).updates
+    set_data: dict[str, Any] = {}
+    collection_ops: list[tuple[str, str, Any]] = []
+    for key, value in kwargs.items():
+        col, op = updates.get(key) or _resolve(doc_cls, "updates", key)
+        if op is None:
+            set_data[col] = value
+        else:
+            collection_ops.append((col, op, value))
+    return set_data, collection_ops
+
+
+def check_conditions(doc_cls: Any, conditions: dict[str, Any] | None) -> None:
+    """Raise :class:`~coodie.exceptions.InvalidQueryError` if an ``if_conditions`` key names no column."""
+    if conditions:
+        table = _lookups(doc_cls).conditions
+        for key in conditions:
+            if key not in table:
+                _resolve(doc_cls, "conditions", key)
@@ -4,16 +4,16 @@ from __future__ import annotations
 
 import asyncio
 import hashlib
+import inspect
 import logging
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Awaitable, Callable
 from pathlib import Path
 from typing import Any
 
-logger = logging.getLogger("coodie")
+from coodie.cql_builder import token_ranges
+from coodie.scan import scan_token_ranges_async
 
-# Cassandra/ScyllaDB murmur3 token range
-_TOKEN_MIN = -(2**63)
-_TOKEN_MAX = 2**63 - 1
+logger = logging.getLogger("coodie")
 
 
 class MigrationContext:
@@ -97,15 +97,19 @@ class MigrationContext:
         *,
         page_size: int = 1000,
         num_ranges: int = 1000,
+        parallelism: int = 4,
         resume_token: int | None = None,
+        checkpoint: Callable[[int], Awaitable[Any] | Any] | None = None,
         throttle_seconds: float = 0.0,
     ) -> AsyncIterator[dict[str, Any]]:
         """Iterate over all rows in a table using token-range queries.
 
         Uses ``token()`` on the partition key to walk through the full
-        token ring in *num_ranges* sub-ranges, fetching at most
-        *page_size* rows per query.  Rows are yielded one at a time so
-        the entire table is never loaded into memory.
+        token ring in *num_ranges* sub-ranges, up to *parallelism* of them
+        at a time.  Each range is paged through with *page_size* rows per
+        page, so no range is truncated however many rows it holds.  Rows are
+        yielded one at a time, in token order, so the entire table is never
+        loaded into memory.
 
         Parameters
         ----------
@@ -114,16 +118,23 @@ class MigrationContext:
         table:
             Table name.
         page_size:
-            Maximum rows per token-range query (``LIMIT``).
+            Rows fetched per page within a token range.
         num_ranges:
             Number of sub-ranges to divide the token ring into.
+        parallelism:
+            Maximum number of token ranges queried concurrently.
         resume_token:
-            If provided, skip all ranges whose start token is ``<=``
-            this value.  Useful for resuming a failed migration from
-            where it stopped.
+            If provided, only rows with a token greater than this value are
+            scanned.  Pass the last value given to *checkpoint* to resume a
+            failed migration exactly where it stopped.
+        checkpoint:
+            Called (and awaited, if it returns an awaitable) with a range's
+            end token once every row of that range has been yielded.  Ranges
+            complete in token order, so the latest value is always a safe
+            *resume_token*.
         throttle_seconds:
-            If ``> 0``, sleep this many seconds between each token-range
-            query to avoid overloading the cluster.
+            If ``> 0``, sleep this many seconds after each completed
+            token range to avoid overloading the cluster.
 
         Yields
         ------
@@ -142,34 +153,33 @@ class MigrationContext:
 
         pk_cols = await self._get_partition_key_columns(keyspace, table)
         token_expr = f"token({', '.join(pk_cols)})"
+        cql = f"SELECT * FROM {keyspace}.{table} WHERE {token_expr} > ? AND {token_expr} <= ?"
 
-        # Build sub-range boundaries
-        range_size = (_TOKEN_MAX - _TOKEN_MIN) // num_ranges
-        boundaries: list[int] = []
-        for i in range(num_ranges):
-            boundaries.append(_TOKEN_MIN + range_size * i)
-        boundaries.append(_TOKEN_MAX)
-
-        total_ranges = len(boundaries) - 1
-        ranges_done = 0
-
-        for i in range(total_ranges):
-            range_start = boundaries[i]
-            range_end = boundaries[i + 1]
+        # D.3 — Resume-from-token: drop finished ranges and clip the one
+        # containing resume_token so that no row after it is skipped.
+        total_ranges = max(1, num_ranges)
+        work = token_ranges(total_ranges)
+        if resume_token is not None:
+            work = [(max(lo, resume_token), hi) for lo, hi in work if hi > resume_token]
+        ranges_done = total_ranges - len(work)
 
-            # D.3 — Resume-from-token: skip already-processed ranges
-            if resume_token is not None and range_start <= resume_token:
-                ranges_done += 1
-                continue
-
-            cql = f"SELECT * FROM {keyspace}.{table} WHERE {token_expr} > ? AND {token_expr} <= ? LIMIT {page_size}"
+        async def fetch_page(lo: int, hi: int, paging_state: bytes | None) -> tuple[list[dict[str, Any]], bytes | None]:
             self._executed_cql.append(cql)
+            return await self._driver.execute_paged_async(
+                cql, [lo, hi], fetch_size=page_size, paging_state=paging_state
+            )
 
-            rows = await self._driver.execute_async(cql, [range_start, range_end])
+        async for rows, completed_token in scan_token_ranges_async(fetch_page, work, parallelism):
             for row in rows:
                 yield row
+            if completed_token is None:
+                continue
 
             ranges_done += 1
+            if checkpoint is not None:
+                result = checkpoint(completed_token)
+                if inspect.isawaitable(result):
+                    await result
 
             # D.2 — Progress reporting
             pct = (ranges_done / total_ranges) * 100
@@ -181,7 +191,7 @@ class MigrationContext:
                     ranges_done,
                     total_ranges,
                     pct,
-                    range_end,
+                    completed_token,
                 )
 
             # D.4 — Rate limiting / throttle
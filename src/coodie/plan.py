@@ -0,0 +1,181 @@
+"""Per-class statement plans for the Document write path.
+
+A plan resolves everything ``save()``, ``insert()``, ``delete()`` and
+``update()`` need to know about a document class — table, keyspace, column
+order, discriminator, vector dimensions and the final CQL strings — once, so
+that the per-call work is a few attribute lookups plus ``execute``.  The
+same holds for the full-primary-key read behind ``get()`` / ``find_one()``.
+"""
+
+from __future__ import annotations
+
+from operator import attrgetter
+from typing import Any
+
+from coodie.cache import LRUCache
+from coodie.cql_builder import build_delete, build_insert_from_columns
+from coodie.exceptions import InvalidQueryError
+from coodie.schema import (
+    _find_discriminator_column,
+    _get_discriminator_value,
+    _insert_columns,
+    _partition_key_columns,
+    _pk_columns,
+    _vector_columns,
+    build_schema,
+)
+from coodie.types import _vector_to_list
+
+
+class _StatementPlan:
+    """Compiled write metadata for one document class on one driver."""
+
+    __slots__ = (
+        "_get_insert_values",
+        "_vector_slots",
+        "delete_cql",
+        "disc_index",
+        "disc_value",
+        "driver",
+        "insert_columns",
+        "insert_cql",
+        "key_columns",
+        "key_set",
+        "keyspace",
+        "partition_key",
+        "pk_columns",
+        "select_by_pk_cql",
+        "table",
+        "upsert_cql",
+        "vector_columns",
+    )
+
+    def __init__(self, doc_cls: Any, driver: Any) -> None:
+        self.driver = driver
+        self.table: str = doc_cls._get_table()
+        self.keyspace: str = doc_cls._get_keyspace()
+        self.insert_columns = _insert_columns(doc_cls)
+        self.pk_columns = _pk_columns(doc_cls)
+        self.partition_key = _partition_key_columns(doc_cls)
+        self.vector_columns = _vector_columns(doc_cls)
+        self._vector_slots = [
+            (self.insert_columns.index(name), name, dims)
+            for name, dims in self.vector_columns
+            if name in self.insert_columns
+        ]
+        disc_col = _find_discriminator_column(doc_cls)
+        self.disc_value = _get_discriminator_value(doc_cls)
+        self.disc_index = self.insert_columns.index(disc_col) if disc_col and self.disc_value else None
+        self.upsert_cql, _ = build_insert_from_columns(self.table, self.keyspace, self.insert_columns, [])
+        self.insert_cql, _ = build_insert_from_columns(
+            self.table, self.keyspace, self.insert_columns, [], if_not_exists=True
+        )
+        self.delete_cql, _ = build_delete(self.table, self.keyspace, [(c, "=", None) for c in self.pk_columns])
+        # Same key order and CQL text as the driver's ``_warm_prepared_cache``,
+        # so the SELECT-by-PK is already prepared after ``sync_table()``.
+        schema = build_schema(doc_cls)
+        key_cols = sorted((c for c in schema if c.primary_key), key=lambda c: c.partition_key_index) + sorted(
+            (c for c in schema if c.clustering_key), key=lambda c: c.clustering_key_index
+        )
+        self.key_columns = tuple(c.name for c in key_cols)
+        self.key_set = frozenset(self.key_columns)
+        where = " AND ".join(f'"{c}" = ?' for c in self.key_columns)
+        self.select_by_pk_cql = f"SELECT * FROM {self.keyspace}.{self.table} WHERE {where}"
+        getter = attrgetter(*self.insert_columns)
+        if len(self.insert_columns) == 1:
+            self._get_insert_values = lambda doc: [getter(doc)]
+        else:
+            self._get_insert_values = lambda doc: list(getter(doc))
+
+    def insert_values(self, doc: Any) -> list[Any]:
+        """Return *doc*'s INSERT bind values, validating vector dimensions.
+
+        Vector buffers (``numpy.ndarray``, ``array.array``, ``memoryview``)
+        are handed to the driver as lists.
+        """
+        values: list[Any] = self._get_insert_values(doc)
+        for index, vec_name, vec_dims in self._vector_slots:
+            val = values[index]
+            if val is not None:
+                if len(val) != vec_dims:
+                    raise InvalidQueryError(f"Vector field '{vec_name}' expects {vec_dims} dimensions, got {len(val)}")
+                values[index] = _vector_to_list(val)
+        if self.disc_index is not None:
+            values[self.disc_index] = self.disc_value
+        return values
+
+    def insert_statement(
+        self,
+        ttl: int | None = None,
+        timestamp: int | None = None,
+        if_not_exists: bool = False,
+    ) -> str:
+        """Return the INSERT CQL, reusing the precompiled form when no ``USING`` clause is needed."""
+        if ttl is None and timestamp is None:
+            return self.insert_cql if if_not_exists else self.upsert_cql
+        cql, _ = build_insert_from_columns(
+            self.table,
+            self.keyspace,
+            self.insert_columns,
+            [],
+            ttl=ttl,
+            if_not_exists=if_not_exists,
+            timestamp=timestamp,
+        )
+        return cql
+
+    def pk_values(self, doc: Any) -> list[Any]:
+        return [getattr(doc, c) for c in self.pk_columns]
+
+    def pk_where(self, doc: Any) -> list[tuple[str, str, Any]]:
+        return [(c, "=", getattr(doc, c)) for c in self.pk_columns]
+
+    def partition_of(self, doc: Any) -> tuple[Any, ...]:
+        """Return ``(keyspace, table, *partition key values)`` — the batch grouping key of *doc*."""
+        return (self.keyspace, self.table, *(getattr(doc, c) for c in self.partition_key))
+
+    def key_params(self, key: Any) -> list[Any]:
+        """Return the SELECT-by-PK bind values for *key*.
+
+        *key* is a ``{column: value}`` dict naming every key column, a tuple
+        of values in :attr:`key_columns` order, or — for a single-column
+        primary key — the bare value.
+        """
+        if isinstance(key, dict):
+            if key.keys() != self.key_set:
+                raise InvalidQueryError(f"Expected the primary key columns {list(self.key_columns)}, got {sorted(key)}")
+            return [key[c] for c in self.key_columns]
+        if isinstance(key, tuple):
+            if len(key) != len(self.key_columns):
+                raise InvalidQueryError(
+                    f"Expected {len(self.key_columns)} primary key values {list(self.key_columns)}, got {len(key)}"
+                )
+            return list(key)
+        if len(self.key_columns) != 1:
+            raise InvalidQueryError(
+                f"A composite primary key {list(self.key_columns)} needs a tuple or dict key, got {key!r}"
+            )
+        return [key]
+
+    def update_values(self, set_data: dict[str, Any]) -> dict[str, Any]:
+        """Return *set_data* with vector buffers converted to lists for binding."""
+        if not self._vector_slots:
+            return set_data
+        bound = dict(set_data)
+        for _, vec_name, _ in self._vector_slots:
+            if vec_name in bound:
+                bound[vec_name] = _vector_to_list(bound[vec_name])
+        return bound
+
+
+_plans = LRUCache(256)
+
+
+def _statement_plan(doc_cls: Any) -> _StatementPlan:
+    """Return the cached plan for *doc_cls*, rebuilding it when its driver changes."""
+    driver = doc_cls._get_driver()
+    plan = _plans.get(doc_cls)
+    if plan is None or plan.driver is not driver:
+        plan = _StatementPlan(doc_cls, driver)
+        _plans.put(doc_cls, plan)
+    return plan
@@ -0,0 +1,206 @@
+"""Opt-in read-through cache for primary-key lookups — ``Settings.__cache__``.
+
+A document class enables it with::
+
+    class UserProfile(Document):
+        ...
+
+        class Settings:
+            name = "user_profiles"
+            __cache__ = {"ttl": 30, "maxsize": 100_000}
+
+``get()`` / ``find_one()`` calls whose keyword arguments are exactly the
+full primary key are then answered from the cache while the entry is
+younger than ``ttl`` seconds.  Concurrent misses on one key share a single
+query.  ``save()``, ``save_json()``, ``insert()``, ``update()``,
+``delete()`` and ``delete_columns()`` of an instance, and ``bulk_save()`` /
+``bulk_insert()``, invalidate its key in the cache of its class and of
+every related class of the same hierarchy — a write given ``batch=`` once
+its batch has been sent; ``QuerySet.create()`` / ``update()`` /
+``delete()``, ``truncate()`` and ``drop_table()`` clear those caches.
+Writes made by other processes are only seen once the entry expires.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import weakref
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+from coodie.cache import CacheInfo, LRUCache
+from coodie.exceptions import ConfigurationError
+from coodie.schema import _pk_columns
+
+_DEFAULT_MAXSIZE = 10_000
+
+_MISSING = object()
+
+
+class _DocumentCache:
+    """LRU cache of documents keyed by primary-key tuple, with per-entry TTL.
+
+    Entries are ``(document, expires_at)`` pairs in an :class:`LRUCache`,
+    whose single-flight ``get_or_create`` coalesces concurrent misses.
+    Hit/miss counters are kept here because an expired entry is a miss.
+    """
+
+    __slots__ = ("_entries", "_expirations", "_generation", "_hits", "_lock", "_misses", "_ttl")
+
+    def __init__(self, ttl: float | None = None, maxsize: int | None = _DEFAULT_MAXSIZE) -> None:
+        self._entries = LRUCache(maxsize)
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._expirations = 0
+        # Bumped by every invalidation so a load that raced a write is not kept.
+        self._generation = 0
+
+    def _lookup(self, key: Hashable) -> Any:
+        entry = self._entries.get(key)
+        if entry is not None:
+            doc, expires_at = entry
+            if expires_at is None or expires_at > time.monotonic():
+                with self._lock:
+                    self._hits += 1
+                # Deep, so mutating a returned list or dict field cannot reach the entry.
+                return doc.model_copy(deep=True)
+            if self._entries.pop(key) is not None:
+                with self._lock:
+                    self._expirations += 1
+        with self._lock:
+            self._misses += 1
+        return _MISSING
+
+    def _entry(self, doc: Any) -> tuple[Any, float | None]:
+        return doc, None if self._ttl is None else time.monotonic() + self._ttl
+
+    def _keep(self, key: tuple[Any, ...], generation: int) -> Callable[[tuple[Any, float | None]], bool]:
+        """Return the ``cache_if`` check for a load of *key* started at *generation*.
+
+        Only a document stored under its own key is kept, and only if no
+        write intervened; ``None`` results are never stored.
+        """
+
+        def keep(entry: tuple[Any, float | None]) -> bool:
+            doc = entry[0]
+            return doc is not None and generation == self._generation and _doc_key(doc) == key
+
+        return keep
+
+    def get_or_load(self, key: tuple[Any, ...], load: Callable[[], Any]) -> Any:
+        """Return the cached document for *key*, calling *load* on a miss.
+
+        ``None`` results are not cached.
+        """
+        doc = self._lookup(key)
+        if doc is not _MISSING:
+            return doc
+        keep = self._keep(key, self._generation)
+        doc = self._entries.get_or_create(key, lambda: self._entry(load()), cache_if=keep)[0]
+        return None if doc is None else doc.model_copy(deep=True)
+
+    async def get_or_load_async(self, key: tuple[Any, ...], load: Callable[[], Awaitable[Any]]) -> Any:
+        """Async version of :meth:`get_or_load`; concurrent misses on *key* share one *load*."""
+        doc = self._lookup(key)
+        if doc is not _MISSING:
+            return doc
+        keep = self._keep(key, self._generation)
+
+        async def factory() -> tuple[Any, float | None]:
+            return self._entry(await load())
+
+        doc = (await self._entries.get_or_create_async(key, factory, cache_if=keep))[0]
+        return None if doc is None else doc.model_copy(deep=True)
+
+    def invalidate(self, key: tuple[Any, ...]) -> None:
+        with self._lock:
+            self._generation += 1
+        self._entries.pop(key)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._generation += 1
+            self._hits = self._misses = self._expirations = 0
+        self._entries.clear()
+
+    def info(self) -> CacheInfo:
+        """Return hit/miss counters; ``evictions`` includes expired entries."""
+        entries = self._entries.info()
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=entries.evictions + self._expirations,
+                maxsize=entries.maxsize,
+                currsize=entries.currsize,
+            )
+
+
+# Caches of the classes whose Settings define ``__cache__``, and the set of
+# classes already checked and found not to.
+_caches: weakref.WeakKeyDictionary[type, _DocumentCache] = weakref.WeakKeyDictionary()
+_uncached: weakref.WeakSet[type] = weakref.WeakSet()
+
+
+def _document_cache(cls: type) -> _DocumentCache | None:
+    """Return the read cache of *cls*, creating it from ``Settings.__cache__`` on first use."""
+    cache = _caches.get(cls)
+    if cache is not None or cls in _uncached:
+        return cache
+    config = getattr(getattr(cls, "Settings", None), "__cache__", None)
+    if not config:
+        _uncached.add(cls)
+        return None
+    if config is True:
+        config = {}
+    unknown = set(config) - {"ttl", "maxsize"}
+    if unknown:
+        raise ConfigurationError(f"{cls.__name__}.Settings.__cache__ has unknown keys: {sorted(unknown)}")
+    cache = _caches[cls] = _DocumentCache(ttl=config.get("ttl"), maxsize=config.get("maxsize", _DEFAULT_MAXSIZE))
+    return cache
+
+
+def _doc_key(doc: Any) -> tuple[Any, ...]:
+    cls: Any = type(doc)
+    return tuple(getattr(doc, c) for c in _pk_columns(cls))
+
+
+def _lookup_key(cls: type, kwargs: dict[str, Any]) -> tuple[Any, ...] | None:
+    """Return the cache key for a ``get()`` / ``find_one()`` call, or ``None`` if it is not a full-PK lookup."""
+    pk = _pk_columns(cls)
+    if len(kwargs) != len(pk) or not all(c in kwargs for c in pk):
+        return None
+    key = tuple(kwargs[c] for c in pk)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _related_caches(cls: type) -> list[_DocumentCache]:
+    # A polymorphic hierarchy shares one table, so a write through any class
+    # of it may change what any other class of it reads.
+    return [cache for klass, cache in list(_caches.items()) if issubclass(klass, cls) or issubclass(cls, klass)]
+
+
+def _invalidate(doc: Any) -> None:
+    """Drop *doc*'s primary key from the read caches of its hierarchy."""
+    if not _caches:
+        return
+    caches = _related_caches(type(doc))
+    if caches:
+        key = _doc_key(doc)
+        for cache in caches:
+            cache.invalidate(key)
+
+
+def _clear_caches(cls: type) -> None:
+    """Clear the read caches of *cls*'s hierarchy (after a multi-row write)."""
+    if _caches:
+        for cache in _related_caches(cls):
+            cache.clear()
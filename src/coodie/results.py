@@ -28,3 +28,40 @@ class PagedResult:
 
     data: list[Any] = field(default_factory=list)
     paging_state: bytes | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class ExecutionResult:
+    """Outcome of one statement sent through a bulk/concurrent driver call.
+
+    Returned (one per input statement, in input order) by
+    :meth:`~coodie.drivers.base.AbstractDriver.execute_concurrent` and
+    :meth:`~coodie.drivers.base.AbstractDriver.execute_many`.  A failed
+    statement does not abort the others; its exception is stored in
+    ``error`` instead.
+    """
+
+    success: bool
+    rows: list[dict[str, Any]] = field(default_factory=list)
+    error: BaseException | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class BatchResult:
+    """Outcome of one sub-batch sent by a :class:`~coodie.batch.BatchWriter`.
+
+    Failed deferred writes are reported to the
+    :class:`~coodie.write_behind.WriteBehindQueue` ``on_error`` callback in
+    the same form.
+
+    ``statements`` are the ``(cql, params)`` pairs of the sub-batch and
+    ``partition_key`` the key they were grouped under (``None`` for
+    statements added without one).  A failed sub-batch does not stop the
+    others; its exception is stored in ``error``.
+    """
+
+    success: bool
+    statements: list[tuple[str, list[Any]]] = field(default_factory=list)
+    partition_key: Any = None
+    rows: list[dict[str, Any]] = field(default_factory=list)
+    error: BaseException | None = None
@@ -0,0 +1,126 @@
+"""Token-range scan pipeline shared by ``QuerySet.scan()`` and data migrations.
+
+A scan walks a list of ``(lo, hi]`` token ranges.  Up to *parallelism*
+ranges are in flight at once, each paging through its own rows; pages are
+handed back strictly in range order, so a consumer can checkpoint on the
+end token of every completed range and resume from it later.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any
+
+# ``(rows, paging_state)``; the rows of a page are passed through untouched.
+Page = tuple[Any, bytes | None]
+
+# Fetched-but-unconsumed pages buffered per range.  Together with the
+# parallelism this bounds memory to roughly
+# ``parallelism * (_MAX_BUFFERED_PAGES + 1) * fetch_size`` rows.
+_MAX_BUFFERED_PAGES = 2
+
+
+class _RangeCursor:
+    """Paging progress of one token range."""
+
+    __slots__ = ("end", "exhausted", "pages", "paging_state", "pending", "start")
+
+    def __init__(self, start: int, end: int) -> None:
+        self.start = start
+        self.end = end
+        self.paging_state: bytes | None = None
+        self.pages: deque[Any] = deque()
+        self.pending: Any = None
+        self.exhausted = False
+
+    def wants_page(self) -> bool:
+        return self.pending is None and not self.exhausted and len(self.pages) < _MAX_BUFFERED_PAGES
+
+    def receive(self, page: Page) -> None:
+        rows, self.paging_state = page
+        self.pending = None
+        self.pages.append(rows)
+        if self.paging_state is None:
+            self.exhausted = True
+
+
+def _take_head(active: deque[_RangeCursor]) -> tuple[Any, int | None]:
+    """Pop the next page of the head range; report its end token once the range is complete."""
+    head = active[0]
+    rows = head.pages.popleft()
+    if head.exhausted and not head.pages:
+        active.popleft()
+        return rows, head.end
+    return rows, None
+
+
+def scan_token_ranges(
+    fetch_page: Callable[[int, int, bytes | None], Page],
+    ranges: list[tuple[int, int]],
+    parallelism: int,
+) -> Iterator[tuple[Any, int | None]]:
+    """Yield ``(rows, completed_token)`` for every page of *ranges*, in range order.
+
+    ``fetch_page(lo, hi, paging_state)`` returns one page of the range and
+    the paging state of the next one.  *completed_token* is the range's
+    end token on its last page and ``None`` otherwise.  Pages are fetched
+    on a pool of *parallelism* threads.
+    """
+    parallelism = max(1, parallelism)
+    todo = iter(ranges)
+    active: deque[_RangeCursor] = deque()
+    with ThreadPoolExecutor(max_workers=parallelism, thread_name_prefix="coodie-scan") as pool:
+        try:
+            while True:
+                while len(active) < parallelism and (nxt := next(todo, None)) is not None:
+                    active.append(_RangeCursor(*nxt))
+                if not active:
+                    return
+                for cursor in active:
+                    if cursor.pending is not None and cursor.pending.done():
+                        cursor.receive(cursor.pending.result())
+                    if cursor.wants_page():
+                        cursor.pending = pool.submit(fetch_page, cursor.start, cursor.end, cursor.paging_state)
+                if active[0].pages:
+                    yield _take_head(active)
+                else:
+                    wait([c.pending for c in active if c.pending is not None], return_when=FIRST_COMPLETED)
+        finally:
+            for cursor in active:
+                if cursor.pending is not None:
+                    cursor.pending.cancel()
+
+
+async def scan_token_ranges_async(
+    fetch_page: Callable[[int, int, bytes | None], Awaitable[Page]],
+    ranges: list[tuple[int, int]],
+    parallelism: int,
+) -> AsyncIterator[tuple[Any, int | None]]:
+    """Async version of :func:`scan_token_ranges`; pages are fetched as concurrent tasks."""
+    parallelism = max(1, parallelism)
+    todo = iter(ranges)
+    active: deque[_RangeCursor] = deque()
+    try:
+        while True:
+            while len(active) < parallelism and (nxt := next(todo, None)) is not None:
+                active.append(_RangeCursor(*nxt))
+            if not active:
+                return
+            for cursor in active:
+                if cursor.pending is not None and cursor.pending.done():
+                    cursor.receive(cursor.pending.result())
+                if cursor.wants_page():
+                    cursor.pending = asyncio.ensure_future(fetch_page(cursor.start, cursor.end, cursor.paging_state))
+            if active[0].pages:
+                yield _take_head(active)
+            else:
+                await asyncio.wait(
+                    [c.pending for c in active if c.pending is not None], return_when=asyncio.FIRST_COMPLETED
+                )
+    finally:
+        for cursor in active:
+            if cursor.pending is not None:
+                cursor.pending.cancel()
@@ -221,6 +221,18 @@ def _pk_columns(doc_cls: type) -> tuple[str, ...]:
     return tuple(c.name for c in schema if c.primary_key or c.clustering_key)
 
 
+@functools.lru_cache(maxsize=128)
+def _partition_key_columns(doc_cls: type) -> tuple[str, ...]:
+    """Return partition key column names in ``partition_key_index`` order, cached per class.
+
+    Used to group rows that land on the same partition (e.g. by
+    ``bulk_save()``).
+    """
+    schema = build_schema(doc_cls)
+    pk_cols = sorted((c for c in schema if c.primary_key), key=lambda c: c.partition_key_index)
+    return tuple(c.name for c in pk_cols)
+
+
 # ------------------------------------------------------------------
 # Polymorphic (single-table inheritance) helpers
 # ------------------------------------------------------------------
@@ -297,3 +309,21 @@ def _build_subclass_map(base_cls: type) -> dict[str, type]:
     for sub in base_cls.__subclasses__():
         result.update(_build_subclass_map(sub))
     return result
+
+
+# ``{discriminator_value: cls}`` per polymorphic base, dropped whenever a new
+# document class is defined (``Document.__pydantic_init_subclass__``) since it
+# may add a value to a hierarchy.
+_subclass_maps: dict[type, dict[str, type]] = {}
+
+
+def _subclass_map(base_cls: type) -> dict[str, type]:
+    """Cached :func:`_build_subclass_map`."""
+    result = _subclass_maps.get(base_cls)
+    if result is None:
+        result = _subclass_maps[base_cls] = _build_subclass_map(base_cls)
+    return result
+
+
+def _forget_subclass_maps() -> None:
+    _subclass_maps.clear()
@@ -4,7 +4,7 @@ from typing import Any
 
 from coodie.sync.document import Document, CounterDocument, MaterializedView
 from coodie.sync.query import QuerySet
-from coodie.batch import BatchQuery
+from coodie.batch import BatchQuery, BatchWriter
 from coodie.drivers import init_coodie
 
 
@@ -83,6 +83,7 @@ __all__ = [
     "MaterializedView",
     "QuerySet",
     "BatchQuery",
+    "BatchWriter",
     "init_coodie",
     "execute_raw",
     "create_keyspace",
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import warnings
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, ClassVar, TYPE_CHECKING
 
 from pydantic import BaseModel
 
 from coodie.cql_builder import (
-    build_insert_from_columns,
     build_insert_json,
     build_delete,
     build_update,
@@ -15,7 +16,6 @@ from coodie.cql_builder import (
     build_truncate,
     build_create_materialized_view,
     build_drop_materialized_view,
-    parse_update_kwargs,
 )
 
 from coodie.exceptions import (
@@ -23,21 +23,24 @@ from coodie.exceptions import (
     MultipleDocumentsFound,
     InvalidQueryError,
 )
-from coodie.results import LWTResult
+from coodie.drivers.base import _DEFAULT_CONCURRENCY, _dicts_to_tuples
+from coodie.lookups import check_conditions, compile_updates
+from coodie.plan import _StatementPlan, _statement_plan
+from coodie.read_cache import _clear_caches, _document_cache, _invalidate, _lookup_key
+from coodie.cache import CacheInfo
+from coodie.results import ExecutionResult, LWTResult
 
 if TYPE_CHECKING:
-    from coodie.batch import BatchQuery
+    from coodie.batch import BatchQuery, BatchWriter
 from coodie.schema import (
     build_schema,
     ColumnDefinition,
     _find_discriminator_column,
+    _forget_subclass_maps,
     _get_discriminator_value,
-    _insert_columns,
-    _pk_columns,
     _resolve_polymorphic_base,
-    _vector_columns,
 )
-from coodie.sync.query import QuerySet, _snake_case
+from coodie.sync.query import QuerySet, _build_docs, _snake_case
 
 
 class Document(BaseModel):
@@ -49,6 +52,12 @@ class Document(BaseModel):
         name: str = ""
         keyspace: str = ""
 
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        # The new class may add a discriminator value to a polymorphic hierarchy.
+        _forget_subclass_maps()
+
     # ------------------------------------------------------------------
     # Schema / table helpers
     # ------------------------------------------------------------------
@@ -130,7 +139,7 @@ class Document(BaseModel):
         if settings and getattr(settings, "__abstract__", False):
             return []
         schema = cls._schema()
-        return cls._get_driver().sync_table(
+        planned = cls._get_driver().sync_table(
             cls._get_table(),
             cls._get_keyspace(),
             schema,
@@ -138,6 +147,11 @@ class Document(BaseModel):
             dry_run=dry_run,
             drop_removed_indexes=drop_removed_indexes,
         )
+        if not dry_run:
+            # Compile the write-path statement plan up front so the first
+            # save() does not pay for it.
+            _statement_plan(cls)
+        return planned
 
     @classmethod
     def table_name(cls) -> str:
@@ -149,12 +163,14 @@ class Document(BaseModel):
         """Drop the table for this model."""
         cql = build_drop_table(cls._get_table(), cls._get_keyspace())
         cls._get_driver().execute(cql, [])
+        _clear_caches(cls)
 
     @classmethod
     def truncate(cls) -> None:
         """Truncate (remove all rows from) the table for this model."""
         cql = build_truncate(cls._get_table(), cls._get_keyspace())
         cls._get_driver().execute(cql, [])
+        _clear_caches(cls)
 
     @classmethod
     def create(cls, **kwargs: Any) -> Document:
@@ -173,32 +189,17 @@ class Document(BaseModel):
         timestamp: int | None = None,
         consistency: str | None = None,
         timeout: float | None = None,
-        batch: BatchQuery | None = None,
+        batch: BatchQuery | BatchWriter | None = None,
     ) -> None:
         """Insert (upsert) this document."""
-        cls = self.__class__
-        for vec_name, vec_dims in _vector_columns(cls):
-            val = getattr(self, vec_name, None)
-            if val is not None and len(val) != vec_dims:
-                raise InvalidQueryError(f"Vector field '{vec_name}' expects {vec_dims} dimensions, got {len(val)}")
-        columns = _insert_columns(cls)
-        values = [getattr(self, c) for c in columns]
-        disc_col = _find_discriminator_column(cls)
-        disc_val = _get_discriminator_value(cls)
-        if disc_col and disc_val:
-            values[columns.index(disc_col)] = disc_val
-        cql, params = build_insert_from_columns(
-            cls._get_table(),
-            cls._get_keyspace(),
-            columns,
-            values,
-            ttl=ttl,
-            timestamp=timestamp,
-        )
+        plan = _statement_plan(self.__class__)
+        params = plan.insert_values(self)
+        cql = plan.insert_statement(ttl=ttl, timestamp=timestamp)
         if batch is not None:
-            batch.add(cql, params)
+            batch.add(cql, params, partition_key=plan.partition_of(self), doc=self)
         else:
-            cls._get_driver().execute(cql, params, consistency=consistency, timeout=timeout)
+            plan.driver.execute(cql, params, consistency=consistency, timeout=timeout)
+            _invalidate(self)
 
     def save_json(
         self,
@@ -220,6 +221,7 @@ class Document(BaseModel):
             timestamp=timestamp,
         )
         cls._get_driver().execute(cql, params, consistency=consistency, timeout=timeout)
+        _invalidate(self)
 
     def insert(
         self,
@@ -227,33 +229,79 @@ class Document(BaseModel):
         timestamp: int | None = None,
         consistency: str | None = None,
         timeout: float | None = None,
-        batch: BatchQuery | None = None,
+        batch: BatchQuery | BatchWriter | None = None,
     ) -> None:
         """Insert IF NOT EXISTS (create-only)."""
-        cls = self.__class__
-        for vec_name, vec_dims in _vector_columns(cls):
-            val = getattr(self, vec_name, None)
-            if val is not None and len(val) != vec_dims:
-                raise InvalidQueryError(f"Vector field '{vec_name}' expects {vec_dims} dimensions, got {len(val)}")
-        columns = _insert_columns(cls)
-        values = [getattr(self, c) for c in columns]
-        disc_col = _find_discriminator_column(cls)
-        disc_val = _get_discriminator_value(cls)
-        if disc_col and disc_val:
-            values[columns.index(disc_col)] = disc_val
-        cql, params = build_insert_from_columns(
-            cls._get_table(),
-            cls._get_keyspace(),
-            columns,
-            values,
+        plan = _statement_plan(self.__class__)
+        params = plan.insert_values(self)
+        cql = plan.insert_statement(ttl=ttl, timestamp=timestamp, if_not_exists=True)
+        if batch is not None:
+            batch.add(cql, params, partition_key=plan.partition_of(self), doc=self)
+        else:
+            plan.driver.execute(cql, params, consistency=consistency, timeout=timeout)
+            _invalidate(self)
+
+    @classmethod
+    def bulk_save(
+        cls,
+        docs: Iterable[Document],
+        concurrency: int = _DEFAULT_CONCURRENCY,
+        ttl: int | None = None,
+        timestamp: int | None = None,
+        consistency: str | None = None,
+        timeout: float | None = None,
+        batch_by_partition: bool = True,
+    ) -> list[ExecutionResult]:
+        """Insert (upsert) many documents through a bounded concurrent pipeline.
+
+        Rows sharing a partition key are grouped into ``UNLOGGED`` batches
+        when *batch_by_partition* is ``True``; everything else is sent as
+        individual prepared INSERTs with at most *concurrency* requests in
+        flight.  Failures do not abort the run — inspect the returned
+        :class:`~coodie.results.ExecutionResult` list (one entry per
+        document, in input order; rows of one batch share its result)
+        instead.
+
+        Example::
+
+            results = Product.bulk_save(products, concurrency=64)
+            failed = [doc for doc, r in zip(products, results) if not r.success]
+        """
+        docs = list(docs)
+        requests, positions = _bulk_insert_statements(
+            docs,
             ttl=ttl,
-            if_not_exists=True,
             timestamp=timestamp,
+            batch_by_partition=batch_by_partition,
         )
-        if batch is not None:
-            batch.add(cql, params)
-        else:
-            cls._get_driver().execute(cql, params, consistency=consistency, timeout=timeout)
+        results = _execute_bulk(cls._get_driver(), requests, concurrency, consistency, timeout)
+        for doc in docs:
+            _invalidate(doc)
+        return _per_document(results, positions)
+
+    @classmethod
+    def bulk_insert(
+        cls,
+        docs: Iterable[Document],
+        concurrency: int = _DEFAULT_CONCURRENCY,
+        ttl: int | None = None,
+        timestamp: int | None = None,
+        consistency: str | None = None,
+        timeout: float | None = None,
+    ) -> list[ExecutionResult]:
+        """Insert IF NOT EXISTS many documents through a bounded concurrent pipeline.
+
+        Each row is its own lightweight transaction, so rows are never
+        batched; the ``[applied]`` row of each insert is available in
+        :attr:`~coodie.results.ExecutionResult.rows`, one result per
+        document in input order.
+        """
+        docs = list(docs)
+        requests, positions = _bulk_insert_statements(docs, ttl=ttl, timestamp=timestamp, if_not_exists=True)
+        results = _execute_bulk(cls._get_driver(), requests, concurrency, consistency, timeout)
+        for doc in docs:
+            _invalidate(doc)
+        return _per_document(results, positions)
 
     def delete_columns(
         self,
@@ -261,7 +309,7 @@ class Document(BaseModel):
         timestamp: int | None = None,
         consistency: str | None = None,
         timeout: float | None = None,
-        batch: BatchQuery | None = None,
+        batch: BatchQuery | BatchWriter | None = None,
         collection_elements: list[tuple[str, Any]] | None = None,
     ) -> None:
         """Set one or more non-primary-key columns to null for this document.
@@ -287,20 +335,20 @@ class Document(BaseModel):
             UserWarning,
             stacklevel=2,
         )
-        pk_names = _pk_columns(self.__class__)
-        where = [(c, "=", getattr(self, c)) for c in pk_names]
+        plan = _statement_plan(self.__class__)
         cql, params = build_delete(
-            self.__class__._get_table(),
-            self.__class__._get_keyspace(),
-            where,
+            plan.table,
+            plan.keyspace,
+            plan.pk_where(self),
             columns=list(column_names) if column_names else None,
             timestamp=timestamp,
             collection_elements=collection_elements,
         )
         if batch is not None:
-            batch.add(cql, params)
+            batch.add(cql, params, partition_key=plan.partition_of(self), doc=self)
         else:
-            self.__class__._get_driver().execute(cql, params, consistency=consistency, timeout=timeout)
+            plan.driver.execute(cql, params, consistency=consistency, timeout=timeout)
+            _invalidate(self)
 
     def delete(
         self,
@@ -309,7 +357,7 @@ class Document(BaseModel):
         timestamp: int | None = None,
         consistency: str | None = None,
         timeout: float | None = None,
-        batch: BatchQuery | None = None,
+        batch: BatchQuery | BatchWriter | None = None,
     ) -> LWTResult | None:
         """Delete this document by its primary key.
 
@@ -321,22 +369,26 @@ class Document(BaseModel):
         returned.  Operator suffixes like ``col__ne``, ``col__gt``, ``col__in``
         are supported.
         """
-        pk_names = _pk_columns(self.__class__)
-        where = [(c, "=", getattr(self, c)) for c in pk_names]
-        cql, params = build_delete(
-            self.__class__._get_table(),
-            self.__class__._get_keyspace(),
-            where,
-            if_exists=if_exists,
-            if_conditions=if_conditions,
-            timestamp=timestamp,
-        )
+        plan = _statement_plan(self.__class__)
+        if not if_exists and not if_conditions and timestamp is None:
+            cql, params = plan.delete_cql, plan.pk_values(self)
+        else:
+            check_conditions(self.__class__, if_conditions)
+            cql, params = build_delete(
+                plan.table,
+                plan.keyspace,
+                plan.pk_where(self),
+                if_exists=if_exists,
+                if_conditions=if_conditions,
+                timestamp=timestamp,
+            )
 
         if batch is not None:
-            batch.add(cql, params)
+            batch.add(cql, params, partition_key=plan.partition_of(self), doc=self)
             return None
 
-        rows = self.__class__._get_driver().execute(cql, params, consistency=consistency, timeout=timeout)
+        rows = plan.driver.execute(cql, params, consistency=consistency, timeout=timeout)
+        _invalidate(self)
         if if_exists or if_conditions:
             return _parse_lwt_result(rows)
         return None
@@ -358,30 +410,30 @@ class Document(BaseModel):
         includes a lightweight-transaction clause and a
         :class:`~coodie.results.LWTResult` is returned.
         """
-        set_data, collection_ops = parse_update_kwargs(kwargs)
+        set_data, collection_ops = compile_updates(self.__class__, kwargs)
+        check_conditions(self.__class__, if_conditions)
 
         if not set_data and not collection_ops:
             return None
 
-        pk_names = _pk_columns(self.__class__)
-        where = [(c, "=", getattr(self, c)) for c in pk_names]
-
+        plan = _statement_plan(self.__class__)
         cql, params = build_update(
-            self.__class__._get_table(),
-            self.__class__._get_keyspace(),
-            set_data=set_data,
-            where=where,
+            plan.table,
+            plan.keyspace,
+            set_data=plan.update_values(set_data),
+            where=plan.pk_where(self),
             ttl=ttl,
             if_conditions=if_conditions,
             if_exists=if_exists,
             collection_ops=collection_ops or None,
         )
-        rows = self.__class__._get_driver().execute(cql, params)
+        rows = plan.driver.execute(cql, params)
 
         # Update in-memory model fields for regular set assignments
         for k, v in set_data.items():
             if hasattr(self, k):
                 object.__setattr__(self, k, v)
+        _invalidate(self)
 
         if if_conditions or if_exists:
             return _parse_lwt_result(rows)
@@ -405,11 +457,42 @@ class Document(BaseModel):
 
     @classmethod
     def find_one(cls, **kwargs: Any) -> Document | None:
-        """Return a single document or None."""
+        """Return a single document or None.
+
+        A lookup by the full primary key is served from the read cache when
+        ``Settings.__cache__`` is set (see :mod:`coodie.read_cache`).
+        """
+        cache = _document_cache(cls)
+        if cache is not None:
+            key = _lookup_key(cls, kwargs)
+            if key is not None:
+                return cache.get_or_load(key, lambda: cls._find_one(kwargs))
+        return cls._find_one(kwargs)
+
+    @classmethod
+    def _find_one(cls, kwargs: dict[str, Any]) -> Document | None:
+        plan = _statement_plan(cls)
+        if kwargs.keys() == plan.key_set:
+            return cls._find_by_pk(plan, kwargs)
         results = cls.find(**kwargs).limit(2).all()
         if len(results) > 1:
             raise MultipleDocumentsFound(f"Expected one {cls.__name__} but found multiple matching {kwargs}")
-        return results[0] if results else None
+        return results[0] if results else None  # type: ignore[return-value]
+
+    @classmethod
+    def _find_by_pk(cls, plan: _StatementPlan, pk: dict[str, Any]) -> Document | None:
+        """Fetch the row whose full primary key is *pk* with the prepared SELECT-by-PK.
+
+        A full-key lookup matches at most one row, so there is no QuerySet,
+        no ``LIMIT 2`` duplicate probe and no filter parsing.
+        """
+        columns, rows = plan.driver.execute_tuples(plan.select_by_pk_cql, [pk[c] for c in plan.key_columns])
+        if not rows:
+            return None
+        use_construct = not getattr(plan.driver, "needs_row_validation", False)
+        doc = _build_docs(cls, columns, rows[:1], use_construct)[0]
+        # A polymorphic subclass only sees rows of its own type.
+        return doc if isinstance(doc, cls) else None
 
     @classmethod
     def get(cls, **kwargs: Any) -> Document:
@@ -419,6 +502,96 @@ class Document(BaseModel):
             raise DocumentNotFound(f"No {cls.__name__} found matching {kwargs}")
         return result
 
+    @classmethod
+    def get_many(
+        cls,
+        keys: Iterable[Any],
+        concurrency: int = _DEFAULT_CONCURRENCY,
+        consistency: str | None = None,
+        timeout: float | None = None,
+    ) -> list[Document | None]:
+        """Fetch many documents by primary key, one single-partition query per key.
+
+        Each key is a ``{column: value}`` dict, a tuple in primary-key
+        order or, for a single-column key, the bare value.  Every lookup
+        reuses the prepared SELECT-by-PK and at most *concurrency* run at
+        once, so each goes straight to a replica of its partition instead of
+        one coordinator fanning out an ``IN (...)`` query.  Returns one entry
+        per key in input order — ``None`` where no row exists; repeated keys
+        are fetched once.
+
+        Example::
+
+            products = Product.get_many(ids, concurrency=64)
+        """
+        plan = _statement_plan(cls)
+        unique, positions = _unique_keys(plan.key_params(key) for key in keys)
+        if not unique:
+            return []
+        results = plan.driver.execute_many(
+            plan.select_by_pk_cql, unique, concurrency=concurrency, consistency=consistency, timeout=timeout
+        )
+        docs = _docs_by_key(cls, plan, results)
+        return [docs[pos] for pos in positions]
+
+    @classmethod
+    def get_by_pk(cls, **pk: Any) -> Document:
+        """Return the document with primary key *pk*; raise DocumentNotFound if missing.
+
+        *pk* must name every partition and clustering key column and nothing
+        else.  This is what ``get()`` does for such keyword arguments;
+        ``get_by_pk()`` makes the full-key lookup explicit and rejects
+        anything else with :class:`~coodie.exceptions.InvalidQueryError`.
+        """
+        plan = _statement_plan(cls)
+        if pk.keys() != plan.key_set:
+            raise InvalidQueryError(
+                f"{cls.__name__}.get_by_pk() takes exactly the primary key columns {list(plan.key_columns)}, "
+                f"got {sorted(pk)}"
+            )
+        return cls.get(**pk)
+
+    @classmethod
+    def cache_info(cls) -> CacheInfo | None:
+        """Return the read cache's hit/miss counters, or ``None`` when ``Settings.__cache__`` is not set."""
+        cache = _document_cache(cls)
+        return cache.info() if cache is not None else None
+
+    @classmethod
+    def cache_clear(cls) -> None:
+        """Drop every document from the read cache (no-op without ``Settings.__cache__``)."""
+        cache = _document_cache(cls)
+        if cache is not None:
+            cache.clear()
+
+    @classmethod
+    def ann_search_many(
+        cls,
+        column: str,
+        vectors: Iterable[Any],
+        limit: int = 10,
+        concurrency: int = _DEFAULT_CONCURRENCY,
+        **kwargs: Any,
+    ) -> list[list[Document]]:
+        """Return the *limit* nearest documents to each vector in *vectors*.
+
+        Shorthand for ``find(**kwargs).limit(limit).ann_search_many(column,
+        vectors, concurrency)``: one prepared ANN query per vector, at most
+        *concurrency* in flight, results aligned to *vectors*.
+
+        Example::
+
+            per_vector = Product.ann_search_many("embedding", vectors, limit=5)
+            top = merge_ann_results(per_vector, limit=5)
+        """
+        return (
+            cls.find(**kwargs)
+            .limit(limit)
+            .ann_search_many(  # type: ignore[return-value]
+                column, vectors, concurrency
+            )
+        )
+
     model_config = {
         "arbitrary_types_allowed": True,
         "revalidate_instances": "never",
@@ -452,17 +625,20 @@ class CounterDocument(Document):
     ) -> None:
         raise InvalidQueryError("Counter tables do not support insert(). Use increment() or decrement() instead.")
 
+    @classmethod
+    def bulk_save(cls, docs: Iterable[Document], **kwargs: Any) -> list[ExecutionResult]:  # type: ignore[override]
+        raise InvalidQueryError("Counter tables do not support bulk_save(). Use increment() or decrement() instead.")
+
+    @classmethod
+    def bulk_insert(cls, docs: Iterable[Document], **kwargs: Any) -> list[ExecutionResult]:  # type: ignore[override]
+        raise InvalidQueryError("Counter tables do not support bulk_insert(). Use increment() or decrement() instead.")
+
     def _counter_update(self, deltas: dict[str, int]) -> None:
         """Execute a counter UPDATE with the given deltas."""
-        pk_names = _pk_columns(self.__class__)
-        where = [(c, "=", getattr(self, c)) for c in pk_names]
-        cql, params = build_counter_update(
-            self.__class__._get_table(),
-            self.__class__._get_keyspace(),
-            deltas,
-            where,
-        )
-        self.__class__._get_driver().execute(cql, params)
+        plan = _statement_plan(self.__class__)
+        cql, params = build_counter_update(plan.table, plan.keyspace, deltas, plan.pk_where(self))
+        plan.driver.execute(cql, params)
+        _invalidate(self)
 
     def increment(self, **field_deltas: int) -> None:
         """Increment counter columns by the given amounts.
@@ -494,6 +670,148 @@ def _parse_lwt_result(rows: list[dict[str, Any]]) -> LWTResult:
     return LWTResult(applied=applied, existing=existing)
 
 
+#: Upper bound on the number of rows folded into a single UNLOGGED batch by
+#: ``bulk_save()``.  Large single-partition batches trip Cassandra's
+#: ``batch_size_fail_threshold``; chunking keeps them well under it.
+_BULK_BATCH_MAX_ROWS = 50
+
+
+def _unique_keys(key_params: Iterable[list[Any]]) -> tuple[list[list[Any]], list[int]]:
+    """Return the distinct bind-value lists of *key_params* and each input's position among them."""
+    unique: list[list[Any]] = []
+    positions: list[int] = []
+    seen: dict[tuple[Any, ...], int] = {}
+    for params in key_params:
+        try:
+            pos = seen.setdefault(tuple(params), len(unique))
+        except TypeError:
+            # Unhashable key values (e.g. frozen collections given as lists).
+            pos = len(unique)
+        if pos == len(unique):
+            unique.append(params)
+        positions.append(pos)
+    return unique, positions
+
+
+def _docs_by_key(cls: Any, plan: _StatementPlan, results: list[ExecutionResult]) -> list[Any]:
+    """Hydrate one ``get_many()`` SELECT-by-PK result per key, ``None`` for a missing row."""
+    use_construct = not getattr(plan.driver, "needs_row_validation", False)
+    docs: list[Any] = []
+    for result in results:
+        if not result.success:
+            assert result.error is not None
+            raise result.error
+        doc = None
+        if result.rows:
+            columns, rows = _dicts_to_tuples(result.rows[:1])
+            doc = _build_docs(cls, columns, rows, use_construct)[0]
+            if not isinstance(doc, cls):
+                doc = None
+        docs.append(doc)
+    return docs
+
+
+def _bulk_insert_statements(
+    docs: Iterable[Any],
+    ttl: int | None = None,
+    timestamp: int | None = None,
+    if_not_exists: bool = False,
+    batch_by_partition: bool = True,
+) -> tuple[list[list[tuple[str, list[Any]]]], list[list[int]]]:
+    """Build the requests of ``bulk_save()`` / ``bulk_insert()``: lists of ``(cql, params)`` pairs.
+
+    Returns ``(requests, positions)``; ``positions[i]`` holds the indexes in
+    *docs* of the rows request ``i`` writes.
+
+    The statement plan and INSERT CQL are resolved once per concrete
+    document class rather than once per row.  A request holding one pair is
+    a lone INSERT; when *batch_by_partition* is ``True``, rows sharing a
+    partition key are folded into requests of at most
+    :data:`_BULK_BATCH_MAX_ROWS` rows, sent as ``UNLOGGED`` batches —
+    single-partition unlogged batches are applied atomically by the replica
+    and cost one round trip instead of one per row.
+    """
+    plans: dict[type, tuple[_StatementPlan, str]] = {}
+    groups: dict[Any, list[tuple[int, tuple[str, list[Any]]]]] = {}
+    for position, doc in enumerate(docs):
+        cls = type(doc)
+        entry = plans.get(cls)
+        if entry is None:
+            plan = _statement_plan(cls)
+            entry = plans[cls] = (
+                plan,
+                plan.insert_statement(ttl=ttl, timestamp=timestamp, if_not_exists=if_not_exists),
+            )
+        plan, cql = entry
+        values = plan.insert_values(doc)
+        key: Any = position
+        if batch_by_partition and not if_not_exists:
+            key = plan.partition_of(doc)
+            try:
+                hash(key)
+            except TypeError:
+                # Unhashable partition key values (e.g. frozen collections
+                # given as lists) cannot be grouped; send the row on its own.
+                key = position
+        groups.setdefault(key, []).append((position, (cql, values)))
+
+    requests: list[list[tuple[str, list[Any]]]] = []
+    positions: list[list[int]] = []
+    for group in groups.values():
+        for start in range(0, len(group), _BULK_BATCH_MAX_ROWS):
+            chunk = group[start : start + _BULK_BATCH_MAX_ROWS]
+            requests.append([statement for _, statement in chunk])
+            positions.append([position for position, _ in chunk])
+    return requests, positions
+
+
+def _per_document(results: list[ExecutionResult], positions: list[list[int]]) -> list[ExecutionResult]:
+    """Spread one result per request back over the documents it wrote, in input order."""
+    per_doc = [ExecutionResult(success=False)] * sum(map(len, positions))
+    for result, members in zip(results, positions):
+        for position in members:
+            per_doc[position] = result
+    return per_doc
+
+
+def _execute_bulk(
+    driver: Any,
+    requests: list[list[tuple[str, list[Any]]]],
+    concurrency: int,
+    consistency: str | None,
+    timeout: float | None,
+) -> list[ExecutionResult]:
+    """Send the requests of :func:`_bulk_insert_statements`; return one result per request, in order.
+
+    Batches go through the driver's native ``execute_batch()``, so each
+    member reuses the prepared single-row INSERT, on up to *concurrency*
+    threads; lone INSERTs are then pipelined through ``execute_concurrent()``.
+    """
+    results = [ExecutionResult(success=False)] * len(requests)
+    batches = [i for i, request in enumerate(requests) if len(request) > 1]
+    singles = [i for i, request in enumerate(requests) if len(request) == 1]
+
+    def send(statements: list[tuple[str, list[Any]]]) -> ExecutionResult:
+        try:
+            rows = driver.execute_batch(statements, logged=False, consistency=consistency, timeout=timeout)
+        except Exception as exc:  # noqa: BLE001
+            return ExecutionResult(success=False, error=exc)
+        return ExecutionResult(success=True, rows=rows)
+
+    if batches:
+        workers = min(max(1, concurrency), len(batches))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="coodie-bulk") as pool:
+            for index, result in zip(batches, pool.map(send, (requests[i] for i in batches))):
+                results[index] = result
+    if singles:
+        sent = driver.execute_concurrent(
+            [requests[i][0] for i in singles], concurrency=concurrency, consistency=consistency, timeout=timeout
+        )
+        for index, result in zip(singles, sent):
+            results[index] = result
+    return results
+
+
 class MaterializedView(Document):
     """Base class for synchronous materialized view documents (read-only).
 
@@ -573,6 +891,14 @@ class MaterializedView(Document):
     def insert(self, **kwargs: Any) -> None:  # type: ignore[override]
         raise InvalidQueryError("Materialized views are read-only. Use the base table to write data.")
 
+    @classmethod
+    def bulk_save(cls, docs: Iterable[Document], **kwargs: Any) -> list[ExecutionResult]:  # type: ignore[override]
+        raise InvalidQueryError("Materialized views are read-only. Use the base table to write data.")
+
+    @classmethod
+    def bulk_insert(cls, docs: Iterable[Document], **kwargs: Any) -> list[ExecutionResult]:  # type: ignore[override]
+        raise InvalidQueryError("Materialized views are read-only. Use the base table to write data.")
+
     def delete(self, **kwargs: Any) -> LWTResult | None:  # type: ignore[override]
         raise InvalidQueryError("Materialized views are read-only. Use the base table to write data.")
 
@@ -1,3 +1,4 @@
+import array
 import functools
 import re
 import typing
@@ -225,6 +226,58 @@ def _collection_fields(cls: type) -> dict[str, type]:
     return result
 
 
+# ------------------------------------------------------------------
+# Vector buffers
+# ------------------------------------------------------------------
+
+
+def _is_vector_buffer(value: Any) -> bool:
+    """Return ``True`` for the float buffers a ``Vector`` field keeps as-is.
+
+    These are ``numpy.ndarray`` (anything exposing ``__array_interface__``),
+    ``array.array`` and ``memoryview``.
+    """
+    return isinstance(value, (array.array, memoryview)) or hasattr(value, "__array_interface__")
+
+
+def _vector_to_list(value: Any) -> Any:
+    """Return *value* as the ``list[float]`` the drivers serialise.
+
+    Buffers are converted by their own C-level ``tolist()``; other values
+    are returned unchanged.
+    """
+    if _is_vector_buffer(value):
+        return value.tolist()
+    return value
+
+
+def _to_float32_array(value: Any) -> Any:
+    """Return *value* as a one-dimensional ``float32`` ``numpy.ndarray``.
+
+    float32 arrays and buffers are wrapped without copying.  ``None`` (an
+    empty vector read back from the database) becomes an empty array.
+    """
+    try:
+        import numpy
+    except ImportError as exc:
+        raise ImportError("numpy is required for Vector(as_array=True). Install it with: pip install numpy") from exc
+    if value is None:
+        return numpy.empty(0, dtype=numpy.float32)
+    return numpy.asarray(value, dtype=numpy.float32)
+
+
+@functools.lru_cache(maxsize=128)
+def _array_vector_fields(cls: type) -> frozenset[str]:
+    """Return the names of ``Vector(as_array=True)`` fields of *cls*."""
+    result = set()
+    for name, ann in _cached_type_hints(cls).items():
+        if typing.get_origin(ann) is typing.Annotated and any(
+            isinstance(meta, Vector) and meta.as_array for meta in typing.get_args(ann)[1:]
+        ):
+            result.add(name)
+    return frozenset(result)
+
+
 def coerce_row_none_collections(doc_cls: type, row: dict[str, Any]) -> dict[str, Any]:
     """Replace ``None`` values for collection-typed fields with empty collections.
 
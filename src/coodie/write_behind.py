@@ -0,0 +1,303 @@
+"""Write-behind queue for fire-and-forget saves — ``await doc.save(deferred=True)``.
+
+A deferred save returns as soon as its INSERT is queued.  A background task
+drains the queue through the document's driver: ``execute_async()`` for a
+lone statement, so the prepared INSERT is reused, and one ``UNLOGGED``
+``execute_batch_async()`` when several writes to the same partition are
+waiting, so they are coalesced into a single request.  At most
+*concurrency* requests are in flight, and the writes of one partition are
+sent in order.
+
+``put()`` waits while *max_pending* writes are queued or in flight, which
+pushes back on producers that outrun the cluster.  A failed write is handed
+to *on_error* as a :class:`~coodie.results.BatchResult` (logged by default);
+``flush()`` waits until everything queued so far has been attempted and
+``aclose()`` flushes and stops the queue.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import Callable, Hashable
+from typing import Any, TypedDict
+
+from coodie.drivers.base import _DEFAULT_CONCURRENCY
+from coodie.exceptions import ConfigurationError, InvalidQueryError
+from coodie.read_cache import _invalidate
+from coodie.results import BatchResult
+
+logger = logging.getLogger("coodie")
+
+_DEFAULT_MAX_PENDING = 10_000
+# Most writes coalesced into one batch; matches bulk_save()'s per-partition batches.
+_DEFAULT_MAX_BATCH = 50
+
+
+class _Partition:
+    """Writes waiting for one ``(driver, consistency, timeout, partition key)`` slot."""
+
+    __slots__ = ("consistency", "driver", "entries", "key", "timeout")
+
+    def __init__(self, driver: Any, key: Any, consistency: str | None, timeout: float | None) -> None:
+        self.driver = driver
+        self.key = key
+        self.consistency = consistency
+        self.timeout = timeout
+        self.entries: list[tuple[str, list[Any], Any, int]] = []
+
+
+class WriteBehindQueue:
+    """Bounded queue of writes drained by a background task.
+
+    Example::
+
+        queue = WriteBehindQueue(max_pending=5_000, on_error=failures.append)
+        await queue.put(driver, cql, params, partition_key=key)
+        await queue.flush()  # every write queued so far has been attempted
+    """
+
+    __slots__ = (
+        "_closed",
+        "_concurrency",
+        "_flushes",
+        "_has_space",
+        "_inflight",
+        "_loop",
+        "_max_batch",
+        "_max_pending",
+        "_outstanding",
+        "_partitions",
+        "_pending",
+        "_semaphore",
+        "_sequence",
+        "_tasks",
+        "_wakeup",
+        "_worker",
+        "on_error",
+    )
+
+    def __init__(
+        self,
+        max_pending: int = _DEFAULT_MAX_PENDING,
+        concurrency: int = _DEFAULT_CONCURRENCY,
+        max_batch: int = _DEFAULT_MAX_BATCH,
+        on_error: Callable[[BatchResult], Any] | None = None,
+    ) -> None:
+        if max_pending < 1 or concurrency < 1 or max_batch < 1:
+            raise ConfigurationError("max_pending, concurrency and max_batch must be at least 1")
+        self._max_pending = max_pending
+        self._concurrency = concurrency
+        self._max_batch = max_batch
+        self.on_error = on_error
+        self._partitions: dict[Hashable, _Partition] = {}
+        self._inflight: set[Hashable] = set()
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._pending = 0
+        # put() numbers every write; flush() waits for the numbers below its mark.
+        self._sequence = 0
+        self._outstanding: set[int] = set()
+        self._flushes: list[tuple[int, asyncio.Event]] = []
+        self._closed = False
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._worker: asyncio.Task[None] | None = None
+
+    @property
+    def pending(self) -> int:
+        """Number of writes queued or in flight."""
+        return self._pending
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def _bind_loop(self) -> asyncio.AbstractEventLoop:
+        # Events and the semaphore belong to one event loop; an idle queue
+        # moves to whichever loop uses it next.
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            if self._pending:
+                raise InvalidQueryError("WriteBehindQueue has pending writes on another event loop")
+            self._loop = loop
+            self._wakeup = asyncio.Event()
+            self._has_space = asyncio.Event()
+            self._has_space.set()
+            self._semaphore = asyncio.Semaphore(self._concurrency)
+            self._worker = None
+        return loop
+
+    async def put(
+        self,
+        driver: Any,
+        cql: str,
+        params: list[Any],
+        partition_key: Any = None,
+        consistency: str | None = None,
+        timeout: float | None = None,
+        doc: Any = None,
+    ) -> None:
+        """Queue one statement, waiting while *max_pending* writes are outstanding.
+
+        Statements with equal *partition_key* (and driver, consistency and
+        timeout) may be sent together as one unlogged batch.  *doc*, if
+        given, is dropped from the read cache again once the write is done.
+        """
+        if self._closed:
+            raise InvalidQueryError("WriteBehindQueue is closed")
+        loop = self._bind_loop()
+        while self._pending >= self._max_pending:
+            self._has_space.clear()
+            await self._has_space.wait()
+            if self._closed:
+                raise InvalidQueryError("WriteBehindQueue is closed")
+        slot: Hashable = (driver, consistency, timeout, partition_key)
+        try:
+            hash(slot)
+        except TypeError:
+            slot = object()
+        part = self._partitions.get(slot)
+        if part is None:
+            part = self._partitions[slot] = _Partition(driver, partition_key, consistency, timeout)
+        self._sequence += 1
+        part.entries.append((cql, params, doc, self._sequence))
+        self._outstanding.add(self._sequence)
+        self._pending += 1
+        self._wakeup.set()
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self._drain())
+
+    async def _drain(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            for slot in list(self._partitions):
+                if slot in self._inflight:
+                    continue
+                await self._semaphore.acquire()
+                part = self._partitions[slot]
+                entries = part.entries[: self._max_batch]
+                del part.entries[: self._max_batch]
+                if not part.entries:
+                    del self._partitions[slot]
+                self._inflight.add(slot)
+                task = asyncio.get_running_loop().create_task(self._send(slot, part, entries))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, slot: Hashable, part: _Partition, entries: list[tuple[str, list[Any], Any, int]]) -> None:
+        statements = [(cql, params) for cql, params, _, _ in entries]
+        try:
+            if len(statements) == 1:
+                cql, params = statements[0]
+                await part.driver.execute_async(cql, params, consistency=part.consistency, timeout=part.timeout)
+            else:
+                await part.driver.execute_batch_async(
+                    statements, logged=False, consistency=part.consistency, timeout=part.timeout
+                )
+        except Exception as exc:  # noqa: BLE001
+            self._report(BatchResult(success=False, statements=statements, partition_key=part.key, error=exc))
+        finally:
+            # A read between put() and this write may have cached the old row.
+            for _, _, doc, seq in entries:
+                if doc is not None:
+                    _invalidate(doc)
+                self._outstanding.discard(seq)
+            self._inflight.discard(slot)
+            self._pending -= len(entries)
+            self._semaphore.release()
+            if self._pending < self._max_pending:
+                self._has_space.set()
+            if self._flushes:
+                self._release_flushes()
+            self._wakeup.set()
+
+    def _release_flushes(self) -> None:
+        # Writes finish out of order across partitions: a flush is done once
+        # the oldest unfinished write is newer than its mark.
+        oldest = min(self._outstanding, default=self._sequence + 1)
+        waiting = []
+        for mark, done in self._flushes:
+            if mark < oldest:
+                done.set()
+            else:
+                waiting.append((mark, done))
+        self._flushes = waiting
+
+    def _report(self, result: BatchResult) -> None:
+        if self.on_error is None:
+            logger.error("Deferred write to partition %r failed: %s", result.partition_key, result.error)
+            return
+        try:
+            self.on_error(result)
+        except Exception:
+            logger.exception("WriteBehindQueue on_error callback failed")
+
+    async def flush(self) -> None:
+        """Wait until every write queued so far has been sent or reported as failed.
+
+        Writes queued after the call starts are not waited for, so a busy
+        producer cannot hold ``flush()`` open.
+        """
+        if self._loop is None or not self._outstanding:
+            return
+        done = asyncio.Event()
+        self._flushes.append((self._sequence, done))
+        await done.wait()
+
+    async def aclose(self) -> None:
+        """Reject new writes, flush the queue and stop its background task."""
+        self._closed = True
+        await self.flush()
+        if self._worker is not None:
+            self._worker.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._worker
+            self._worker = None
+
+
+class _QueueOptions(TypedDict, total=False):
+    """Settings of the last :func:`configure_write_behind` call."""
+
+    max_pending: int
+    concurrency: int
+    max_batch: int
+    on_error: Callable[[BatchResult], Any] | None
+
+
+_default: WriteBehindQueue | None = None
+_default_options: _QueueOptions = {}
+
+
+def get_write_behind() -> WriteBehindQueue:
+    """Return the queue used by ``save(deferred=True)``, creating it on first use."""
+    global _default
+    if _default is None or _default.closed:
+        _default = WriteBehindQueue(**_default_options)
+    return _default
+
+
+def configure_write_behind(
+    max_pending: int = _DEFAULT_MAX_PENDING,
+    concurrency: int = _DEFAULT_CONCURRENCY,
+    max_batch: int = _DEFAULT_MAX_BATCH,
+    on_error: Callable[[BatchResult], Any] | None = None,
+) -> WriteBehindQueue:
+    """Replace the queue used by ``save(deferred=True)`` with one built from these settings.
+
+    Raises :class:`~coodie.exceptions.ConfigurationError` if the current
+    queue still has pending writes — ``flush()`` it first.
+    """
+    global _default, _default_options
+    if _default is not None and _default.pending:
+        raise ConfigurationError("The write-behind queue has pending writes; flush() it before reconfiguring")
+    options: _QueueOptions = {
+        "max_pending": max_pending,
+        "concurrency": concurrency,
+        "max_batch": max_batch,
+        "on_error": on_error,
+    }
+    queue = WriteBehindQueue(**options)
+    _default_options = options
+    _default = queue
+    return queue
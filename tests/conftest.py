@@ -5,6 +5,8 @@ from typing import Any
 
 import pytest
 
+from coodie.drivers.base import AbstractDriver
+
 
 async def _maybe_await(fn, *args, **kwargs):
     """Call *fn* and ``await`` the result only when it is awaitable.
@@ -36,8 +38,12 @@ def driver_type(request: pytest.FixtureRequest) -> str:
     return request.config.getoption("--driver-type")
 
 
-class MockDriver:
-    """Records CQL statements and params; returns configured rows."""
+class MockDriver(AbstractDriver):
+    """Records CQL statements and params; returns configured rows.
+
+    Subclasses :class:`AbstractDriver` so the default implementations of the
+    optional driver helpers (bulk execution, paging, …) are available.
+    """
 
     needs_row_validation: bool = False
 
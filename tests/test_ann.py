@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import array
+from typing import Annotated
+from uuid import UUID, uuid4
+
+import pytest
+from pydantic import Field
+
+from coodie.ann import merge_ann_results
+from coodie.exceptions import InvalidQueryError
+from coodie.fields import PrimaryKey, Vector
+from tests.conftest import _maybe_await
+
+
+@pytest.fixture(params=["sync", "async"])
+def variant(request):
+    return request.param
+
+
+@pytest.fixture
+def document_cls(variant):
+    if variant == "sync":
+        from coodie.sync.document import Document
+
+        return Document
+    from coodie.aio.document import Document
+
+    return Document
+
+
+@pytest.fixture
+def Item(document_cls):
+    class Item(document_cls):
+        id: Annotated[UUID, PrimaryKey()] = Field(default_factory=uuid4)
+        category: str = ""
+        embedding: Annotated[list[float], Vector(dimensions=2)] = Field(default_factory=list)
+
+        class Settings:
+            name = "ann_items"
+            keyspace = "test_ks"
+
+    return Item
+
+
+def _row(category: str = "a") -> dict:
+    return {"id": uuid4(), "category": category, "embedding": [0.5, 0.5]}
+
+
+async def test_ann_search_many_reuses_one_statement(Item, registered_mock_driver):
+    first, second = [_row(), _row()], [_row()]
+    registered_mock_driver.set_return_rows(first)
+    registered_mock_driver.set_return_rows(second)
+    results = await _maybe_await(
+        Item.ann_search_many, "embedding", [[0.1, 0.2], array.array("f", [0.5, 0.25])], limit=3
+    )
+    assert [[d.id for d in hits] for hits in results] == [[r["id"] for r in first], [second[0]["id"]]]
+    (cql1, params1), (cql2, params2) = registered_mock_driver.executed
+    assert cql1 == cql2
+    assert 'ORDER BY "embedding" ANN OF ? LIMIT ?' in cql1
+    assert params1 == [[0.1, 0.2], 3]
+    assert params2 == [[0.5, 0.25], 3]
+
+
+async def test_ann_search_many_applies_filters(Item, registered_mock_driver):
+    await _maybe_await(Item.ann_search_many, "embedding", [[0.1, 0.2]], limit=5, category="books")
+    cql, params = registered_mock_driver.executed[0]
+    assert '"category" = ?' in cql
+    assert params == ["books", [0.1, 0.2], 5]
+
+
+async def test_ann_search_many_empty_input(Item, registered_mock_driver):
+    assert await _maybe_await(Item.ann_search_many, "embedding", []) == []
+    assert registered_mock_driver.executed == []
+
+
+async def test_ann_search_many_validates_dimensions(Item, registered_mock_driver):
+    with pytest.raises(InvalidQueryError, match="expects 2 dimensions, got 3"):
+        await _maybe_await(Item.ann_search_many, "embedding", [[0.1, 0.2, 0.3]])
+
+
+async def test_ann_search_many_rejects_order_by_ann(Item, registered_mock_driver):
+    qs = Item.find().order_by_ann("embedding", [0.1, 0.2])
+    with pytest.raises(InvalidQueryError, match="order_by_ann"):
+        await _maybe_await(qs.ann_search_many, "embedding", [[0.1, 0.2]])
+
+
+async def test_ann_search_many_raises_query_error(Item, registered_mock_driver, monkeypatch):
+    def fail(*args, **kwargs):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(registered_mock_driver, "execute", fail)
+    monkeypatch.setattr(registered_mock_driver, "execute_async", fail)
+    with pytest.raises(RuntimeError, match="boom"):
+        await _maybe_await(Item.ann_search_many, "embedding", [[0.1, 0.2]])
+
+
+async def test_ann_search_many_values_list(Item, registered_mock_driver):
+    row = _row("x")
+    registered_mock_driver.set_return_rows([row])
+    qs = Item.find().limit(1).values_list("category")
+    assert await _maybe_await(qs.ann_search_many, "embedding", [[0.1, 0.2]]) == [[("x",)]]
+
+
+def test_merge_ann_results_dedupes_and_fuses_ranks(Item):
+    a, b, c = Item(category="a"), Item(category="b"), Item(category="c")
+    b_again = Item(id=b.id, category="b")
+    merged = merge_ann_results([[a, b], [b_again, c], [c]])
+    assert [d.category for d in merged] == ["b", "c", "a"]
+    assert merged[0] is b
+    assert merge_ann_results([[a, b], [b_again, c]], limit=1) == [b]
+
+
+def test_merge_ann_results_rerank(Item):
+    a, b = Item(category="a", embedding=[1.0, 0.0]), Item(category="b", embedding=[0.0, 1.0])
+    merged = merge_ann_results([[a, b], [a]], rerank=lambda doc: doc.embedding[1])
+    assert merged == [b, a]
+
+
+async def test_merge_ann_results_lazy(Item, registered_mock_driver):
+    shared, other = _row("shared"), _row("other")
+    registered_mock_driver.set_return_rows([shared])
+    registered_mock_driver.set_return_rows([other, shared])
+    per_vector = await _maybe_await(
+        Item.find().limit(2).ann_search_many, "embedding", [[0.1, 0.2], [0.3, 0.4]], lazy=True
+    )
+    merged = merge_ann_results(per_vector)
+    assert [doc.category for doc in merged] == ["shared", "other"]
+
+
+async def test_merge_ann_results_values_list(Item, registered_mock_driver):
+    registered_mock_driver.set_return_rows([_row("x")])
+    registered_mock_driver.set_return_rows([_row("y"), _row("x")])
+    qs = Item.find().limit(2).values_list("category")
+    per_vector = await _maybe_await(qs.ann_search_many, "embedding", [[0.1, 0.2], [0.3, 0.4]])
+    assert merge_ann_results(per_vector) == [("x",), ("y",)]
+
+
+def test_merge_ann_results_unhashable_rows():
+    with pytest.raises(InvalidQueryError, match="hashable"):
+        merge_ann_results([[([0.5, 0.5],)]])
+
+
+def test_merge_ann_results_doc_cls(Item):
+    a = Item(category="a")
+    a_again = Item(id=a.id, category="a2")
+    assert merge_ann_results([[a], [a_again]], doc_cls=Item) == [a]
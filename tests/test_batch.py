@@ -5,7 +5,7 @@ from uuid import UUID, uuid4
 
 from pydantic import Field
 
-from coodie.batch import BatchQuery, AsyncBatchQuery
+from coodie.batch import AsyncBatchQuery, AsyncBatchWriter, BatchQuery, BatchWriter, _value_size
 from coodie.cql_builder import build_batch
 from coodie.fields import PrimaryKey
 from coodie.sync.document import Document
@@ -330,3 +330,156 @@ def test_batch_query_has_slots():
     batch = BatchQuery()
     assert hasattr(BatchQuery, "__slots__")
     assert not hasattr(batch, "__dict__")
+
+
+# ------------------------------------------------------------------
+# BatchWriter / AsyncBatchWriter
+# ------------------------------------------------------------------
+
+_INSERT = "INSERT INTO ks.t (pk, v) VALUES (?, ?)"
+
+
+def _sent(driver):
+    """Return the params of every sub-batch sent, sorted."""
+    return sorted(params for _, params in driver.executed)
+
+
+def test_value_size_estimates():
+    assert _value_size(None) == 0
+    assert _value_size("héllo") == 6
+    assert _value_size(b"abc") == 3
+    assert _value_size([1, 2.0]) == 16
+    assert _value_size({"a": "bc"}) == 3
+    assert _value_size(uuid4()) == 16
+
+
+def test_batch_writer_groups_by_partition(registered_mock_driver):
+    with BatchWriter() as writer:
+        writer.add(_INSERT, ["a", 1], partition_key="a")
+        writer.add(_INSERT, ["b", 1], partition_key="b")
+        writer.add(_INSERT, ["a", 2], partition_key="a")
+        assert registered_mock_driver.executed == []
+
+    assert _sent(registered_mock_driver) == [["a", 1, "a", 2], ["b", 1]]
+    assert all(stmt.startswith("BEGIN UNLOGGED BATCH") for stmt, _ in registered_mock_driver.executed)
+    assert [r.success for r in writer.results] == [True, True]
+    assert {r.partition_key for r in writer.results} == {"a", "b"}
+
+
+def test_batch_writer_splits_on_statement_count(registered_mock_driver):
+    writer = BatchWriter(max_statements=2, concurrency=1)
+    for i in range(5):
+        writer.add(_INSERT, ["a", i], partition_key="a")
+    # Two full sub-batches were submitted while adding.
+    assert len(writer._pending) + len(writer.results) == 2
+    writer.flush()
+    writer.close()
+    # Sub-batches of one partition are sent in order.
+    assert [params for _, params in registered_mock_driver.executed] == [
+        ["a", 0, "a", 1],
+        ["a", 2, "a", 3],
+        ["a", 4],
+    ]
+
+
+def test_batch_writer_splits_on_estimated_bytes(registered_mock_driver):
+    with BatchWriter(max_bytes=20) as writer:
+        for value in ("x" * 8, "y" * 8, "z" * 8):
+            writer.add(_INSERT, ["a", value], partition_key="a")
+    # "a" + 8 chars = 9 bytes per statement: two fit under 20, the third does not.
+    assert [len(r.statements) for r in writer.results] == [2, 1]
+
+
+def test_batch_writer_reports_failed_sub_batches(registered_mock_driver, monkeypatch):
+    original = registered_mock_driver.execute
+
+    def flaky(stmt, params, **kwargs):
+        if "bad" in params:
+            raise RuntimeError("write timeout")
+        return original(stmt, params, **kwargs)
+
+    monkeypatch.setattr(registered_mock_driver, "execute", flaky)
+    with BatchWriter(logged=True) as writer:
+        writer.add(_INSERT, ["good", 1], partition_key="good")
+        writer.add(_INSERT, ["bad", 1], partition_key="bad")
+
+    [failed] = writer.failed
+    assert failed.partition_key == "bad"
+    assert failed.statements == [(_INSERT, ["bad", 1])]
+    assert isinstance(failed.error, RuntimeError)
+    assert registered_mock_driver.executed[0][0].startswith("BEGIN BATCH")
+
+
+def test_batch_writer_exception_discards_buffer(registered_mock_driver):
+    try:
+        with BatchWriter() as writer:
+            writer.add(_INSERT, ["a", 1], partition_key="a")
+            raise ValueError("boom")
+    except ValueError:
+        pass
+    assert registered_mock_driver.executed == []
+
+
+def test_save_with_batch_writer_groups_document_partitions(registered_mock_driver):
+    item = BatchItem(name="A")
+    other = BatchItem(name="B")
+    with BatchWriter() as writer:
+        item.save(batch=writer)
+        other.save(batch=writer)
+        item.delete(batch=writer)
+
+    keys = sorted(len(r.statements) for r in writer.results)
+    assert keys == [1, 2]
+    assert {r.partition_key for r in writer.results} == {
+        ("test_ks", "batch_items", item.id),
+        ("test_ks", "batch_items", other.id),
+    }
+
+
+async def test_async_batch_writer_groups_and_reports(registered_mock_driver, monkeypatch):
+    original = registered_mock_driver.execute_async
+
+    async def flaky(stmt, params, **kwargs):
+        if "bad" in params:
+            raise RuntimeError("write timeout")
+        return await original(stmt, params, **kwargs)
+
+    monkeypatch.setattr(registered_mock_driver, "execute_async", flaky)
+    async with AsyncBatchWriter(max_statements=2, concurrency=2) as writer:
+        for i in range(3):
+            writer.add(_INSERT, ["a", i], partition_key="a")
+        writer.add(_INSERT, ["bad", 0], partition_key="bad")
+
+    assert [params for _, params in registered_mock_driver.executed] == [["a", 0, "a", 1], ["a", 2]]
+    assert [r.partition_key for r in writer.failed] == ["bad"]
+    assert len(writer.results) == 3
+
+
+async def test_async_save_with_batch_writer(registered_mock_driver):
+    product = AsyncBatchProduct(name="A")
+    async with AsyncBatchWriter() as writer:
+        await product.save(batch=writer)
+        await product.insert(batch=writer)
+    [result] = writer.results
+    assert result.partition_key == ("test_ks", "async_batch_products", product.id)
+    assert len(result.statements) == 2
+
+
+async def test_async_batch_writer_exception_discards_buffer(registered_mock_driver):
+    try:
+        async with AsyncBatchWriter() as writer:
+            writer.add(_INSERT, ["a", 1], partition_key="a")
+            raise ValueError("boom")
+    except ValueError:
+        pass
+    assert registered_mock_driver.executed == []
+
+
+def test_batch_writer_importable():
+    from coodie import AsyncBatchWriter as AW
+    from coodie import BatchWriter as W
+    from coodie.aio import AsyncBatchWriter as AioAW
+    from coodie.sync import BatchWriter as SyncW
+
+    assert W is SyncW is BatchWriter
+    assert AW is AioAW is AsyncBatchWriter
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from coodie.cache import CacheInfo, LRUCache
+
+
+def test_lru_cache_get_put_and_counters():
+    cache = LRUCache(2)
+    assert cache.get("a") is None
+    cache.put("a", 1)
+    assert cache.get("a") == 1
+    assert "a" in cache
+    assert len(cache) == 1
+    assert cache.info() == CacheInfo(hits=1, misses=1, evictions=0, maxsize=2, currsize=1)
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")  # "b" is now the least recently used entry
+    cache.put("c", 3)
+    assert cache.keys() == ["a", "c"]
+    assert cache.info().evictions == 1
+
+
+def test_lru_cache_unbounded_and_disabled():
+    unbounded = LRUCache(None)
+    for i in range(1000):
+        unbounded.put(i, i)
+    assert len(unbounded) == 1000
+    assert unbounded.info().evictions == 0
+
+    disabled = LRUCache(0)
+    disabled.put("a", 1)
+    assert len(disabled) == 0
+    assert disabled.get("a") is None
+
+
+def test_lru_cache_rejects_negative_maxsize():
+    with pytest.raises(ValueError, match="maxsize"):
+        LRUCache(-1)
+
+
+def test_lru_cache_pop_and_clear():
+    cache = LRUCache(4)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    assert cache.pop("a") == 1
+    assert cache.pop("a", "missing") == "missing"
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.info() == CacheInfo(hits=0, misses=0, evictions=0, maxsize=4, currsize=0)
+
+
+def test_lru_cache_thread_safe():
+    cache = LRUCache(50)
+
+    def worker(offset: int) -> None:
+        for i in range(2000):
+            key = (offset + i) % 100
+            if cache.get(key) is None:
+                cache.put(key, key)
+
+    threads = [threading.Thread(target=worker, args=(n * 7,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    info = cache.info()
+    assert info.currsize == len(cache) <= 50
+    assert info.hits + info.misses == 8 * 2000
+
+
+def test_lru_cache_get_or_create_single_flight_across_threads():
+    cache = LRUCache(8)
+    calls = []
+
+    def factory():
+        calls.append(1)
+        time.sleep(0.05)
+        return "prepared"
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_create("q", factory))) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert results == ["prepared"] * 8
+    assert cache.get_or_create("q", factory) == "prepared"
+    assert len(calls) == 1
+
+
+def test_lru_cache_get_or_create_error_is_shared_and_not_cached():
+    cache = LRUCache(8)
+
+    def failing():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        cache.get_or_create("q", failing)
+    assert "q" not in cache
+    assert cache.get_or_create("q", lambda: 1) == 1
+
+
+def test_lru_cache_get_or_create_cache_if():
+    cache = LRUCache(8)
+    assert cache.get_or_create("q", lambda: None, cache_if=lambda v: v is not None) is None
+    assert "q" not in cache
+    assert cache.get_or_create("q", lambda: 1, cache_if=lambda v: v is not None) == 1
+    assert cache.get("q") == 1
+
+
+async def test_lru_cache_get_or_create_async_single_flight():
+    cache = LRUCache(8)
+    calls = 0
+
+    async def factory():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "prepared"
+
+    results = await asyncio.gather(*(cache.get_or_create_async("q", factory) for _ in range(20)))
+
+    assert calls == 1
+    assert results == ["prepared"] * 20
+    info = cache.info()
+    assert (info.hits, info.misses) == (0, 20)
+
+
+async def test_lru_cache_get_or_create_async_waiter_cancel_does_not_cancel_leader():
+    cache = LRUCache(8)
+    release = asyncio.Event()
+
+    async def factory():
+        await release.wait()
+        return "prepared"
+
+    leader = asyncio.create_task(cache.get_or_create_async("q", factory))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(cache.get_or_create_async("q", factory))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    release.set()
+
+    assert await leader == "prepared"
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert cache.get("q") == "prepared"
+
+
+async def test_lru_cache_get_or_create_async_leader_cancel_does_not_fail_waiters():
+    cache = LRUCache(8)
+    release = asyncio.Event()
+    calls = 0
+
+    async def factory():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "prepared"
+
+    leader = asyncio.create_task(cache.get_or_create_async("q", factory))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(cache.get_or_create_async("q", factory))
+    await asyncio.sleep(0)
+    leader.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    release.set()
+
+    assert await waiter == "prepared"
+    assert calls == 1
+    assert cache.get("q") == "prepared"
+
+
+def test_lru_cache_resize_evicts_oldest():
+    cache = LRUCache(4)
+    for key in "abcd":
+        cache.put(key, key)
+    cache.resize(2)
+    assert cache.keys() == ["c", "d"]
+    assert cache.info().evictions == 2
+    assert cache.maxsize == 2
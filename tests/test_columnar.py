@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import sys
+from typing import Annotated, Optional
+from uuid import UUID, uuid4
+
+import pytest
+from pydantic import Field
+
+from coodie.columnar import _ColumnCollector, _vector_dims
+from coodie.fields import BigInt, PrimaryKey, Vector
+from tests.conftest import _maybe_await
+
+
+@pytest.fixture(params=["sync", "async"])
+def variant(request):
+    return request.param
+
+
+@pytest.fixture
+def document_cls(variant):
+    if variant == "sync":
+        from coodie.sync.document import Document
+
+        return Document
+    from coodie.aio.document import Document
+
+    return Document
+
+
+@pytest.fixture
+def Reading(document_cls):
+    class Reading(document_cls):
+        id: Annotated[UUID, PrimaryKey()] = Field(default_factory=uuid4)
+        sensor: str = ""
+        seq: Annotated[int, BigInt()] = 0
+        value: Optional[float] = None
+        embedding: Annotated[list[float], Vector(dimensions=3)] = Field(default_factory=lambda: [0.0] * 3)
+
+        class Settings:
+            name = "readings"
+            keyspace = "test_ks"
+
+    return Reading
+
+
+def _rows(count: int) -> list[dict]:
+    return [
+        {"id": uuid4(), "sensor": f"s{i}", "seq": i, "value": i / 2, "embedding": [float(i)] * 3} for i in range(count)
+    ]
+
+
+def test_vector_dims():
+    assert _vector_dims("vector<float, 384>") == 384
+    assert _vector_dims("list<float>") is None
+    assert _vector_dims(None) is None
+
+
+def test_column_collector_uses_schema_order_and_types(Reading):
+    collector = _ColumnCollector(Reading)
+    assert collector.names == ["id", "sensor", "seq", "value", "embedding"]
+    assert collector.cql_types["seq"] == "bigint"
+    assert collector.cql_types["embedding"] == "vector<float, 3>"
+
+    # Pages arrive in the database's column order.
+    page = collector.split(["sensor", "id", "embedding", "seq", "value", "extra"], [("a", 1, [0.0] * 3, 7, None, "x")])
+    assert page == [[1], ["a"], [7], [None], [[0.0] * 3], ["x"]]
+    assert collector.names == ["id", "sensor", "seq", "value", "embedding", "extra"]
+
+
+def test_column_collector_explicit_columns_fill_missing(Reading):
+    collector = _ColumnCollector(Reading, ["value", "sensor", "nope"])
+    assert collector.split(["id", "sensor", "value"], [(1, "a", 0.5), (2, "b", None)]) == [
+        [0.5, None],
+        ["a", "b"],
+        [None, None],
+    ]
+    assert collector.cql_types == {"value": "float", "sensor": "text", "nope": None}
+
+
+async def test_to_arrow_requires_pyarrow(Reading, registered_mock_driver, monkeypatch):
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    with pytest.raises(ImportError, match="pip install pyarrow"):
+        await _maybe_await(Reading.find().to_arrow)
+    assert registered_mock_driver.executed == []
+
+
+async def test_to_columns_requires_numpy(Reading, registered_mock_driver, monkeypatch):
+    monkeypatch.setitem(sys.modules, "numpy", None)
+    with pytest.raises(ImportError, match="pip install numpy"):
+        await _maybe_await(Reading.find().to_columns)
+
+
+async def test_to_pandas_requires_pandas(Reading, registered_mock_driver, monkeypatch):
+    monkeypatch.setitem(sys.modules, "pandas", None)
+    with pytest.raises(ImportError, match="pip install pandas"):
+        await _maybe_await(Reading.find().to_pandas)
+    assert registered_mock_driver.executed == []
+
+
+async def test_to_arrow_streams_pages(Reading, registered_mock_driver):
+    pa = pytest.importorskip("pyarrow")
+    rows = _rows(3)
+    registered_mock_driver.set_return_rows(rows[:2])
+    registered_mock_driver.set_paging_state(b"p2")
+    registered_mock_driver.set_return_rows(rows[2:])
+    table = await _maybe_await(Reading.find().to_arrow, fetch_size=2)
+    assert table.num_rows == 3
+    assert table.column_names == ["id", "sensor", "seq", "value", "embedding"]
+    assert table.schema.field("seq").type == pa.int64()
+    assert table.schema.field("value").type == pa.float32()
+    assert table.schema.field("embedding").type == pa.list_(pa.float32(), 3)
+    assert table.column("id").to_pylist() == [str(r["id"]) for r in rows]
+    assert len(registered_mock_driver.executed) == 2
+
+
+async def test_to_arrow_empty_result_keeps_schema(Reading, registered_mock_driver):
+    pa = pytest.importorskip("pyarrow")
+    table = await _maybe_await(Reading.find().only("sensor", "seq").to_arrow)
+    assert table.num_rows == 0
+    assert table.schema.names == ["sensor", "seq"]
+    assert table.schema.field("sensor").type == pa.string()
+
+
+async def test_to_columns_builds_typed_arrays(Reading, registered_mock_driver):
+    np = pytest.importorskip("numpy")
+    rows = _rows(2)
+    rows[1]["value"] = None
+    rows[1]["embedding"] = None
+    registered_mock_driver.set_return_rows(rows)
+    columns = await _maybe_await(Reading.find().to_columns)
+    assert columns["seq"].dtype == np.int64
+    assert columns["value"].dtype == np.float32
+    assert np.isnan(columns["value"][1])
+    assert columns["embedding"].shape == (2, 3)
+    assert columns["embedding"].dtype == np.float32
+    assert columns["sensor"].dtype == object
+
+
+async def test_to_pandas_returns_dataframe(Reading, registered_mock_driver):
+    pytest.importorskip("pyarrow")
+    pytest.importorskip("pandas")
+    registered_mock_driver.set_return_rows(_rows(2))
+    frame = await _maybe_await(Reading.find().values_list("sensor", "seq").to_pandas)
+    assert list(frame.columns) == ["sensor", "seq"]
+    assert frame["seq"].tolist() == [0, 1]
+
+
+async def test_to_columns_converts_each_page(Reading, registered_mock_driver, monkeypatch):
+    np = pytest.importorskip("numpy")
+    from coodie.columnar import _NumpyColumnsBuilder
+
+    first, second = _rows(2), _rows(3)
+    second[0]["seq"] = None
+    registered_mock_driver.set_return_rows(first)
+    registered_mock_driver.set_paging_state(b"page-2")
+    registered_mock_driver.set_return_rows(second)
+    registered_mock_driver.set_paging_state(None)
+    pages = []
+    add_page = _NumpyColumnsBuilder.add_page
+
+    def record(self, columns, rows):
+        add_page(self, columns, rows)
+        pages.append({name: len(chunks) for name, chunks in self._chunks.items()})
+
+    monkeypatch.setattr(_NumpyColumnsBuilder, "add_page", record)
+    columns = await _maybe_await(Reading.find().to_columns)
+    # Arrays are built per page, not from values kept for the whole result.
+    assert pages[0]["sensor"] == 1 and pages[1]["sensor"] == 2
+    assert columns["embedding"].shape == (5, 3)
+    assert columns["value"].dtype == np.float32
+    # A None in a typed column of one page turns the column into objects.
+    assert columns["seq"].dtype == object
+    assert columns["seq"].tolist() == [0, 1, None, 1, 2]
@@ -25,8 +25,15 @@ from coodie.cql_builder import (
     build_where_clause,
     parse_filter_kwargs,
     parse_update_kwargs,
+    token_ranges,
+    _TOKEN_MAX,
+    _TOKEN_MIN,
+    _CQL_CACHE_MAXSIZE,
     _insert_cql_cache,
     _select_cql_cache,
+    cache_clear,
+    cache_info,
+    set_cache_size,
 )
 from coodie.schema import ColumnDefinition
 
@@ -169,7 +176,16 @@ def test_build_select_with_where():
 
 def test_build_select_with_limit():
     cql, params = build_select("products", "ks", limit=10)
-    assert "LIMIT 10" in cql
+    assert cql.endswith(" LIMIT ?")
+    assert params == [10]
+
+
+def test_build_select_limit_is_bound_not_cached_per_value():
+    cql1, params1 = build_select("products", "ks", where=[("id", "=", 1)], limit=10)
+    cql2, params2 = build_select("products", "ks", where=[("id", "=", 2)], limit=25)
+    assert cql1 is cql2
+    assert params1 == [1, 10]
+    assert params2 == [2, 25]
 
 
 def test_build_select_order_by_desc():
@@ -183,8 +199,9 @@ def test_build_select_allow_filtering():
 
 
 def test_build_select_per_partition_limit():
-    cql, _ = build_select("products", "ks", per_partition_limit=5)
-    assert "PER PARTITION LIMIT 5" in cql
+    cql, params = build_select("products", "ks", per_partition_limit=5, limit=100)
+    assert "PER PARTITION LIMIT ? LIMIT ?" in cql
+    assert params == [5, 100]
 
 
 def test_build_select_with_columns():
@@ -286,6 +303,39 @@ def test_build_select_cache_varies_by_shape():
     assert len(_select_cql_cache) == 2
 
 
+def test_cql_caches_are_bounded_lru():
+    """The select template cache evicts its oldest shape once full."""
+    set_cache_size(2, "select")
+    try:
+        _select_cql_cache.clear()
+        for col in ("a", "b", "c"):
+            build_select("t", "ks", where=[(col, "=", 1)])
+        assert len(_select_cql_cache) == 2
+        info = cache_info()["select"]
+        assert (info.misses, info.evictions, info.maxsize) == (3, 1, 2)
+    finally:
+        set_cache_size(_CQL_CACHE_MAXSIZE)
+
+
+def test_cache_info_and_clear_cover_every_builder():
+    cache_clear()
+    build_select("t", "ks", where=[("id", "=", 1)])
+    build_select("t", "ks", where=[("id", "=", 2)])
+    build_count("t", "ks")
+    build_delete("t", "ks", where=[("id", "=", 1)])
+    info = cache_info()
+    assert set(info) == {"select", "count", "aggregate", "insert", "update", "delete"}
+    assert (info["select"].hits, info["select"].misses, info["select"].currsize) == (1, 1, 1)
+    assert info["count"].currsize == info["delete"].currsize == 1
+    cache_clear()
+    assert all(i.currsize == 0 and i.hits == 0 for i in cache_info().values())
+
+
+def test_set_cache_size_unknown_name():
+    with pytest.raises(ValueError, match="Unknown CQL cache"):
+        set_cache_size(10, "nope")
+
+
 def test_build_select_cache_varies_by_in_length():
     """IN clause with different value counts produces distinct CQL."""
     _select_cql_cache.clear()
@@ -688,6 +738,31 @@ def test_build_where_clause_token_range():
     assert params == [100, 200]
 
 
+def test_build_where_clause_token_composite_partition_key():
+    clause, params = build_where_clause([(("a", "b"), "TOKEN >", 1), (("a", "b"), "TOKEN <=", 2)])
+    assert clause == 'WHERE TOKEN("a", "b") > ? AND TOKEN("a", "b") <= ?'
+    assert params == [1, 2]
+
+
+def test_token_ranges_cover_ring_contiguously():
+    ranges = token_ranges(7)
+    assert len(ranges) == 7
+    assert ranges[0][0] == _TOKEN_MIN
+    assert ranges[-1][1] == _TOKEN_MAX
+    assert all(ranges[i][1] == ranges[i + 1][0] for i in range(len(ranges) - 1))
+
+
+def test_token_ranges_resume_from_start():
+    ranges = token_ranges(4, start=0)
+    assert ranges[0][0] == 0
+    assert ranges[-1][1] == _TOKEN_MAX
+
+
+def test_token_ranges_small_or_empty_span():
+    assert token_ranges(10, start=0, end=3) == [(0, 1), (1, 2), (2, 3)]
+    assert token_ranges(10, start=_TOKEN_MAX) == []
+
+
 def test_build_select_with_token_filter():
     cql, params = build_select(
         "products",
@@ -917,9 +992,8 @@ def test_build_select_ann_of():
         ann_of=("embedding", [0.1, 0.2, 0.3]),
         limit=5,
     )
-    assert 'ORDER BY "embedding" ANN OF ?' in cql
-    assert "LIMIT 5" in cql
-    assert [0.1, 0.2, 0.3] in params
+    assert 'ORDER BY "embedding" ANN OF ? LIMIT ?' in cql
+    assert params == [[0.1, 0.2, 0.3], 5]
 
 
 def test_build_select_ann_of_with_where():
@@ -932,7 +1006,7 @@ def test_build_select_ann_of_with_where():
     )
     assert 'WHERE "category" = ?' in cql
     assert 'ORDER BY "embedding" ANN OF ?' in cql
-    assert params == ["electronics", [0.1, 0.2]]
+    assert params == ["electronics", [0.1, 0.2], 10]
 
 
 def test_build_select_ann_overrides_order_by():
@@ -1013,8 +1087,9 @@ def test_build_select_json_with_where():
 
 
 def test_build_select_json_with_limit():
-    cql, _ = build_select_json("users", "ks", limit=10)
-    assert "LIMIT 10" in cql
+    cql, params = build_select_json("users", "ks", limit=10)
+    assert cql.endswith(" LIMIT ?")
+    assert params == [10]
 
 
 def test_build_select_json_allow_filtering():
@@ -945,3 +945,158 @@ async def test_truncate_executes_truncate_cql(Product, registered_mock_driver):
     stmt, params = registered_mock_driver.executed[0]
     assert stmt == "TRUNCATE TABLE test_ks.products"
     assert params == []
+
+
+# ------------------------------------------------------------------
+# Document.bulk_save() / bulk_insert()
+# ------------------------------------------------------------------
+
+
+async def test_bulk_save_sends_one_insert_per_partition(Product, registered_mock_driver):
+    products = [Product(name=f"P{i}", price=float(i)) for i in range(3)]
+    results = await _maybe_await(Product.bulk_save, products)
+    assert [r.success for r in results] == [True, True, True]
+    assert len(registered_mock_driver.executed) == 3
+    for (stmt, params), p in zip(registered_mock_driver.executed, products):
+        assert stmt.startswith("INSERT INTO test_ks.products")
+        assert params[0] == p.id
+
+
+async def test_bulk_save_groups_same_partition_into_unlogged_batch(SensorReading, registered_mock_driver):
+    readings = [
+        SensorReading(sensor_id="a", reading_time="t1", value=1.0),
+        SensorReading(sensor_id="b", reading_time="t1", value=2.0),
+        SensorReading(sensor_id="a", reading_time="t2", value=3.0),
+    ]
+    results = await _maybe_await(SensorReading.bulk_save, readings)
+    # One result per document, in input order; batch members share theirs.
+    assert len(results) == 3
+    assert results[0] is results[2] is not results[1]
+    batch_stmt, batch_params = registered_mock_driver.executed[0]
+    assert batch_stmt.startswith("BEGIN UNLOGGED BATCH")
+    assert batch_stmt.count("INSERT INTO test_ks.sensor_readings") == 2
+    assert batch_params == ["a", "t1", "", 1.0, "a", "t2", "", 3.0]
+    single_stmt, single_params = registered_mock_driver.executed[1]
+    assert single_stmt.startswith("INSERT INTO")
+    assert single_params[0] == "b"
+
+
+async def test_bulk_save_sends_batches_through_execute_batch(SensorReading, registered_mock_driver, monkeypatch):
+    calls = []
+
+    def execute_batch(statements, **kwargs):
+        calls.append((list(statements), kwargs))
+        return []
+
+    async def execute_batch_async(statements, **kwargs):
+        return execute_batch(statements, **kwargs)
+
+    monkeypatch.setattr(registered_mock_driver, "execute_batch", execute_batch)
+    monkeypatch.setattr(registered_mock_driver, "execute_batch_async", execute_batch_async)
+    readings = [SensorReading(sensor_id="a", reading_time=f"t{i}") for i in range(2)]
+    results = await _maybe_await(SensorReading.bulk_save, readings, consistency="ONE")
+    assert [r.success for r in results] == [True, True]
+    [(statements, kwargs)] = calls
+    # Every member is the single-row INSERT, so native batches reuse its prepared statement.
+    assert {cql for cql, _ in statements} == {statements[0][0]}
+    assert statements[0][0].startswith("INSERT INTO test_ks.sensor_readings")
+    assert [params[1] for _, params in statements] == ["t0", "t1"]
+    assert kwargs == {"logged": False, "consistency": "ONE", "timeout": None}
+    assert registered_mock_driver.executed == []
+
+
+async def test_bulk_save_failed_batch_marks_its_documents(SensorReading, registered_mock_driver, monkeypatch):
+    def execute_batch(statements, **kwargs):
+        raise RuntimeError("batch too large")
+
+    async def execute_batch_async(statements, **kwargs):
+        return execute_batch(statements, **kwargs)
+
+    monkeypatch.setattr(registered_mock_driver, "execute_batch", execute_batch)
+    monkeypatch.setattr(registered_mock_driver, "execute_batch_async", execute_batch_async)
+    readings = [
+        SensorReading(sensor_id="a", reading_time="t1"),
+        SensorReading(sensor_id="b", reading_time="t1"),
+        SensorReading(sensor_id="a", reading_time="t2"),
+    ]
+    results = await _maybe_await(SensorReading.bulk_save, readings)
+    failed = [reading for reading, r in zip(readings, results) if not r.success]
+    assert failed == [readings[0], readings[2]]
+    assert isinstance(results[0].error, RuntimeError)
+
+
+async def test_bulk_save_chunks_large_partitions(SensorReading, registered_mock_driver):
+    from coodie.sync.document import _BULK_BATCH_MAX_ROWS
+
+    readings = [SensorReading(sensor_id="a", reading_time=f"t{i}") for i in range(_BULK_BATCH_MAX_ROWS + 1)]
+    await _maybe_await(SensorReading.bulk_save, readings)
+    assert len(registered_mock_driver.executed) == 2
+    assert registered_mock_driver.executed[0][0].count("INSERT") == _BULK_BATCH_MAX_ROWS
+    assert registered_mock_driver.executed[1][0].startswith("INSERT")
+
+
+async def test_bulk_save_without_batching(SensorReading, registered_mock_driver):
+    readings = [SensorReading(sensor_id="a", reading_time=f"t{i}") for i in range(3)]
+    await _maybe_await(SensorReading.bulk_save, readings, batch_by_partition=False)
+    assert len(registered_mock_driver.executed) == 3
+    assert all(stmt.startswith("INSERT") for stmt, _ in registered_mock_driver.executed)
+
+
+async def test_bulk_save_with_ttl(Product, registered_mock_driver):
+    await _maybe_await(Product.bulk_save, [Product(name="A")], ttl=60)
+    stmt, _ = registered_mock_driver.executed[0]
+    assert "USING TTL 60" in stmt
+
+
+async def test_bulk_save_empty(Product, registered_mock_driver):
+    assert await _maybe_await(Product.bulk_save, []) == []
+    assert registered_mock_driver.executed == []
+
+
+async def test_bulk_insert_uses_if_not_exists_and_never_batches(SensorReading, registered_mock_driver):
+    readings = [SensorReading(sensor_id="a", reading_time=f"t{i}") for i in range(2)]
+    results = await _maybe_await(SensorReading.bulk_insert, readings)
+    assert len(results) == 2
+    assert all("IF NOT EXISTS" in stmt for stmt, _ in registered_mock_driver.executed)
+    assert not any("BATCH" in stmt for stmt, _ in registered_mock_driver.executed)
+
+
+async def test_bulk_save_counter_raises(PageView, registered_mock_driver):
+    with pytest.raises(InvalidQueryError, match="bulk_save"):
+        await _maybe_await(PageView.bulk_save, [PageView(url="/")])
+
+
+async def test_bulk_save_materialized_view_raises(ProductsByBrand, registered_mock_driver):
+    with pytest.raises(InvalidQueryError, match="read-only"):
+        await _maybe_await(ProductsByBrand.bulk_save, [ProductsByBrand(brand="Acme")])
+
+
+# ------------------------------------------------------------------
+# Document.get_many()
+# ------------------------------------------------------------------
+
+
+async def test_get_many_returns_input_order_with_none_for_missing(Product, registered_mock_driver):
+    a, b = Product(name="A"), Product(name="B")
+    missing = uuid4()
+    registered_mock_driver.set_return_rows([a.model_dump()])
+    registered_mock_driver.set_return_rows([])
+    registered_mock_driver.set_return_rows([b.model_dump()])
+    docs = await _maybe_await(Product.get_many, [a.id, missing, b.id, a.id])
+    assert [d.name if d else None for d in docs] == ["A", None, "B", "A"]
+    assert [params for _, params in registered_mock_driver.executed] == [[a.id], [missing], [b.id]]
+    assert {stmt for stmt, _ in registered_mock_driver.executed} == {'SELECT * FROM test_ks.products WHERE "id" = ?'}
+
+
+async def test_get_many_composite_keys(SensorReading, registered_mock_driver):
+    await _maybe_await(SensorReading.get_many, [("a", "t1"), {"reading_time": "t2", "sensor_id": "b"}], concurrency=2)
+    assert [params for _, params in registered_mock_driver.executed] == [["a", "t1"], ["b", "t2"]]
+    with pytest.raises(InvalidQueryError, match="needs a tuple or dict key"):
+        await _maybe_await(SensorReading.get_many, ["a"])
+    with pytest.raises(InvalidQueryError, match="Expected the primary key columns"):
+        await _maybe_await(SensorReading.get_many, [{"sensor_id": "a"}])
+
+
+async def test_get_many_empty(Product, registered_mock_driver):
+    assert await _maybe_await(Product.get_many, []) == []
+    assert registered_mock_driver.executed == []
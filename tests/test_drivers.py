@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 import importlib.util
 import logging
+import threading
 from collections import namedtuple
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -131,6 +133,15 @@ def test_init_coodie_cassandra_alias():
     _registry.clear()
 
 
+def test_init_coodie_prepared_cache_size():
+    _registry.clear()
+    mock_session = MagicMock()
+    mock_session.cluster = MagicMock()
+    driver = init_coodie(session=mock_session, keyspace="ks", prepared_cache_size=10)
+    assert driver.prepared_cache_info().maxsize == 10
+    _registry.clear()
+
+
 def test_init_coodie_unknown_driver_type():
     _registry.clear()
     with pytest.raises(ConfigurationError, match="Unknown driver_type"):
@@ -414,6 +425,40 @@ def test_cassandra_driver_prepared_cache(cassandra_driver, mock_cassandra_sessio
     mock_cassandra_session.prepare.assert_called_once_with("SELECT * FROM test_ks.t")
 
 
+def test_cassandra_driver_prepared_cache_is_bounded(mock_cassandra_session):
+    from coodie.drivers.cassandra import CassandraDriver
+
+    driver = CassandraDriver(session=mock_cassandra_session, prepared_cache_size=2)
+    mock_cassandra_session.execute.return_value = []
+    driver.execute("SELECT * FROM t WHERE a = ?", [1])
+    driver.execute("SELECT * FROM t WHERE b = ?", [1])
+    driver.execute("SELECT * FROM t WHERE a = ?", [1])
+    driver.execute("SELECT * FROM t WHERE c = ?", [1])
+    # the least recently used statement ("b") was evicted
+    assert driver._prepared.keys() == ["SELECT * FROM t WHERE a = ?", "SELECT * FROM t WHERE c = ?"]
+    info = driver.prepared_cache_info()
+    assert (info.hits, info.misses, info.evictions, info.maxsize, info.currsize) == (1, 3, 1, 2, 2)
+
+
+def test_cassandra_driver_concurrent_prepare_is_single_flight(cassandra_driver, mock_cassandra_session):
+    import time
+
+    def slow_prepare(cql):
+        time.sleep(0.05)
+        return MagicMock()
+
+    mock_cassandra_session.prepare.side_effect = slow_prepare
+    mock_cassandra_session.execute.return_value = []
+    threads = [
+        threading.Thread(target=cassandra_driver.execute, args=("SELECT * FROM test_ks.t", [])) for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    mock_cassandra_session.prepare.assert_called_once_with("SELECT * FROM test_ks.t")
+
+
 @pytest.mark.skipif(not importlib.util.find_spec("cassandra"), reason="cassandra-driver not installed")
 def test_cassandra_driver_execute_with_consistency(cassandra_driver, mock_cassandra_session):
     from cassandra import ConsistencyLevel  # type: ignore[import-untyped]
@@ -635,6 +680,7 @@ async def test_cassandra_driver_execute_async(cassandra_driver, mock_cassandra_s
 
     def fake_execute_async(stmt, **kwargs):
         future = MagicMock()
+        future._paging_state = None
 
         def add_callbacks(on_success, on_error):
             loop = asyncio.get_event_loop()
@@ -686,40 +732,188 @@ async def test_cassandra_driver_sync_table_async(cassandra_driver, mock_cassandr
     assert mock_cassandra_session.execute_async.call_count >= 1
 
 
-async def test_cassandra_driver_execute_async_with_paging(cassandra_driver, mock_cassandra_session):
-    """execute_async delegates paginated queries to sync execute via run_in_executor."""
-    SysRow = namedtuple("SysRow", ["id", "name"])
-    result = MagicMock()
-    result.current_rows = [SysRow(id="1", name="Alice")]
-    result.paging_state = b"page-token"
-    result.__iter__ = MagicMock(return_value=iter([]))  # not used for paginated
+def _paged_future(pages, error=None):
+    """Fake ResponseFuture serving *pages* (``[(rows, paging_state), ...]``).
 
-    mock_cassandra_session.execute.return_value = result
+    Like the real driver, the registered callbacks fire again, from another
+    thread, for every page requested via ``start_fetching_next_page()``.
+    """
+    future = MagicMock()
+    remaining = list(pages)
+    callbacks = {}
+
+    def deliver():
+        if error is not None:
+            callbacks["errback"](error)
+            return
+        rows, future._paging_state = remaining.pop(0)
+        callbacks["callback"](rows)
+
+    def add_callbacks(callback, errback):
+        callbacks.update(callback=callback, errback=errback)
+        threading.Thread(target=deliver).start()
+
+    future.add_callbacks = add_callbacks
+    future.start_fetching_next_page = MagicMock(side_effect=lambda: threading.Thread(target=deliver).start())
+    return future
+
+
+async def test_cassandra_driver_execute_async_with_paging(cassandra_driver, mock_cassandra_session):
+    """Paginated execute_async uses ResponseFuture callbacks, not a worker thread."""
+    mock_cassandra_session.execute_async.return_value = _paged_future([([Row(id="1", name="Alice")], b"page-token")])
     rows = await cassandra_driver.execute_async("SELECT * FROM test_ks.t", [], fetch_size=10)
     assert rows == [{"id": "1", "name": "Alice"}]
     assert cassandra_driver._last_paging_state == b"page-token"
+    mock_cassandra_session.execute.assert_not_called()
     # Verify fetch_size was set on the bound statement
     prepared = mock_cassandra_session.prepare.return_value
     assert prepared.bind.return_value.fetch_size == 10
 
 
 async def test_cassandra_driver_execute_async_with_paging_state(cassandra_driver, mock_cassandra_session):
-    """execute_async passes paging_state through to sync execute for paginated queries."""
-    SysRow = namedtuple("SysRow", ["id", "name"])
-    result = MagicMock()
-    result.current_rows = [SysRow(id="2", name="Bob")]
-    result.paging_state = None
-    result.__iter__ = MagicMock(return_value=iter([]))  # not used for paginated
-
-    mock_cassandra_session.execute.return_value = result
+    """execute_async passes paging_state through to session.execute_async."""
+    future = _paged_future([([Row(id="2", name="Bob")], None)])
+    mock_cassandra_session.execute_async.return_value = future
     rows = await cassandra_driver.execute_async(
         "SELECT * FROM test_ks.t", [], fetch_size=10, paging_state=b"prev-token"
     )
     assert rows == [{"id": "2", "name": "Bob"}]
     assert cassandra_driver._last_paging_state is None
-    # Verify paging_state was passed to sync execute
-    call_kwargs = mock_cassandra_session.execute.call_args
+    call_kwargs = mock_cassandra_session.execute_async.call_args
     assert call_kwargs.kwargs.get("paging_state") == b"prev-token"
+    future.start_fetching_next_page.assert_not_called()
+
+
+async def test_cassandra_driver_execute_async_unpaged_follows_all_pages(cassandra_driver, mock_cassandra_session):
+    """Without fetch_size, execute_async returns every page, like sync execute()."""
+    future = _paged_future(
+        [
+            ([Row(id="1", name="A")], b"p2"),
+            ([Row(id="2", name="B")], b"p3"),
+            ([Row(id="3", name="C")], None),
+        ]
+    )
+    mock_cassandra_session.execute_async.return_value = future
+    rows = await cassandra_driver.execute_async("SELECT * FROM test_ks.t", [])
+    assert [r["id"] for r in rows] == ["1", "2", "3"]
+    assert future.start_fetching_next_page.call_count == 2
+    assert cassandra_driver._last_paging_state is None
+
+
+def test_cassandra_driver_registers_tuple_row_listener(mock_cassandra_session):
+    from cassandra.query import tuple_factory  # type: ignore[import-untyped]
+
+    from coodie.drivers import cassandra
+    from coodie.drivers.cassandra import CassandraDriver
+
+    CassandraDriver(session=mock_cassandra_session)
+    mock_cassandra_session.add_request_init_listener.assert_called_once_with(cassandra._on_request_init, tuple_factory)
+
+    response_future = MagicMock(row_factory="dict")
+    cassandra._on_request_init(response_future, tuple_factory)
+    assert response_future.row_factory == "dict"
+    cassandra._tuple_rows.active = True
+    try:
+        cassandra._on_request_init(response_future, tuple_factory)
+    finally:
+        cassandra._tuple_rows.active = False
+    assert response_future.row_factory is tuple_factory
+
+
+def test_cassandra_driver_listener_added_once_per_session(mock_cassandra_session):
+    from cassandra.query import tuple_factory  # type: ignore[import-untyped]
+
+    from coodie.drivers import cassandra
+    from coodie.drivers.cassandra import CassandraDriver
+
+    first = CassandraDriver(session=mock_cassandra_session)
+    CassandraDriver(session=mock_cassandra_session, default_keyspace="other")
+    mock_cassandra_session.add_request_init_listener.assert_called_once()
+    first.close()
+    mock_cassandra_session.remove_request_init_listener.assert_called_once_with(
+        cassandra._on_request_init, tuple_factory
+    )
+    # A driver built on the session after close() registers it again.
+    CassandraDriver(session=mock_cassandra_session)
+    assert mock_cassandra_session.add_request_init_listener.call_count == 2
+
+
+def test_cassandra_driver_execute_tuples(cassandra_driver, mock_cassandra_session):
+    from coodie.drivers import cassandra
+
+    result = MagicMock()
+    result.__iter__.return_value = iter([("1", "Alice"), ("2", "Bob")])
+    result.column_names = ["id", "name"]
+    result.paging_state = None
+
+    def execute_async(bound, **kwargs):
+        # The tuple row factory is only requested while the call is submitted.
+        assert cassandra._tuple_rows.active
+        return MagicMock(result=MagicMock(return_value=result))
+
+    mock_cassandra_session.execute_async.side_effect = execute_async
+    columns, rows = cassandra_driver.execute_tuples("SELECT * FROM test_ks.t", [])
+    assert columns == ["id", "name"]
+    assert rows == [("1", "Alice"), ("2", "Bob")]
+    assert not cassandra._tuple_rows.active
+    mock_cassandra_session.execute.assert_not_called()
+
+
+def test_cassandra_driver_execute_paged_tuples(cassandra_driver, mock_cassandra_session):
+    result = MagicMock(current_rows=[("1", "Alice")], column_names=["id", "name"], paging_state=b"next")
+    mock_cassandra_session.execute_async.return_value.result.return_value = result
+    columns, rows, paging_state = cassandra_driver.execute_paged_tuples("SELECT * FROM test_ks.t", [], fetch_size=1)
+    assert (columns, rows, paging_state) == (["id", "name"], [("1", "Alice")], b"next")
+
+
+async def test_cassandra_driver_execute_tuples_async_follows_all_pages(cassandra_driver, mock_cassandra_session):
+    future = _paged_future([([("1", "A")], b"p2"), ([("2", "B")], None)])
+    future._col_names = ["id", "name"]
+    mock_cassandra_session.execute_async.return_value = future
+    columns, rows = await cassandra_driver.execute_tuples_async("SELECT * FROM test_ks.t", [])
+    assert columns == ["id", "name"]
+    assert rows == [("1", "A"), ("2", "B")]
+
+
+def test_default_execute_tuples_converts_dict_rows(registered_mock_driver):
+    registered_mock_driver.set_return_rows([{"id": 1, "name": "a"}, {"id": 2, "name": "b"}])
+    assert registered_mock_driver.execute_tuples("SELECT", []) == (["id", "name"], [(1, "a"), (2, "b")])
+    registered_mock_driver.set_return_rows([{"id": 1}, {"id": 2, "name": "b"}])
+    assert registered_mock_driver.execute_tuples("SELECT", []) == (["id", "name"], [(1, None), (2, "b")])
+
+
+async def test_cassandra_driver_execute_async_paging_error(cassandra_driver, mock_cassandra_session):
+    mock_cassandra_session.execute_async.return_value = _paged_future([], error=RuntimeError("read timeout"))
+    with pytest.raises(RuntimeError, match="read timeout"):
+        await cassandra_driver.execute_async("SELECT * FROM test_ks.t", [], fetch_size=10)
+
+
+def test_cassandra_driver_execute_paged_returns_own_state(cassandra_driver, mock_cassandra_session):
+    result = MagicMock()
+    result.current_rows = [Row(id="1", name="Alice")]
+    result.paging_state = b"next"
+    mock_cassandra_session.execute.return_value = result
+    rows, paging_state = cassandra_driver.execute_paged("SELECT * FROM test_ks.t", [], fetch_size=1)
+    assert rows == [{"id": "1", "name": "Alice"}]
+    assert paging_state == b"next"
+    # The shared attribute is left alone.
+    assert cassandra_driver._last_paging_state is None
+
+
+async def test_cassandra_driver_execute_paged_async_concurrent_cursors(cassandra_driver, mock_cassandra_session):
+    """Concurrent paged queries each get their own paging state back."""
+    import asyncio
+
+    mock_cassandra_session.execute_async.side_effect = [
+        _paged_future([([Row(id="a", name="A")], b"cursor-a")]),
+        _paged_future([([Row(id="b", name="B")], b"cursor-b")]),
+    ]
+    (rows_a, state_a), (rows_b, state_b) = await asyncio.gather(
+        cassandra_driver.execute_paged_async("SELECT * FROM test_ks.t", ["a"], fetch_size=1),
+        cassandra_driver.execute_paged_async("SELECT * FROM test_ks.t", ["b"], fetch_size=1),
+    )
+    assert (rows_a[0]["id"], state_a) == ("a", b"cursor-a")
+    assert (rows_b[0]["id"], state_b) == ("b", b"cursor-b")
 
 
 async def test_cassandra_driver_sync_table_async_cache_hit(cassandra_driver, mock_cassandra_session):
@@ -796,6 +990,29 @@ async def test_acsylla_driver_prepared_cache(acsylla_driver, mock_acsylla_sessio
     mock_acsylla_session.create_prepared.assert_awaited_once()
 
 
+async def test_acsylla_driver_prepared_cache_is_bounded(acsylla_driver, mock_acsylla_session):
+    from coodie.cache import LRUCache
+
+    acsylla_driver._prepared = LRUCache(1)
+    await acsylla_driver.execute_async("SELECT * FROM t WHERE a = ?", [1])
+    await acsylla_driver.execute_async("SELECT * FROM t WHERE b = ?", [1])
+    await acsylla_driver.execute_async("SELECT * FROM t WHERE a = ?", [1])
+    assert mock_acsylla_session.create_prepared.await_count == 3
+    assert acsylla_driver.prepared_cache_info().evictions == 2
+
+
+async def test_acsylla_driver_concurrent_prepare_is_single_flight(acsylla_driver, mock_acsylla_session):
+    prepared = mock_acsylla_session.create_prepared.return_value
+
+    async def slow_prepare(cql):
+        await asyncio.sleep(0.01)
+        return prepared
+
+    mock_acsylla_session.create_prepared.side_effect = slow_prepare
+    await asyncio.gather(*(acsylla_driver.execute_async("SELECT * FROM test_ks.t", []) for _ in range(10)))
+    mock_acsylla_session.create_prepared.assert_awaited_once_with("SELECT * FROM test_ks.t")
+
+
 async def test_acsylla_driver_execute_async_with_consistency(acsylla_driver, mock_acsylla_session):
     await acsylla_driver.execute_async("SELECT * FROM test_ks.t", [], consistency="LOCAL_QUORUM")
     prepared = await mock_acsylla_session.create_prepared("SELECT * FROM test_ks.t")
@@ -918,6 +1135,19 @@ async def test_acsylla_driver_execute_async_with_paging_state(acsylla_driver, mo
     statement.set_page_state.assert_called_once_with(b"page-token")
 
 
+async def test_acsylla_driver_execute_paged_async(acsylla_driver, mock_acsylla_session):
+    mock_result = MagicMock()
+    mock_result.__iter__ = MagicMock(return_value=iter([{"id": "1"}]))
+    mock_result.has_more_pages.return_value = True
+    mock_result.page_state.return_value = b"next-page-token"
+    mock_acsylla_session.execute = AsyncMock(return_value=mock_result)
+
+    rows, paging_state = await acsylla_driver.execute_paged_async("SELECT * FROM test_ks.t", [], fetch_size=1)
+    assert rows == [{"id": "1"}]
+    assert paging_state == b"next-page-token"
+    assert acsylla_driver._last_paging_state is None
+
+
 # ------------------------------------------------------------------
 # Sync bridge: execute(), sync_table(), close() via background loop
 # ------------------------------------------------------------------
@@ -1220,6 +1450,20 @@ def test_init_coodie_lazy_returns_lazy_driver():
     _registry.clear()
 
 
+def test_lazy_driver_prepared_cache_size_forwarded_on_connect():
+    """LazyDriver reports an empty cache before connecting and sizes the real driver's cache."""
+    _registry.clear()
+    driver = init_coodie(hosts=["node1"], keyspace="ks", lazy=True, prepared_cache_size=7)
+    assert driver.prepared_cache_info().currsize == 0
+    assert driver.prepared_cache_info().maxsize == 7
+
+    mock_cluster_cls = MagicMock()
+    with patch.dict("sys.modules", {"cassandra.cluster": MagicMock(Cluster=mock_cluster_cls)}):
+        driver._ensure_connected()
+    assert driver._driver.prepared_cache_info().maxsize == 7
+    _registry.clear()
+
+
 def test_init_coodie_lazy_false_connects_immediately():
     """init_coodie(lazy=False, session=...) returns a CassandraDriver immediately."""
     from coodie.drivers.cassandra import CassandraDriver
@@ -1353,6 +1597,20 @@ async def test_lazy_driver_connects_on_execute_async():
         assert rows == [{"id": "2"}]
 
 
+def test_lazy_driver_execute_paged_delegates():
+    from coodie.drivers.lazy import LazyDriver
+    from coodie.drivers.cassandra import CassandraDriver
+
+    driver = LazyDriver(hosts=["node1"], keyspace="ks", ssl_context=None, kwargs={})
+    mock_inner = MagicMock(spec=CassandraDriver)
+    mock_inner.execute_paged.return_value = ([{"id": "1"}], b"next")
+    with patch.object(driver, "_ensure_connected", side_effect=lambda: setattr(driver, "_driver", mock_inner)):
+        assert driver.execute_paged("SELECT * FROM ks.t", [], fetch_size=1) == ([{"id": "1"}], b"next")
+    mock_inner.execute_paged.assert_called_once_with(
+        "SELECT * FROM ks.t", [], consistency=None, timeout=None, fetch_size=1, paging_state=None
+    )
+
+
 # ------------------------------------------------------------------
 # §14.5.6 Connection-level optimizations
 # ------------------------------------------------------------------
@@ -1475,7 +1733,7 @@ def test_cassandra_driver_sync_table_warm_skipped_on_dry_run(cassandra_driver, m
         [SysRow(column_name="id")],  # system_schema introspection only
     ]
     cassandra_driver.sync_table("my_table", "test_ks", cols, dry_run=True)
-    assert cassandra_driver._prepared == {}
+    assert len(cassandra_driver._prepared) == 0
 
 
 def test_cassandra_driver_sync_table_warm_skipped_on_cache_hit(cassandra_driver, mock_cassandra_session):
@@ -1542,3 +1800,233 @@ def test_cassandra_driver_logs_warning_on_missing_dict_factory(mock_cassandra_se
         with caplog.at_level(logging.WARNING, logger="coodie"):
             CassandraDriver(session=mock_cassandra_session, default_keyspace="ks")
     assert "dict_factory" in caplog.text
+
+
+# ------------------------------------------------------------------
+# Bulk execution: execute_concurrent / execute_many
+# ------------------------------------------------------------------
+
+
+def test_execute_many_default_returns_result_per_params(mock_driver):
+    mock_driver.set_return_rows([{"id": 1}])
+    results = mock_driver.execute_many("INSERT INTO ks.t (id) VALUES (?)", [[1], [2], [3]])
+    assert [r.success for r in results] == [True, True, True]
+    assert results[0].rows == [{"id": 1}]
+    assert [p for _, p in mock_driver.executed] == [[1], [2], [3]]
+
+
+def test_execute_concurrent_default_captures_errors(mock_driver):
+    original = mock_driver.execute
+
+    def flaky(stmt, params, **kwargs):
+        if params == ["bad"]:
+            raise RuntimeError("boom")
+        return original(stmt, params, **kwargs)
+
+    mock_driver.execute = flaky
+    results = mock_driver.execute_concurrent([("Q", ["ok"]), ("Q", ["bad"]), ("Q", ["ok"])])
+    assert [r.success for r in results] == [True, False, True]
+    assert isinstance(results[1].error, RuntimeError)
+
+
+async def test_execute_many_async_bounds_in_flight(mock_driver):
+    import asyncio
+
+    in_flight = 0
+    peak = 0
+
+    async def slow_execute_async(stmt, params, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        return [{"p": params[0]}]
+
+    mock_driver.execute_async = slow_execute_async
+    results = await mock_driver.execute_many_async("Q", [[i] for i in range(20)], concurrency=4)
+    assert peak == 4
+    assert [r.rows[0]["p"] for r in results] == list(range(20))
+
+
+async def test_execute_many_async_empty(mock_driver):
+    assert await mock_driver.execute_many_async("Q", []) == []
+
+
+def _callback_future(result=None, error=None):
+    """Fake ResponseFuture that fires its callback as soon as it is registered."""
+    future = MagicMock()
+
+    def add_callbacks(callback, errback, callback_args=(), errback_args=()):
+        if error is not None:
+            errback(error, *errback_args)
+        else:
+            callback(result, *callback_args)
+
+    future.add_callbacks = add_callbacks
+    return future
+
+
+def test_cassandra_driver_execute_concurrent_pipelines(cassandra_driver, mock_cassandra_session):
+    mock_cassandra_session.execute_async.side_effect = [
+        _callback_future([Row(id="1", name="A")]),
+        _callback_future(error=RuntimeError("timeout")),
+        _callback_future(None),
+    ]
+    results = cassandra_driver.execute_concurrent(
+        [("SELECT * FROM test_ks.t", ["a"]), ("SELECT * FROM test_ks.t", ["b"]), ("SELECT * FROM test_ks.t", ["c"])],
+        concurrency=2,
+    )
+    assert results[0].rows == [{"id": "1", "name": "A"}]
+    assert not results[1].success and isinstance(results[1].error, RuntimeError)
+    assert results[2].success and results[2].rows == []
+    # Prepared once, executed asynchronously three times
+    mock_cassandra_session.prepare.assert_called_once_with("SELECT * FROM test_ks.t")
+    assert mock_cassandra_session.execute_async.call_count == 3
+    mock_cassandra_session.execute.assert_not_called()
+
+
+def test_cassandra_driver_execute_many_window_from_io_threads(cassandra_driver, mock_cassandra_session):
+    """Callbacks fired from other threads release the window and wake the caller."""
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def fake_execute_async(stmt, **kwargs):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        future = MagicMock()
+
+        def add_callbacks(callback, errback, callback_args=(), errback_args=()):
+            def complete():
+                nonlocal in_flight
+                with lock:
+                    in_flight -= 1
+                callback([], *callback_args)
+
+            threading.Timer(0.002, complete).start()
+
+        future.add_callbacks = add_callbacks
+        return future
+
+    mock_cassandra_session.execute_async.side_effect = fake_execute_async
+    results = cassandra_driver.execute_many(
+        "INSERT INTO test_ks.t (id) VALUES (?)", [[i] for i in range(12)], concurrency=3
+    )
+    assert len(results) == 12
+    assert all(r.success for r in results)
+    assert peak <= 3
+
+
+def test_cassandra_driver_execute_concurrent_bind_error(cassandra_driver, mock_cassandra_session):
+    """An error raised while binding is reported for that statement only."""
+    prepared = mock_cassandra_session.prepare.return_value
+    prepared.bind.side_effect = [ValueError("bad param"), prepared]
+    mock_cassandra_session.execute_async.side_effect = [_callback_future([])]
+    results = cassandra_driver.execute_many("INSERT INTO test_ks.t (id) VALUES (?)", [["x"], [1]])
+    assert isinstance(results[0].error, ValueError)
+    assert results[1].success
+
+
+def test_cassandra_driver_execute_concurrent_row_conversion_error(
+    cassandra_driver, mock_cassandra_session, monkeypatch
+):
+    """A row-conversion error in the success callback is reported and frees the window."""
+    mock_cassandra_session.execute_async.side_effect = [_callback_future([Row(id="1", name="A")]) for _ in range(3)]
+    converted = cassandra_driver._rows_to_dicts
+    calls = iter([True, False, True])
+
+    def flaky_rows_to_dicts(rows):
+        if not next(calls):
+            raise TypeError("cannot decode row")
+        return converted(rows)
+
+    monkeypatch.setattr(cassandra_driver, "_rows_to_dicts", flaky_rows_to_dicts)
+    results = cassandra_driver.execute_many("SELECT * FROM test_ks.t", [["a"], ["b"], ["c"]], concurrency=1)
+    assert [r.success for r in results] == [True, False, True]
+    assert isinstance(results[1].error, TypeError)
+
+
+async def test_acsylla_driver_execute_many_async(acsylla_driver, mock_acsylla_session):
+    results = await acsylla_driver.execute_many_async("SELECT * FROM test_ks.t", [["a"], ["b"]], concurrency=2)
+    assert [r.rows for r in results] == [[{"id": "1", "name": "Alice"}]] * 2
+    mock_acsylla_session.create_prepared.assert_awaited_once_with("SELECT * FROM test_ks.t")
+
+
+def test_acsylla_driver_sync_execute_concurrent(acsylla_driver, mock_acsylla_session):
+    mock_acsylla_session.execute = AsyncMock(side_effect=[[{"id": "1"}], RuntimeError("unavailable")])
+    results = acsylla_driver.execute_concurrent(
+        [("SELECT * FROM test_ks.t", ["a"]), ("SELECT * FROM test_ks.t", ["b"])]
+    )
+    assert results[0].rows == [{"id": "1"}]
+    assert isinstance(results[1].error, RuntimeError)
+
+
+# ------------------------------------------------------------------
+# Batches
+# ------------------------------------------------------------------
+
+_BATCH_INSERT = "INSERT INTO test_ks.t (id) VALUES (?)"
+
+
+def test_execute_batch_default_builds_cql_batch(mock_driver):
+    mock_driver.execute_batch([(_BATCH_INSERT, [1]), (_BATCH_INSERT, [2])], logged=False, timeout=5)
+    stmt, params = mock_driver.executed[0]
+    assert stmt.startswith("BEGIN UNLOGGED BATCH")
+    assert params == [1, 2]
+    assert mock_driver.last_timeout == 5
+
+
+def test_cassandra_driver_execute_batch_native(cassandra_driver, mock_cassandra_session):
+    from cassandra.query import BatchStatement, BatchType
+
+    mock_cassandra_session.execute.return_value = []
+    update = "UPDATE test_ks.t SET name = ? WHERE id = ?"
+    cassandra_driver.execute_batch([(_BATCH_INSERT, [1]), (_BATCH_INSERT, [2]), (update, ["a", 1])], logged=False)
+    cassandra_driver.execute_batch([(_BATCH_INSERT, [3])], consistency="QUORUM", timeout=2)
+
+    first, second = (call.args[0] for call in mock_cassandra_session.execute.call_args_list)
+    assert isinstance(first, BatchStatement)
+    assert first.batch_type == BatchType.UNLOGGED
+    assert len(first) == 3
+    assert second.batch_type == BatchType.LOGGED
+    assert mock_cassandra_session.execute.call_args.kwargs == {"timeout": 2}
+    # Members are prepared once each; no batch-shaped statement is prepared.
+    assert sorted(call.args[0] for call in mock_cassandra_session.prepare.call_args_list) == [_BATCH_INSERT, update]
+
+
+def test_cassandra_driver_execute_batch_timestamp_falls_back_to_cql(cassandra_driver, mock_cassandra_session):
+    mock_cassandra_session.execute.return_value = []
+    cassandra_driver.execute_batch([(_BATCH_INSERT, [1])], batch_type="unlogged", timestamp=123)
+    prepared_cql = mock_cassandra_session.prepare.call_args.args[0]
+    assert prepared_cql.startswith("BEGIN UNLOGGED BATCH USING TIMESTAMP 123")
+
+
+async def test_cassandra_driver_execute_batch_async(cassandra_driver, mock_cassandra_session):
+    from cassandra.query import BatchStatement, BatchType
+
+    mock_cassandra_session.execute_async.return_value = _callback_future(result=[{"[applied]": True}])
+    rows = await cassandra_driver.execute_batch_async([(_BATCH_INSERT, [1])], batch_type="COUNTER")
+    assert rows == [{"[applied]": True}]
+    batch = mock_cassandra_session.execute_async.call_args.args[0]
+    assert isinstance(batch, BatchStatement)
+    assert batch.batch_type == BatchType.COUNTER
+
+
+async def test_acsylla_driver_execute_batch_async(acsylla_driver, mock_acsylla_session):
+    mock_acsylla_session.execute_batch = AsyncMock(return_value=[])
+    await acsylla_driver.execute_batch_async([(_BATCH_INSERT, [1]), (_BATCH_INSERT, [2])], logged=False)
+    batch = acsylla_driver._acsylla.create_batch_unlogged.return_value
+    assert batch.add_statement.call_count == 2
+    mock_acsylla_session.execute_batch.assert_awaited_once_with(batch)
+    mock_acsylla_session.create_prepared.assert_awaited_once_with(_BATCH_INSERT)
+
+
+def test_acsylla_driver_sync_execute_batch(acsylla_driver, mock_acsylla_session):
+    mock_acsylla_session.execute_batch = AsyncMock(return_value=[])
+    acsylla_driver.execute_batch([(_BATCH_INSERT, [1])], consistency="QUORUM")
+    batch = acsylla_driver._acsylla.create_batch_logged.return_value
+    batch.set_consistency.assert_called_once_with("QUORUM")
+    mock_acsylla_session.execute_batch.assert_awaited_once_with(batch)
@@ -1,5 +1,7 @@
 """Tests for coodie.lazy.LazyDocument."""
 
+import copy
+import pickle
 from typing import Annotated
 from uuid import UUID, uuid4
 
@@ -8,6 +10,7 @@ from pydantic import Field
 
 from coodie.fields import PrimaryKey
 from coodie.lazy import LazyDocument
+from coodie.sync.document import Document as SyncDocument
 
 
 def _make_doc_cls(base_cls):
@@ -119,6 +122,14 @@ def test_lazy_document_collection_preserved(CollDoc):
     assert lazy.tags == ["a", "b"]
 
 
+def test_lazy_document_from_tuple_row(CollDoc):
+    pid = uuid4()
+    lazy = LazyDocument(CollDoc, (pid, None), ["id", "tags"])
+    assert lazy._parsed is None
+    assert lazy.id == pid
+    assert lazy.tags == []
+
+
 # ------------------------------------------------------------------
 # Equality
 # ------------------------------------------------------------------
@@ -148,3 +159,74 @@ def test_lazy_document_resolve_caches(SimpleDoc):
     doc1 = lazy._resolve()
     doc2 = lazy._resolve()
     assert doc1 is doc2
+
+
+# ------------------------------------------------------------------
+# Per-field access (validate=False)
+# ------------------------------------------------------------------
+
+
+def test_lazy_document_per_field_reads_row(SimpleDoc):
+    pid = uuid4()
+    lazy = LazyDocument(SimpleDoc, (pid, "Bob", "10"), ["id", "name", "rating"], validate=False)
+    assert lazy.id == pid
+    assert lazy.rating == "10"  # straight from the row, like model_construct()
+    assert lazy._parsed is None
+
+
+def test_lazy_document_per_field_collection_coerced(CollDoc):
+    lazy = LazyDocument(CollDoc, {"id": uuid4(), "tags": None}, validate=False)
+    assert lazy.tags == []
+    assert lazy._parsed is None
+
+
+def test_lazy_document_per_field_collection_mutation_sticks(CollDoc):
+    lazy = LazyDocument(CollDoc, {"id": uuid4(), "tags": None}, validate=False)
+    lazy.tags.append("new")
+    assert lazy.tags is lazy.tags
+    assert lazy.tags == ["new"]
+    assert copy.copy(lazy).tags == ["new"]
+    # The constructed model picks up the same value.
+    assert lazy.model_dump()["tags"] == ["new"]
+
+
+def test_lazy_document_per_field_builds_model_for_the_rest(SimpleDoc):
+    pid = uuid4()
+    lazy = LazyDocument(SimpleDoc, (pid, "Eve", None), ["id", "name", "extra"], validate=False)
+    assert lazy.rating == 0  # not selected: default of the constructed model
+    assert isinstance(lazy._parsed, SimpleDoc)
+    assert lazy._parsed.model_fields_set == {"id", "name"}
+
+
+def test_lazy_document_model_dump(SimpleDoc):
+    pid = uuid4()
+    lazy = LazyDocument(SimpleDoc, {"id": pid, "name": "F", "rating": 4}, validate=False)
+    assert lazy.model_dump() == {"id": pid, "name": "F", "rating": 4}
+    assert lazy.model_dump(include={"name"}) == {"name": "F"}
+
+
+# ------------------------------------------------------------------
+# Pickling
+# ------------------------------------------------------------------
+
+
+class PickledDoc(SyncDocument):
+    id: Annotated[UUID, PrimaryKey()] = Field(default_factory=uuid4)
+    name: str = ""
+
+    class Settings:
+        name = "pickled_docs"
+        keyspace = "test_ks"
+
+
+@pytest.mark.parametrize("touch", [False, True])
+def test_lazy_document_pickle_roundtrip(touch):
+    pid = uuid4()
+    lazy = LazyDocument(PickledDoc, (pid, "G"), ["id", "name"], validate=False)
+    if touch:
+        lazy._resolve()
+    restored = pickle.loads(pickle.dumps(lazy))
+    assert (restored._parsed is None) is not touch
+    assert restored.name == "G"
+    assert restored == lazy
+    assert copy.copy(lazy).id == pid
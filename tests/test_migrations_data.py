@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from unittest.mock import AsyncMock
 
 import pytest
 
-from coodie.migrations.base import MigrationContext, _TOKEN_MAX, _TOKEN_MIN
+from coodie.cql_builder import _TOKEN_MAX, _TOKEN_MIN
+from coodie.migrations.base import MigrationContext
 
 
 # ---------------------------------------------------------------------------
@@ -15,7 +17,12 @@ from coodie.migrations.base import MigrationContext, _TOKEN_MAX, _TOKEN_MIN
 # ---------------------------------------------------------------------------
 
 
-def _make_mock_driver(*, pk_columns: list[dict] | None = None, scan_rows: list[dict] | None = None) -> AsyncMock:
+def _make_mock_driver(
+    *,
+    pk_columns: list[dict] | None = None,
+    scan_rows: list[dict] | None = None,
+    pages_per_range: int = 1,
+) -> AsyncMock:
     """Build a mock driver for scan_table tests.
 
     Parameters
@@ -23,7 +30,9 @@ def _make_mock_driver(*, pk_columns: list[dict] | None = None, scan_rows: list[d
     pk_columns:
         Rows returned by the ``system_schema.columns`` query (partition key discovery).
     scan_rows:
-        Rows returned by each token-range ``SELECT`` query.
+        Rows returned by each page of a token-range ``SELECT`` query.
+    pages_per_range:
+        Number of pages each token range is split into.
     """
     driver = AsyncMock()
 
@@ -39,10 +48,20 @@ def _make_mock_driver(*, pk_columns: list[dict] | None = None, scan_rows: list[d
             return list(scan_rows)
         return []
 
+    async def _execute_paged_side_effect(cql: str, params: list | None = None, **kwargs):
+        page = 0 if kwargs.get("paging_state") is None else int(kwargs["paging_state"])
+        next_state = str(page + 1).encode() if page + 1 < pages_per_range else None
+        return await _execute_side_effect(cql, params), next_state
+
     driver.execute_async.side_effect = _execute_side_effect
+    driver.execute_paged_async.side_effect = _execute_paged_side_effect
     return driver
 
 
+def _token_calls(driver: AsyncMock) -> list:
+    return [c for c in driver.execute_paged_async.call_args_list if "SELECT * FROM" in c[0][0]]
+
+
 # ---------------------------------------------------------------------------
 # D.1 — scan_table: token-range batched iteration
 # ---------------------------------------------------------------------------
@@ -74,13 +93,13 @@ class TestScanTable:
             pass
 
         # Should have executed 1 PK discovery query + 2 token-range queries
-        token_calls = [c for c in driver.execute_async.call_args_list if "SELECT * FROM" in str(c)]
+        token_calls = _token_calls(driver)
         assert len(token_calls) == 2
         # Verify CQL contains token()
         for call in token_calls:
             cql = call[0][0]
             assert "token(id)" in cql
-            assert "LIMIT" in cql
+            assert "LIMIT" not in cql
 
     async def test_scan_table_composite_pk(self):
         """scan_table handles composite partition keys."""
@@ -94,22 +113,57 @@ class TestScanTable:
         async for _ in ctx.scan_table("ks", "tbl", num_ranges=1):
             pass
 
-        token_calls = [c for c in driver.execute_async.call_args_list if "SELECT * FROM" in str(c)]
+        token_calls = _token_calls(driver)
         assert len(token_calls) == 1
         cql = token_calls[0][0][0]
         assert "token(region, user_id)" in cql
 
     async def test_scan_table_page_size(self):
-        """page_size is reflected in the LIMIT clause."""
+        """page_size is used as the fetch size of every range query."""
         driver = _make_mock_driver()
         ctx = MigrationContext(driver, dry_run=False)
 
         async for _ in ctx.scan_table("ks", "tbl", page_size=500, num_ranges=1):
             pass
 
-        token_calls = [c for c in driver.execute_async.call_args_list if "SELECT * FROM" in str(c)]
-        cql = token_calls[0][0][0]
-        assert "LIMIT 500" in cql
+        token_calls = _token_calls(driver)
+        assert token_calls[0][1]["fetch_size"] == 500
+
+    async def test_scan_table_pages_through_large_ranges(self):
+        """A range holding more than page_size rows is paged through, not truncated."""
+        driver = _make_mock_driver(scan_rows=[{"id": 1}], pages_per_range=3)
+        ctx = MigrationContext(driver, dry_run=False)
+
+        collected = [row async for row in ctx.scan_table("ks", "tbl", page_size=1, num_ranges=2)]
+
+        assert len(collected) == 6
+        token_calls = _token_calls(driver)
+        assert len(token_calls) == 6
+        states = sorted((c[0][1][0], c[1]["paging_state"] or b"") for c in token_calls)
+        assert [state for _, state in states] == [b"", b"1", b"2"] * 2
+
+    async def test_scan_table_parallelism_bounds_in_flight_ranges(self):
+        """No more than *parallelism* range queries are in flight at once."""
+        in_flight = 0
+        peak = 0
+
+        async def _slow_page(cql: str, params: list | None = None, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return [{"id": params[1]}], None
+
+        driver = _make_mock_driver()
+        driver.execute_paged_async.side_effect = _slow_page
+        ctx = MigrationContext(driver, dry_run=False)
+
+        collected = [row async for row in ctx.scan_table("ks", "tbl", num_ranges=8, parallelism=3)]
+
+        assert peak == 3
+        # Rows still come back in token order
+        assert [row["id"] for row in collected] == sorted(row["id"] for row in collected)
 
     async def test_scan_table_dry_run(self):
         """In dry-run mode, scan_table yields a placeholder and does not call driver."""
@@ -153,7 +207,7 @@ class TestScanTable:
         async for _ in ctx.scan_table("ks", "tbl", num_ranges=4):
             pass
 
-        token_calls = [c for c in driver.execute_async.call_args_list if "SELECT * FROM" in str(c)]
+        token_calls = _token_calls(driver)
         # First range starts at _TOKEN_MIN, last range ends at _TOKEN_MAX
         first_params = token_calls[0][0][1]
         last_params = token_calls[-1][0][1]
@@ -206,25 +260,37 @@ class TestScanTableResume:
     """Tests for resume-from-token support (D.3)."""
 
     async def test_resume_skips_processed_ranges(self):
-        """resume_token causes ranges with start <= resume_token to be skipped."""
+        """resume_token skips ranges ending at or before it."""
         driver = _make_mock_driver(scan_rows=[{"id": 1}])
         ctx = MigrationContext(driver, dry_run=False)
 
-        # Use 4 ranges, resume from a token past the first range
+        # Use 4 ranges, resume from the end of the first one
         range_size = (_TOKEN_MAX - _TOKEN_MIN) // 4
-        # resume_token is set to the start of the 2nd range, so first 2 ranges are skipped
         resume_at = _TOKEN_MIN + range_size
 
         collected = []
         async for row in ctx.scan_table("ks", "tbl", num_ranges=4, resume_token=resume_at):
             collected.append(row)
 
-        # Only ranges whose start > resume_at are processed
-        token_calls = [c for c in driver.execute_async.call_args_list if "SELECT * FROM" in str(c)]
-        # Ranges: [_TOKEN_MIN, _TOKEN_MIN+range_size, _TOKEN_MIN+2*range_size, _TOKEN_MIN+3*range_size]
-        # resume_token = _TOKEN_MIN + range_size → skip ranges starting at _TOKEN_MIN (<=) and _TOKEN_MIN+range_size (<=)
-        # Process: ranges starting at _TOKEN_MIN+2*range_size and _TOKEN_MIN+3*range_size
-        assert len(token_calls) == 2
+        token_calls = _token_calls(driver)
+        assert len(token_calls) == 3
+        assert token_calls[0][0][1][0] == resume_at
+
+    async def test_resume_clips_range_containing_token(self):
+        """A resume_token inside a range resumes right after it, not at the range start."""
+        driver = _make_mock_driver(scan_rows=[{"id": 1}])
+        ctx = MigrationContext(driver, dry_run=False)
+
+        range_size = (_TOKEN_MAX - _TOKEN_MIN) // 4
+        resume_at = _TOKEN_MIN + range_size + 12345
+
+        async for _ in ctx.scan_table("ks", "tbl", num_ranges=4, resume_token=resume_at):
+            pass
+
+        token_calls = _token_calls(driver)
+        assert len(token_calls) == 3
+        assert token_calls[0][0][1][0] == resume_at
+        assert token_calls[-1][0][1][1] == _TOKEN_MAX
 
     async def test_resume_none_processes_all(self):
         """resume_token=None processes all ranges."""
@@ -235,7 +301,7 @@ class TestScanTableResume:
         async for row in ctx.scan_table("ks", "tbl", num_ranges=3, resume_token=None):
             collected.append(row)
 
-        token_calls = [c for c in driver.execute_async.call_args_list if "SELECT * FROM" in str(c)]
+        token_calls = _token_calls(driver)
         assert len(token_calls) == 3
 
     async def test_resume_past_all_ranges(self):
@@ -249,6 +315,47 @@ class TestScanTableResume:
 
         assert len(collected) == 0
 
+    async def test_checkpoint_called_in_token_order(self):
+        """checkpoint receives each completed range's end token, in order."""
+        driver = _make_mock_driver(scan_rows=[{"id": 1}], pages_per_range=2)
+        ctx = MigrationContext(driver, dry_run=False)
+        seen_rows = 0
+        checkpoints: list[tuple[int, int]] = []
+
+        def _checkpoint(token: int) -> None:
+            checkpoints.append((token, seen_rows))
+
+        async for _ in ctx.scan_table("ks", "tbl", num_ranges=4, parallelism=4, checkpoint=_checkpoint):
+            seen_rows += 1
+
+        tokens = [token for token, _ in checkpoints]
+        assert tokens == sorted(tokens)
+        assert tokens[-1] == _TOKEN_MAX
+        # Each checkpoint fires only after all rows of its range were consumed
+        assert [rows for _, rows in checkpoints] == [2, 4, 6, 8]
+
+    async def test_checkpoint_resumes_scan(self):
+        """Resuming from the last checkpoint scans only the remaining ranges."""
+        driver = _make_mock_driver(scan_rows=[{"id": 1}])
+        ctx = MigrationContext(driver, dry_run=False)
+        checkpoints: list[int] = []
+
+        async def _checkpoint(token: int) -> None:
+            checkpoints.append(token)
+
+        async for _ in ctx.scan_table("ks", "tbl", num_ranges=4, checkpoint=_checkpoint):
+            if len(checkpoints) == 2:
+                break
+
+        driver = _make_mock_driver(scan_rows=[{"id": 1}])
+        ctx = MigrationContext(driver, dry_run=False)
+        async for _ in ctx.scan_table("ks", "tbl", num_ranges=4, resume_token=checkpoints[-1]):
+            pass
+
+        token_calls = _token_calls(driver)
+        assert len(token_calls) == 2
+        assert token_calls[0][0][1][0] == checkpoints[-1]
+
 
 # ---------------------------------------------------------------------------
 # D.4 — Rate limiting / throttle
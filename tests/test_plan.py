@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from typing import Annotated
+
+import pytest
+
+from coodie.fields import ClusteringKey, PrimaryKey
+from coodie.plan import _plans, _statement_plan
+from tests.conftest import MockDriver, _maybe_await
+from tests.models import make_pet_hierarchy, make_product
+
+
+@pytest.fixture(params=["sync", "async"])
+def variant(request):
+    return request.param
+
+
+@pytest.fixture
+def document_cls(variant):
+    if variant == "sync":
+        from coodie.sync.document import Document
+
+        return Document
+    from coodie.aio.document import Document
+
+    return Document
+
+
+@pytest.fixture
+def Product(document_cls):
+    return make_product(document_cls)
+
+
+def test_statement_plan_compiles_write_cql(Product, registered_mock_driver):
+    plan = _statement_plan(Product)
+    assert plan.driver is registered_mock_driver
+    assert (plan.table, plan.keyspace) == ("products", "test_ks")
+    assert plan.upsert_cql.startswith("INSERT INTO test_ks.products (")
+    assert plan.insert_cql == plan.upsert_cql + " IF NOT EXISTS"
+    assert plan.delete_cql == 'DELETE FROM test_ks.products WHERE "id" = ?'
+    assert plan.insert_statement(ttl=60).endswith(" USING TTL 60")
+
+
+def test_statement_plan_is_cached_per_class(Product, registered_mock_driver):
+    assert _statement_plan(Product) is _statement_plan(Product)
+
+
+def test_statement_plan_rebuilt_when_driver_changes(Product, registered_mock_driver):
+    from coodie.drivers import register_driver
+
+    plan = _statement_plan(Product)
+    other = MockDriver()
+    register_driver("default", other, default=True)
+    rebuilt = _statement_plan(Product)
+    assert rebuilt is not plan
+    assert rebuilt.driver is other
+
+
+async def test_save_and_delete_use_compiled_plan(Product, registered_mock_driver):
+    doc = Product(name="Widget")
+    await _maybe_await(doc.save)
+    await _maybe_await(doc.delete)
+    plan = _plans.get(Product)
+    assert [cql for cql, _ in registered_mock_driver.executed] == [plan.upsert_cql, plan.delete_cql]
+    assert registered_mock_driver.executed[1][1] == [doc.id]
+
+
+async def test_sync_table_compiles_plan(Product, registered_mock_driver):
+    _plans.pop(Product)
+    await _maybe_await(Product.sync_table)
+    assert Product in _plans
+
+
+async def test_sync_table_dry_run_does_not_compile_plan(Product, registered_mock_driver):
+    _plans.pop(Product)
+    await _maybe_await(Product.sync_table, dry_run=True)
+    assert Product not in _plans
+
+
+def test_statement_plan_sets_discriminator(document_cls, registered_mock_driver):
+    _, Cat, _ = make_pet_hierarchy(document_cls)
+    plan = _statement_plan(Cat)
+    values = plan.insert_values(Cat(name="Tom"))
+    assert values[plan.insert_columns.index("pet_type")] == "cat"
+    assert plan.table == "pets"
+
+
+def test_statement_plan_select_by_pk_matches_warmed_statement(document_cls, registered_mock_driver):
+    class Event(document_cls):
+        day: Annotated[str, PrimaryKey(partition_key_index=1)]
+        ts: Annotated[int, ClusteringKey()]
+        source: Annotated[str, PrimaryKey(partition_key_index=0)]
+
+        class Settings:
+            name = "events"
+            keyspace = "test_ks"
+
+    plan = _statement_plan(Event)
+    assert plan.key_columns == ("source", "day", "ts")
+    assert plan.select_by_pk_cql == 'SELECT * FROM test_ks.events WHERE "source" = ? AND "day" = ? AND "ts" = ?'
+
+
+async def test_get_by_full_primary_key_uses_select_by_pk(Product, registered_mock_driver):
+    doc = Product(name="Widget")
+    registered_mock_driver.set_return_rows([doc.model_dump()])
+    found = await _maybe_await(Product.get, id=doc.id)
+    assert found.name == "Widget"
+    plan = _plans.get(Product)
+    assert registered_mock_driver.executed == [(plan.select_by_pk_cql, [doc.id])]
+
+
+async def test_find_one_with_other_filters_uses_queryset(Product, registered_mock_driver):
+    await _maybe_await(Product.find_one, id=1, name="Widget")
+    cql, _ = registered_mock_driver.executed[0]
+    assert "LIMIT ?" in cql
+
+
+async def test_get_by_pk_requires_exactly_the_primary_key(Product, registered_mock_driver):
+    from coodie.exceptions import DocumentNotFound, InvalidQueryError
+
+    with pytest.raises(InvalidQueryError, match=r"exactly the primary key columns \['id'\]"):
+        await _maybe_await(Product.get_by_pk, id=1, name="Widget")
+    with pytest.raises(DocumentNotFound):
+        await _maybe_await(Product.get_by_pk, id=1)
+
+
+async def test_find_one_by_pk_respects_polymorphic_subclass(document_cls, registered_mock_driver):
+    _, Cat, Dog = make_pet_hierarchy(document_cls)
+    cat = Cat(name="Tom")
+    row = {**cat.model_dump(), "pet_type": "cat"}
+    registered_mock_driver.set_return_rows([row])
+    assert await _maybe_await(Dog.find_one, id=cat.id) is None
+    registered_mock_driver.set_return_rows([row])
+    found = await _maybe_await(Cat.find_one, id=cat.id)
+    assert isinstance(found, Cat)
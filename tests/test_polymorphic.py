@@ -197,6 +197,13 @@ async def test_insert_sets_discriminator(registered_mock_driver, Dog):
     assert "dog" in params
 
 
+async def test_bulk_save_sets_discriminator_per_subclass(registered_mock_driver, Cat, Dog):
+    await _maybe_await(Cat.bulk_save, [Cat(name="Whiskers"), Dog(name="Buddy")])
+    (_, cat_params), (_, dog_params) = registered_mock_driver.executed
+    assert "cat" in cat_params
+    assert "dog" in dog_params
+
+
 async def test_base_save_without_discriminator_value(registered_mock_driver, Pet):
     """Base class without __discriminator_value__ saves normally."""
     pet = Pet(name="Generic")
@@ -308,7 +315,7 @@ def test_queryset_iter_polymorphic(registered_mock_driver, variant, Pet, Cat):
             {"id": uuid4(), "name": "Whiskers", "pet_type": "cat", "cuteness": 9.5},
         ]
     )
-    items = list(Pet.find())
+    items = [doc for doc in Pet.find()]
     assert len(items) == 1
     assert isinstance(items[0], Cat)
 
@@ -317,3 +324,62 @@ async def test_queryset_first_polymorphic(registered_mock_driver, Pet, Dog):
     registered_mock_driver.set_return_rows([{"id": uuid4(), "name": "Buddy", "pet_type": "dog", "loudness": 8}])
     doc = await _maybe_await(Pet.find().first)
     assert isinstance(doc, Dog)
+
+
+# ------------------------------------------------------------------
+# Subclass map cache and hydration
+# ------------------------------------------------------------------
+
+
+def test_subclass_map_is_cached_and_refreshed(Pet, Cat, Dog):
+    from coodie.schema import _subclass_map
+
+    mapping = _subclass_map(Pet)
+    assert _subclass_map(Pet) is mapping
+    assert set(mapping) == {"cat", "dog"}
+
+    class Bird(Cat):
+        class Settings:
+            __discriminator_value__ = "bird"
+
+    assert _subclass_map(Pet)["bird"] is Bird
+
+
+async def test_polymorphic_rows_use_model_construct(registered_mock_driver, Pet, Cat, Dog):
+    rows = [
+        {"id": uuid4(), "name": "Whiskers", "pet_type": "cat", "cuteness": 9.5, "loudness": None},
+        {"id": uuid4(), "name": "Buddy", "pet_type": "dog", "cuteness": None, "loudness": "8"},
+    ]
+    registered_mock_driver.set_return_rows(rows)
+    cat, dog = await _maybe_await(Pet.find().all)
+    assert isinstance(cat, Cat) and isinstance(dog, Dog)
+    # Columns of sibling subclasses are dropped, and values are not coerced.
+    assert cat.model_fields_set == {"id", "name", "pet_type", "cuteness"}
+    assert dog.loudness == "8"
+
+    registered_mock_driver.set_return_rows(rows)
+    cat, dog = await _maybe_await(Pet.find().validate().all)
+    assert dog.loudness == 8
+
+
+async def test_polymorphic_rows_fill_collection_defaults(registered_mock_driver, document_cls):
+    from coodie.fields import Discriminator
+
+    class Shape(document_cls):
+        id: Annotated[UUID, PrimaryKey()] = Field(default_factory=uuid4)
+        kind: Annotated[str, Discriminator()] = ""
+
+        class Settings:
+            name = "shapes"
+            keyspace = "test_ks"
+
+    class Polygon(Shape):
+        points: list[int] = Field(default_factory=list)
+
+        class Settings:
+            __discriminator_value__ = "polygon"
+
+    registered_mock_driver.set_return_rows([{"id": uuid4(), "kind": "polygon", "points": None}])
+    [shape] = await _maybe_await(Shape.find().all)
+    assert isinstance(shape, Polygon)
+    assert shape.points == []
@@ -483,3 +483,24 @@ def test_init_coodie_python_rs_with_hosts():
     mock_scylla.session_builder.SessionBuilder.assert_called_once()
     mock_builder.connect.assert_awaited_once()
     _registry.clear()
+
+
+# ------------------------------------------------------------------
+# Bulk execution
+# ------------------------------------------------------------------
+
+
+async def test_execute_many_async_prepares_once(python_rs_driver, mock_scylla_session):
+    results = await python_rs_driver.execute_many_async("SELECT * FROM ks.t WHERE id = ?", [["1"], ["2"], ["3"]])
+    assert len(results) == 3
+    assert all(r.success for r in results)
+    mock_scylla_session.prepare.assert_awaited_once_with("SELECT * FROM ks.t WHERE id = ?")
+    assert mock_scylla_session.execute.await_count == 3
+
+
+async def test_execute_paged_async_is_single_final_page(python_rs_driver, mock_scylla_session):
+    rows, paging_state = await python_rs_driver.execute_paged_async(
+        "SELECT * FROM test_ks.t", [], fetch_size=10, paging_state=b"ignored"
+    )
+    assert rows == [{"id": "1", "name": "Alice"}]
+    assert paging_state is None
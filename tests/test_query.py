@@ -11,9 +11,10 @@ from uuid import UUID, uuid4
 import pytest
 from pydantic import Field
 
+from coodie.exceptions import InvalidQueryError
 from coodie.fields import PrimaryKey
 from tests.conftest import _maybe_await
-from tests.models import make_item
+from tests.models import make_item, make_pet_hierarchy
 
 
 # ------------------------------------------------------------------
@@ -126,10 +127,23 @@ async def test_iter(variant, Item, queryset_cls, registered_mock_driver):
             {"id": uuid4(), "name": "D", "rating": 2},
         ]
     )
-    items = list(queryset_cls(Item))
+    items = [doc for doc in queryset_cls(Item)]
     assert len(items) == 2
 
 
+def test_list_asks_len_for_a_size_hint(variant, Item, queryset_cls, registered_mock_driver):
+    if variant == "async":
+        pytest.skip("__iter__ is sync-only")
+    # list() sizes its result with len(qs), i.e. a COUNT, before streaming the rows.
+    registered_mock_driver.set_return_rows([{"count": 1}])
+    registered_mock_driver.set_return_rows([{"id": uuid4(), "name": "C", "rating": 1}])
+    assert len(list(queryset_cls(Item))) == 1
+    assert [cql for cql, _ in registered_mock_driver.executed] == [
+        "SELECT COUNT(*) FROM test_ks.items",
+        "SELECT * FROM test_ks.items",
+    ]
+
+
 async def test_aiter(variant, Item, queryset_cls, registered_mock_driver):
     if variant == "sync":
         pytest.skip("__aiter__ is async-only")
@@ -155,9 +169,9 @@ async def test_chaining(Item, queryset_cls, registered_mock_driver):
     qs = queryset_cls(Item).filter(rating__gte=3).limit(10).order_by("-rating").allow_filtering()
     await _maybe_await(qs.all)
     stmt, params = registered_mock_driver.executed[0]
-    assert "LIMIT 10" in stmt
+    assert "LIMIT ?" in stmt
     assert "ALLOW FILTERING" in stmt
-    assert params == [3]
+    assert params == [3, 10]
 
 
 # ------------------------------------------------------------------
@@ -397,6 +411,17 @@ async def test_values_list_returns_tuples(Item, queryset_cls, registered_mock_dr
     assert results == [("A", 5), ("B", 3)]
 
 
+def test_select_values_picks_columns_from_tuple_rows():
+    from coodie.sync.query import _select_values
+
+    columns = ["id", "name", "rating"]
+    rows = [(1, "A", 5), (2, "B", 3)]
+    assert _select_values(columns, rows, ["rating", "name"]) == [(5, "A"), (3, "B")]
+    assert _select_values(columns, rows, ["name"]) == [("A",), ("B",)]
+    assert _select_values(columns, rows, columns) == rows
+    assert _select_values(columns, rows, ["name", "missing"]) == [("A", None), ("B", None)]
+
+
 def test_values_list_preserves_through_chaining(Item, queryset_cls, registered_mock_driver):
     qs = queryset_cls(Item).values_list("name").filter(rating__gte=3).limit(5)
     assert qs._values_list_val == ["name"]
@@ -410,8 +435,9 @@ def test_per_partition_limit_returns_new_queryset(Item, queryset_cls, registered
 async def test_per_partition_limit_in_cql(Item, queryset_cls, registered_mock_driver):
     registered_mock_driver.set_return_rows([])
     await _maybe_await(queryset_cls(Item).per_partition_limit(3).all)
-    stmt, _ = registered_mock_driver.executed[0]
-    assert "PER PARTITION LIMIT 3" in stmt
+    stmt, params = registered_mock_driver.executed[0]
+    assert "PER PARTITION LIMIT ?" in stmt
+    assert params == [3]
 
 
 async def test_like_filter(Item, queryset_cls, registered_mock_driver):
@@ -595,7 +621,10 @@ async def test_all_lazy_defers_parsing(Item, queryset_cls, registered_mock_drive
     results = await _maybe_await(queryset_cls(Item).all, lazy=True)
     lazy = results[0]
     assert lazy._parsed is None
-    _ = lazy.name
+    assert lazy.name == "B"
+    # Selected columns are read straight from the row.
+    assert lazy._parsed is None
+    assert lazy.model_dump()["rating"] == 3
     assert lazy._parsed is not None
 
 
@@ -973,8 +1002,9 @@ async def test_json_with_filter(Item, queryset_cls, registered_mock_driver):
 async def test_json_with_limit(Item, queryset_cls, registered_mock_driver):
     registered_mock_driver.set_return_rows([])
     await _maybe_await(queryset_cls(Item).limit(5).json)
-    stmt, _ = registered_mock_driver.executed[0]
-    assert "LIMIT 5" in stmt
+    stmt, params = registered_mock_driver.executed[0]
+    assert "LIMIT ?" in stmt
+    assert params == [5]
 
 
 async def test_json_returns_json_strings(Item, queryset_cls, registered_mock_driver):
@@ -1045,3 +1075,224 @@ async def test_column_ttl_with_filter(Item, queryset_cls, registered_mock_driver
 async def test_column_ttl_returns_none_on_empty(Item, queryset_cls, registered_mock_driver):
     result = await _maybe_await(queryset_cls(Item).column_ttl, "name")
     assert result is None
+
+
+# ------------------------------------------------------------------
+# QuerySet.stream()
+# ------------------------------------------------------------------
+
+
+async def _consume(iterable):
+    if hasattr(iterable, "__aiter__"):
+        return [item async for item in iterable]
+    return list(iterable)
+
+
+async def test_stream_follows_paging_state(Item, queryset_cls, registered_mock_driver):
+    registered_mock_driver.set_return_rows([{"id": uuid4(), "name": "A", "rating": 1}])
+    registered_mock_driver.set_paging_state(b"page-2")
+    registered_mock_driver.set_return_rows([{"id": uuid4(), "name": "B", "rating": 2}])
+    registered_mock_driver.set_paging_state(None)
+    items = await _consume(queryset_cls(Item).stream(fetch_size=1))
+    assert [i.name for i in items] == ["A", "B"]
+    assert len(registered_mock_driver.executed) == 2
+    assert registered_mock_driver.last_paging_state == b"page-2"
+    assert registered_mock_driver.last_fetch_size == 1
+
+
+async def test_stream_defaults_fetch_size(Item, queryset_cls, registered_mock_driver):
+    registered_mock_driver.set_return_rows([])
+    await _consume(queryset_cls(Item).stream())
+    assert registered_mock_driver.last_fetch_size == 5000
+    await _consume(queryset_cls(Item).fetch_size(20).stream())
+    assert registered_mock_driver.last_fetch_size == 20
+
+
+async def test_stream_starts_from_page(Item, queryset_cls, registered_mock_driver):
+    registered_mock_driver.set_return_rows([])
+    await _consume(queryset_cls(Item).page(b"resume").stream())
+    assert registered_mock_driver.last_paging_state == b"resume"
+
+
+async def test_stream_values_list(Item, queryset_cls, registered_mock_driver):
+    registered_mock_driver.set_return_rows([{"name": "A"}, {"name": "B"}])
+    items = await _consume(queryset_cls(Item).values_list("name").stream())
+    assert items == [("A",), ("B",)]
+
+
+async def test_stream_lazy(Item, queryset_cls, registered_mock_driver):
+    from coodie.lazy import LazyDocument
+
+    registered_mock_driver.set_return_rows([{"id": uuid4(), "name": "A", "rating": 1}])
+    items = await _consume(queryset_cls(Item).stream(lazy=True))
+    assert isinstance(items[0], LazyDocument)
+
+
+async def test_stream_prefetches_next_page(variant, Item, queryset_cls, registered_mock_driver):
+    if variant == "sync":
+        pytest.skip("prefetch is async-only")
+    registered_mock_driver.set_return_rows([{"id": uuid4(), "name": "A", "rating": 1}])
+    registered_mock_driver.set_paging_state(b"page-2")
+    registered_mock_driver.set_return_rows([{"id": uuid4(), "name": "B", "rating": 2}])
+    stream = queryset_cls(Item).stream(fetch_size=1)
+    first = await stream.__anext__()
+    assert first.name == "A"
+    # Page 2 was requested before page 1 was handed out.
+    assert len(registered_mock_driver.executed) == 2
+    await stream.aclose()
+
+
+def test_iter_is_lazy(variant, Item, queryset_cls, registered_mock_driver):
+    if variant == "async":
+        pytest.skip("__iter__ is sync-only")
+    it = iter(queryset_cls(Item))
+    assert registered_mock_driver.executed == []
+    registered_mock_driver.set_return_rows([{"id": uuid4(), "name": "A", "rating": 1}])
+    assert next(it).name == "A"
+    assert len(registered_mock_driver.executed) == 1
+
+
+async def test_paged_all_uses_per_call_paging_state(variant, Item, queryset_cls, registered_mock_driver):
+    """paged_all() takes the cursor returned by execute_paged, not the shared driver attribute."""
+    registered_mock_driver._last_paging_state = b"someone-else"
+
+    def execute_paged(*args, **kwargs):
+        return [{"id": uuid4(), "name": "A", "rating": 1}], b"mine"
+
+    async def execute_paged_async(*args, **kwargs):
+        return execute_paged()
+
+    registered_mock_driver.execute_paged = execute_paged
+    registered_mock_driver.execute_paged_async = execute_paged_async
+    result = await _maybe_await(queryset_cls(Item).fetch_size(1).paged_all)
+    assert result.paging_state == b"mine"
+    assert result.data[0].name == "A"
+
+
+# ------------------------------------------------------------------
+# QuerySet.scan()
+# ------------------------------------------------------------------
+
+
+def _fake_range_pages(driver):
+    """Serve two pages per token range from execute_paged(_async); rows record the range start."""
+    calls = []
+
+    def execute_paged(stmt, params, fetch_size=None, paging_state=None, **kwargs):
+        calls.append((stmt, params, fetch_size, paging_state))
+        lo = params[0]
+        if paging_state is None:
+            return [{"id": uuid4(), "name": f"{lo}:1", "rating": 1}], b"more"
+        return [{"id": uuid4(), "name": f"{lo}:2", "rating": 2}], None
+
+    async def execute_paged_async(*args, **kwargs):
+        return execute_paged(*args, **kwargs)
+
+    driver.execute_paged = execute_paged
+    driver.execute_paged_async = execute_paged_async
+    return calls
+
+
+async def test_scan_walks_all_ranges_in_token_order(Item, queryset_cls, registered_mock_driver):
+    from coodie.cql_builder import token_ranges
+
+    calls = _fake_range_pages(registered_mock_driver)
+    checkpoints = []
+    items = await _consume(
+        queryset_cls(Item).scan(parallelism=2, ranges=3, fetch_size=7, checkpoint=checkpoints.append)
+    )
+    expected = [lo for lo, _ in token_ranges(3)]
+    assert [i.name for i in items] == [f"{lo}:{page}" for lo in expected for page in (1, 2)]
+    assert checkpoints == [hi for _, hi in token_ranges(3)]
+    assert len(calls) == 6
+    stmt = calls[0][0]
+    assert 'WHERE TOKEN("id") > ? AND TOKEN("id") <= ?' in stmt
+    assert all(fetch_size == 7 for _, _, fetch_size, _ in calls)
+
+
+async def test_scan_resume_token_and_filters(Item, queryset_cls, registered_mock_driver):
+    calls = _fake_range_pages(registered_mock_driver)
+    qs = queryset_cls(Item).filter(rating__gte=1).allow_filtering()
+    await _consume(qs.scan(parallelism=1, ranges=2, resume_token=0))
+    starts = sorted({params[0] for _, params, _, _ in calls})
+    assert starts[0] == 0
+    assert all(params[2:] == [1] for _, params, _, _ in calls)
+    assert '"rating" >= ?' in calls[0][0]
+
+
+async def test_scan_raw_rows(Item, queryset_cls, registered_mock_driver):
+    _fake_range_pages(registered_mock_driver)
+    rows = await _consume(queryset_cls(Item).scan(parallelism=1, ranges=1, raw=True))
+    assert isinstance(rows[0], dict)
+    assert len(rows) == 2
+
+
+async def test_scan_composite_partition_key(document_cls, queryset_cls, registered_mock_driver):
+    class Reading(document_cls):
+        region: Annotated[str, PrimaryKey(partition_key_index=0)]
+        sensor: Annotated[str, PrimaryKey(partition_key_index=1)]
+        value: float = 0.0
+
+        class Settings:
+            name = "readings"
+            keyspace = "test_ks"
+
+    calls = _fake_range_pages(registered_mock_driver)
+    await _consume(queryset_cls(Reading).scan(parallelism=1, ranges=1, raw=True))
+    assert 'TOKEN("region", "sensor") > ?' in calls[0][0]
+
+
+async def test_scan_rejects_limit(Item, queryset_cls, registered_mock_driver):
+    with pytest.raises(InvalidQueryError, match="scan"):
+        await _consume(queryset_cls(Item).limit(10).scan())
+
+
+# ------------------------------------------------------------------
+# Compiled kwarg lookups
+# ------------------------------------------------------------------
+
+
+def test_filter_compiles_operators(Item, queryset_cls, registered_mock_driver):
+    qs = queryset_cls(Item).filter(name="a", rating__gte=2, id__token__gt=5, name__in=["a"])
+    assert qs._where == [("name", "=", "a"), ("rating", ">=", 2), ("id", "TOKEN >", 5), ("name", "IN", ["a"])]
+
+
+def test_filter_unknown_column_suggests_match(Item, queryset_cls, registered_mock_driver):
+    with pytest.raises(InvalidQueryError, match="Unknown column 'ratting' for Item; did you mean 'rating'"):
+        queryset_cls(Item).filter(ratting__gt=1)
+
+
+def test_filter_unsupported_lookup(Item, queryset_cls, registered_mock_driver):
+    with pytest.raises(InvalidQueryError, match="Unsupported lookup 'rating__between'"):
+        queryset_cls(Item).filter(rating__between=1)
+
+
+def test_filter_polymorphic_accepts_hierarchy_columns(document_cls, queryset_cls, registered_mock_driver):
+    Pet, Cat, _Dog = make_pet_hierarchy(document_cls)
+    assert queryset_cls(Pet).filter(cuteness__gt=1.0)._where == [("cuteness", ">", 1.0)]
+    assert queryset_cls(Cat).filter(loudness=1)._where == [("loudness", "=", 1)]
+    with pytest.raises(InvalidQueryError, match="Unknown column 'loudnes' for Cat; did you mean 'loudness'"):
+        queryset_cls(Cat).filter(loudnes=1)
+
+
+def test_filter_accepts_field_aliases(document_cls, queryset_cls, registered_mock_driver):
+    class Labelled(document_cls):
+        id: Annotated[UUID, PrimaryKey()] = Field(default_factory=uuid4)
+        name: str = Field(default="", alias="label")
+
+        class Settings:
+            name = "labelled"
+            keyspace = "test_ks"
+
+    assert queryset_cls(Labelled).filter(label__in=["b"])._where == [("name", "IN", ["b"])]
+    assert queryset_cls(Labelled).filter(name="b")._where == [("name", "=", "b")]
+
+
+async def test_update_rejects_unknown_columns(Item, queryset_cls, registered_mock_driver):
+    with pytest.raises(InvalidQueryError, match="Unknown column 'nme'"):
+        await _maybe_await(queryset_cls(Item).filter(id=uuid4()).update, nme="x")
+    with pytest.raises(InvalidQueryError, match="Unknown column 'ratng'"):
+        await _maybe_await(queryset_cls(Item).filter(id=uuid4()).delete, if_conditions={"ratng__gt": 1})
+    with pytest.raises(InvalidQueryError, match="Unknown column 'nme'"):
+        await _maybe_await(Item(name="a").update, name="b", if_conditions={"nme": "a"})
+    assert registered_mock_driver.executed == []
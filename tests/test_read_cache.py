@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Annotated
+from uuid import UUID, uuid4
+
+import pytest
+from pydantic import Field
+
+from coodie import read_cache
+from coodie.exceptions import ConfigurationError, DocumentNotFound
+from coodie.fields import PrimaryKey
+from tests.conftest import _maybe_await
+
+
+@pytest.fixture(params=["sync", "async"])
+def variant(request):
+    return request.param
+
+
+@pytest.fixture
+def document_cls(variant):
+    if variant == "sync":
+        from coodie.sync.document import Document
+
+        return Document
+    from coodie.aio.document import Document
+
+    return Document
+
+
+def _make_profile(document_cls, cache=None):
+    class Profile(document_cls):
+        id: Annotated[UUID, PrimaryKey()] = Field(default_factory=uuid4)
+        name: str = ""
+
+        class Settings:
+            name = "profiles"
+            keyspace = "test_ks"
+            __cache__ = cache
+
+    return Profile
+
+
+@pytest.fixture
+def Profile(document_cls):
+    return _make_profile(document_cls, {"ttl": 30, "maxsize": 2})
+
+
+def _selects(driver) -> int:
+    return sum(1 for cql, _ in driver.executed if cql.startswith("SELECT"))
+
+
+async def test_uncached_class_always_queries(document_cls, registered_mock_driver):
+    Profile = _make_profile(document_cls)
+    pid = uuid4()
+    for _ in range(2):
+        registered_mock_driver.set_return_rows([{"id": pid, "name": "a"}])
+        await _maybe_await(Profile.get, id=pid)
+    assert _selects(registered_mock_driver) == 2
+    assert Profile.cache_info() is None
+
+
+async def test_get_by_primary_key_is_cached(Profile, registered_mock_driver):
+    pid = uuid4()
+    registered_mock_driver.set_return_rows([{"id": pid, "name": "a"}])
+    first = await _maybe_await(Profile.get, id=pid)
+    second = await _maybe_await(Profile.find_one, id=pid)
+    assert second.name == "a"
+    assert second is not first
+    assert _selects(registered_mock_driver) == 1
+    info = Profile.cache_info()
+    assert (info.hits, info.misses, info.currsize, info.maxsize) == (1, 1, 1, 2)
+
+
+async def test_cached_documents_are_copies(Profile, registered_mock_driver):
+    pid = uuid4()
+    registered_mock_driver.set_return_rows([{"id": pid, "name": "a"}])
+    doc = await _maybe_await(Profile.get, id=pid)
+    doc.name = "changed"
+    assert (await _maybe_await(Profile.get, id=pid)).name == "a"
+
+
+async def test_non_primary_key_lookup_bypasses_cache(Profile, registered_mock_driver):
+    pid = uuid4()
+    for _ in range(2):
+        registered_mock_driver.set_return_rows([{"id": pid, "name": "a"}])
+        await _maybe_await(Profile.find_one, id=pid, name="a")
+    assert _selects(registered_mock_driver) == 2
+    assert Profile.cache_info().misses == 0
+
+
+async def test_missing_document_is_not_cached(Profile, registered_mock_driver):
+    pid = uuid4()
+    with pytest.raises(DocumentNotFound):
+        await _maybe_await(Profile.get, id=pid)
+    assert await _maybe_await(Profile.find_one, id=pid) is None
+    assert _selects(registered_mock_driver) == 2
+    assert Profile.cache_info().currsize == 0
+
+
+async def test_key_of_another_type_is_not_cached(Profile, registered_mock_driver):
+    pid = uuid4()
+    registered_mock_driver.set_return_rows([{"id": pid, "name": "a"}])
+    await _maybe_await(Profile.get, id=str(pid))
+    assert Profile.cache_info().currsize == 0
+
+
+@pytest.mark.parametrize("write", ["save", "update", "delete"])
+async def test_instance_writes_invalidate(Profile, registered_mock_driver, write):
+    pid = uuid4()
+    registered_mock_driver.set_return_rows([{"id": pid, "name": "a"}])
+    doc = await _maybe_await(Profile.get, id=pid)
+    if write == "update":
+        await _maybe_await(doc.update, name="b")
+    else:
+        await _maybe_await(getattr(doc, write))
+    assert Profile.cache_info().currsize == 0
+    registered_mock_driver.set_return_rows([{"id": pid, "name": "b"}])
+    assert (await _maybe_await(Profile.get, id=pid)).name == "b"
+
+
+@pytest.mark.parametrize("writer", [False, True])
+async def test_batched_writes_invalidate_after_the_batch_runs(Profile, registered_mock_driver, variant, writer):
+    from coodie import batch as batches
+
+    names = {
+        ("sync", False): "BatchQuery",
+        ("sync", True): "BatchWriter",
+        ("async", False): "AsyncBatchQuery",
+        ("async", True): "AsyncBatchWriter",
+    }
+    batch = getattr(batches, names[variant, writer])()
+    pid = uuid4()
+    registered_mock_driver.set_return_rows([{"id": pid, "name": "a"}])
+    doc = await _maybe_await(Profile.get, id=pid)
+    doc.name = "b"
+    await _maybe_await(doc.save, batch=batch)
+    # A read between queueing and execution still sees (and may cache) the old row.
+    Profile.cache_clear()
+    registered_mock_driver.set_return_rows([{"id": pid, "name": "a"}])
+    await _maybe_await(Profile.get, id=pid)
+    assert Profile.cache_info().currsize == 1
+    await _maybe_await(batch.flush if writer else batch.execute)
+    assert Profile.cache_info().currsize == 0
+
+
+async def test_save_json_invalidates(Profile, registered_mock_driver):
+    pid = uuid4()
+    registered_mock_driver.set_return_rows([{"id": pid, "name": "a"}])
+    doc = await _maybe_await(Profile.get, id=pid)
+    doc.name = "b"
+    await _maybe_await(doc.save_json)
+    assert Profile.cache_info().currsize == 0
+
+
+@pytest.mark.parametrize("write", ["create", "truncate"])
+async def test_table_writes_clear_cache(Profile, registered_mock_driver, write):
+    pid = uuid4()
+    registered_mock_driver.set_return_rows([{"id": pid, "name": "a"}])
+    await _maybe_await(Profile.get, id=pid)
+    if write == "create":
+        await _maybe_await(Profile.find().create, id=pid, name="b")
+    else:
+        await _maybe_await(Profile.truncate)
+    assert Profile.cache_info().currsize == 0
+
+
+async def test_queryset_writes_clear_cache(Profile, registered_mock_driver):
+    pid = uuid4()
+    registered_mock_driver.set_return_rows([{"id": pid, "name": "a"}])
+    await _maybe_await(Profile.get, id=pid)
+    await _maybe_await(Profile.find(id=pid).update, name="b")
+    assert Profile.cache_info().currsize == 0
+
+
+async def test_bulk_save_invalidates(Profile, registered_mock_driver):
+    pid = uuid4()
+    registered_mock_driver.set_return_rows([{"id": pid, "name": "a"}])
+    doc = await _maybe_await(Profile.get, id=pid)
+    await _maybe_await(Profile.bulk_save, [doc])
+    assert Profile.cache_info().currsize == 0
+
+
+async def test_entries_expire_after_ttl(Profile, registered_mock_driver, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(read_cache.time, "monotonic", lambda: now[0])
+    pid = uuid4()
+    registered_mock_driver.set_return_rows([{"id": pid, "name": "a"}])
+    await _maybe_await(Profile.get, id=pid)
+    now[0] += 31
+    registered_mock_driver.set_return_rows([{"id": pid, "name": "b"}])
+    assert (await _maybe_await(Profile.get, id=pid)).name == "b"
+    info = Profile.cache_info()
+    assert (info.hits, info.misses, info.evictions) == (0, 2, 1)
+
+
+async def test_lru_eviction(Profile, registered_mock_driver):
+    ids = [uuid4() for _ in range(3)]
+    for pid in ids:
+        registered_mock_driver.set_return_rows([{"id": pid, "name": "a"}])
+        await _maybe_await(Profile.get, id=pid)
+    info = Profile.cache_info()
+    assert (info.currsize, info.evictions) == (2, 1)
+    Profile.cache_clear()
+    assert Profile.cache_info().currsize == 0
+
+
+def test_unknown_cache_option(document_cls):
+    Profile = _make_profile(document_cls, {"tll": 30})
+    with pytest.raises(ConfigurationError, match="tll"):
+        Profile.cache_info()
+
+
+async def test_async_concurrent_misses_share_one_query(registered_mock_driver, monkeypatch):
+    from coodie.aio.document import Document
+
+    Profile = _make_profile(Document, {"ttl": 30})
+    pid = uuid4()
+    registered_mock_driver.set_return_rows([{"id": pid, "name": "a"}])
+    execute_async = registered_mock_driver.execute_async
+
+    async def slow_execute_async(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return await execute_async(*args, **kwargs)
+
+    monkeypatch.setattr(registered_mock_driver, "execute_async", slow_execute_async)
+    docs = await asyncio.gather(*(Profile.get(id=pid) for _ in range(5)))
+    assert {d.name for d in docs} == {"a"}
+    assert _selects(registered_mock_driver) == 1
+
+
+def test_threaded_miss_is_never_served_from_the_cache(registered_mock_driver):
+    from coodie.sync.document import Document
+
+    Profile = _make_profile(Document, {"ttl": 30})
+    pid = uuid4()
+    start = threading.Barrier(8)
+
+    def lookup():
+        start.wait()
+        for _ in range(200):
+            assert Profile.find_one(id=pid) is None
+
+    # Switch threads as often as possible so lookups land inside other threads' loads.
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = [pool.submit(lookup) for _ in range(8)]
+        for future in futures:
+            future.result()
+    finally:
+        sys.setswitchinterval(interval)
+    assert Profile.cache_info().currsize == 0
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from coodie.scan import scan_token_ranges, scan_token_ranges_async
+
+RANGES = [(0, 10), (10, 20), (20, 30)]
+
+
+def _pages(lo):
+    """Two pages per range: rows tagged with the range start."""
+    return {None: ([{"r": lo, "p": 1}], b"more"), b"more": ([{"r": lo, "p": 2}], None)}
+
+
+def test_scan_token_ranges_yields_in_range_order():
+    def fetch_page(lo, hi, paging_state):
+        # Earlier ranges are slower, so completion order is reversed.
+        time.sleep(0.01 * (3 - lo // 10))
+        return _pages(lo)[paging_state]
+
+    out = list(scan_token_ranges(fetch_page, RANGES, parallelism=3))
+    assert [(row["r"], row["p"]) for rows, _ in out for row in rows] == [
+        (0, 1),
+        (0, 2),
+        (10, 1),
+        (10, 2),
+        (20, 1),
+        (20, 2),
+    ]
+    assert [token for _, token in out] == [None, 10, None, 20, None, 30]
+
+
+def test_scan_token_ranges_bounds_in_flight():
+    lock = threading.Lock()
+    in_flight = peak = 0
+
+    def fetch_page(lo, hi, paging_state):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.005)
+        with lock:
+            in_flight -= 1
+        return [{"r": lo}], None
+
+    ranges = [(i, i + 1) for i in range(20)]
+    out = list(scan_token_ranges(fetch_page, ranges, parallelism=4))
+    assert len(out) == 20
+    assert peak <= 4
+
+
+def test_scan_token_ranges_propagates_errors():
+    def fetch_page(lo, hi, paging_state):
+        if lo == 10:
+            raise RuntimeError("read timeout")
+        return [], None
+
+    with pytest.raises(RuntimeError, match="read timeout"):
+        list(scan_token_ranges(fetch_page, RANGES, parallelism=2))
+
+
+async def test_scan_token_ranges_async_yields_in_range_order():
+    in_flight = peak = 0
+
+    async def fetch_page(lo, hi, paging_state):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01 * (3 - lo // 10))
+        in_flight -= 1
+        return _pages(lo)[paging_state]
+
+    out = [page async for page in scan_token_ranges_async(fetch_page, RANGES, parallelism=2)]
+    assert [row["r"] for rows, _ in out for row in rows] == [0, 0, 10, 10, 20, 20]
+    assert [token for _, token in out] == [None, 10, None, 20, None, 30]
+    assert peak == 2
+
+
+async def test_scan_token_ranges_async_close_cancels_pending():
+    started = []
+
+    async def fetch_page(lo, hi, paging_state):
+        started.append(lo)
+        if lo:
+            await asyncio.sleep(10)
+        return [{"r": lo}], None
+
+    gen = scan_token_ranges_async(fetch_page, RANGES, parallelism=3)
+    _rows, token = await gen.__anext__()
+    assert token == 10
+    await gen.aclose()
+    assert sorted(started) == [0, 10, 20]
@@ -6,16 +6,19 @@ Covers:
 - ANN query builder: ``build_select`` with ``ann_of``
 - QuerySet: ``order_by_ann`` for both sync and async variants
 - Dimension validation in ``save()``
+- Vector buffers (ndarray / array.array / memoryview) and ``as_array``
 - ``ColumnDefinition`` defaults for vector fields
 """
 
 from __future__ import annotations
 
+import array
+
 import pytest
 from typing import Annotated
 from uuid import UUID, uuid4
 
-from pydantic import Field
+from pydantic import Field, ValidationError
 
 from coodie.cql_builder import _select_cql_cache, build_create_vector_index, build_select
 from coodie.exceptions import InvalidQueryError
@@ -147,9 +150,8 @@ def test_build_select_ann_of():
         ann_of=("embedding", [0.1, 0.2, 0.3]),
         limit=5,
     )
-    assert 'ORDER BY "embedding" ANN OF ?' in cql
-    assert "LIMIT 5" in cql
-    assert params == [[0.1, 0.2, 0.3]]
+    assert 'ORDER BY "embedding" ANN OF ? LIMIT ?' in cql
+    assert params == [[0.1, 0.2, 0.3], 5]
 
 
 def test_build_select_ann_with_where():
@@ -163,7 +165,7 @@ def test_build_select_ann_with_where():
     )
     assert 'WHERE "category" = ?' in cql
     assert 'ORDER BY "embedding" ANN OF ?' in cql
-    assert params == ["electronics", [0.1, 0.2]]
+    assert params == ["electronics", [0.1, 0.2], 10]
 
 
 def test_build_select_ann_caching():
@@ -171,15 +173,15 @@ def test_build_select_ann_caching():
     cql1, p1 = build_select("t", "ks", ann_of=("emb", [0.1, 0.2]), limit=5)
     cql2, p2 = build_select("t", "ks", ann_of=("emb", [0.3, 0.4]), limit=5)
     assert cql1 == cql2
-    assert p1 == [[0.1, 0.2]]
-    assert p2 == [[0.3, 0.4]]
+    assert p1 == [[0.1, 0.2], 5]
+    assert p2 == [[0.3, 0.4], 5]
 
 
 def test_build_select_no_ann_still_works():
     _select_cql_cache.clear()
     cql, params = build_select("products", "ks", limit=5)
     assert "ANN OF" not in cql
-    assert params == []
+    assert params == [5]
 
 
 # ------------------------------------------------------------------
@@ -239,9 +241,9 @@ async def test_order_by_ann_generates_correct_cql(EmbeddingDoc, queryset_cls, re
     registered_mock_driver.set_return_rows([])
     qs = queryset_cls(EmbeddingDoc).order_by_ann("embedding", [0.1, 0.2, 0.3]).limit(5)
     await _maybe_await(qs.all)
-    cql, _ = registered_mock_driver.executed[-1]
-    assert 'ORDER BY "embedding" ANN OF ?' in cql
-    assert "LIMIT 5" in cql
+    cql, params = registered_mock_driver.executed[-1]
+    assert 'ORDER BY "embedding" ANN OF ? LIMIT ?' in cql
+    assert params == [[0.1, 0.2, 0.3], 5]
 
 
 def test_order_by_ann_does_not_affect_original(EmbeddingDoc, queryset_cls, registered_mock_driver):
@@ -293,6 +295,107 @@ async def test_save_validates_too_many_dimensions(VecDoc, registered_mock_driver
         await _maybe_await(doc.save)
 
 
+# ------------------------------------------------------------------
+# Vector buffers (numpy.ndarray / array.array / memoryview)
+# ------------------------------------------------------------------
+
+
+def test_vector_field_keeps_buffers(VecDoc):
+    buf = array.array("f", [0.1, 0.2, 0.3])
+    assert VecDoc(embedding=buf).embedding is buf
+    view = memoryview(buf)
+    assert VecDoc(embedding=view).embedding is view
+
+
+def test_vector_field_keeps_ndarray(VecDoc):
+    np = pytest.importorskip("numpy")
+    vec = np.ones(3, dtype=np.float32)
+    doc = VecDoc(embedding=vec)
+    assert doc.embedding is vec
+    assert doc.model_dump()["embedding"] == [1.0, 1.0, 1.0]
+
+
+def test_vector_field_rejects_multidimensional_buffer(VecDoc):
+    np = pytest.importorskip("numpy")
+    with pytest.raises(ValidationError, match="one-dimensional"):
+        VecDoc(embedding=np.ones((3, 1), dtype=np.float32))
+
+
+def test_vector_field_still_validates_lists(VecDoc):
+    with pytest.raises(ValidationError):
+        VecDoc(embedding=["a", "b", "c"])
+
+
+async def test_save_binds_buffer_as_list(VecDoc, registered_mock_driver):
+    buf = array.array("f", [0.5, 0.25, 0.125])
+    doc = VecDoc(embedding=buf)
+    await _maybe_await(doc.save)
+    _, params = registered_mock_driver.executed[-1]
+    assert [0.5, 0.25, 0.125] in params
+    assert doc.embedding is buf
+
+
+async def test_save_validates_buffer_dimensions(VecDoc, registered_mock_driver):
+    doc = VecDoc(embedding=array.array("f", [0.5, 0.25]))
+    with pytest.raises(InvalidQueryError, match="expects 3 dimensions, got 2"):
+        await _maybe_await(doc.save)
+
+
+async def test_update_binds_buffer_as_list(VecDoc, registered_mock_driver):
+    doc = VecDoc(embedding=[0.0, 0.0, 0.0])
+    await _maybe_await(doc.update, embedding=array.array("f", [0.5, 0.25, 0.125]))
+    _, params = registered_mock_driver.executed[-1]
+    assert params[0] == [0.5, 0.25, 0.125]
+
+
+def test_order_by_ann_accepts_buffer(EmbeddingDoc, queryset_cls, registered_mock_driver):
+    qs = queryset_cls(EmbeddingDoc).order_by_ann("embedding", array.array("f", [0.5, 0.25, 0.125]))
+    assert qs._ann_of_val == ("embedding", [0.5, 0.25, 0.125])
+
+
+@pytest.fixture
+def ArrayVecDoc(document_cls):
+    class ArrayVecDoc(document_cls):
+        id: Annotated[UUID, PrimaryKey()] = Field(default_factory=uuid4)
+        embedding: Annotated[list[float], Vector(dimensions=3, as_array=True)] = Field(default_factory=list)
+
+        class Settings:
+            name = "array_vec_docs"
+            keyspace = "test_ks"
+
+    return ArrayVecDoc
+
+
+def test_as_array_converts_on_validation(ArrayVecDoc):
+    np = pytest.importorskip("numpy")
+    doc = ArrayVecDoc(embedding=[0.5, 0.25, 0.125])
+    assert isinstance(doc.embedding, np.ndarray)
+    assert doc.embedding.dtype == np.float32
+    with pytest.raises(ValidationError, match="invalid float vector"):
+        ArrayVecDoc(embedding=["a", "b", "c"])
+
+
+@pytest.mark.parametrize("validate", [False, True])
+async def test_as_array_hydrates_float32(ArrayVecDoc, registered_mock_driver, validate):
+    np = pytest.importorskip("numpy")
+    registered_mock_driver.set_return_rows(
+        [{"id": uuid4(), "embedding": [0.5, 0.25, 0.125]}, {"id": uuid4(), "embedding": None}]
+    )
+    docs = await _maybe_await(ArrayVecDoc.find().validate(validate).all)
+    assert docs[0].embedding.dtype == np.float32
+    assert docs[0].embedding.tolist() == [0.5, 0.25, 0.125]
+    assert docs[1].embedding.shape == (0,)
+
+
+async def test_as_array_lazy_field_is_converted_once(ArrayVecDoc, registered_mock_driver):
+    pytest.importorskip("numpy")
+    registered_mock_driver.set_return_rows([{"id": uuid4(), "embedding": [0.5, 0.25, 0.125]}])
+    [doc] = await _maybe_await(ArrayVecDoc.find().all, lazy=True)
+    doc.embedding[0] = 1.0
+    assert doc.embedding is doc.embedding
+    assert doc.embedding.tolist() == [1.0, 0.25, 0.125]
+
+
 # ------------------------------------------------------------------
 # ColumnDefinition defaults for vector fields
 # ------------------------------------------------------------------
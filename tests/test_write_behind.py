@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Annotated
+from uuid import UUID, uuid4
+
+import pytest
+from pydantic import Field
+
+from coodie import write_behind
+from coodie.aio.document import Document
+from coodie.batch import AsyncBatchQuery
+from coodie.exceptions import ConfigurationError, InvalidQueryError
+from coodie.fields import PrimaryKey
+from coodie.write_behind import WriteBehindQueue, configure_write_behind, get_write_behind
+
+_INSERT = "INSERT INTO ks.t (pk, v) VALUES (?, ?)"
+
+
+class DeferredItem(Document):
+    id: Annotated[UUID, PrimaryKey()] = Field(default_factory=uuid4)
+    name: str = ""
+
+    class Settings:
+        name = "deferred_items"
+        keyspace = "test_ks"
+
+
+@pytest.fixture(autouse=True)
+def _fresh_default_queue(monkeypatch):
+    monkeypatch.setattr(write_behind, "_default", None)
+    monkeypatch.setattr(write_behind, "_default_options", {})
+
+
+async def test_put_returns_before_write_and_flush_waits(registered_mock_driver):
+    queue = WriteBehindQueue()
+    await queue.put(registered_mock_driver, _INSERT, ["a", 1], partition_key="a")
+    assert registered_mock_driver.executed == []
+    assert queue.pending == 1
+    await queue.flush()
+    assert registered_mock_driver.executed == [(_INSERT, ["a", 1])]
+    assert queue.pending == 0
+    await queue.aclose()
+
+
+async def test_same_partition_writes_are_coalesced(registered_mock_driver):
+    queue = WriteBehindQueue(max_batch=2)
+    for i in range(3):
+        await queue.put(registered_mock_driver, _INSERT, ["a", i], partition_key="a")
+    await queue.put(registered_mock_driver, _INSERT, ["b", 0], partition_key="b")
+    await queue.aclose()
+
+    sent = registered_mock_driver.executed
+    batches = [params for cql, params in sent if cql.startswith("BEGIN UNLOGGED BATCH")]
+    singles = sorted(params for cql, params in sent if cql == _INSERT)
+    # The partition's writes stay in order: [0, 1] as one batch, then 2.
+    assert batches == [["a", 0, "a", 1]]
+    assert singles == [["a", 2], ["b", 0]]
+    assert sent.index((_INSERT, ["a", 2])) > next(i for i, (c, _) in enumerate(sent) if c.startswith("BEGIN"))
+
+
+async def test_put_waits_while_queue_is_full(registered_mock_driver):
+    queue = WriteBehindQueue(max_pending=1)
+    await queue.put(registered_mock_driver, _INSERT, ["a", 1], partition_key="a")
+    second = asyncio.ensure_future(queue.put(registered_mock_driver, _INSERT, ["b", 1], partition_key="b"))
+    await asyncio.sleep(0)
+    assert queue.pending == 1
+    await second
+    await queue.aclose()
+    assert len(registered_mock_driver.executed) == 2
+
+
+async def test_flush_does_not_wait_for_later_writes(registered_mock_driver, monkeypatch):
+    original = registered_mock_driver.execute_async
+    release = asyncio.Event()
+
+    async def gated(stmt, params, **kwargs):
+        if params[0] == "slow":
+            await release.wait()
+        return await original(stmt, params, **kwargs)
+
+    monkeypatch.setattr(registered_mock_driver, "execute_async", gated)
+    queue = WriteBehindQueue()
+    await queue.put(registered_mock_driver, _INSERT, ["a", 1], partition_key="a")
+    flushed = asyncio.ensure_future(queue.flush())
+    await asyncio.sleep(0)
+    await queue.put(registered_mock_driver, _INSERT, ["slow", 1], partition_key="slow")
+    await asyncio.wait_for(flushed, 1)
+    assert registered_mock_driver.executed == [(_INSERT, ["a", 1])]
+    assert queue.pending == 1
+    release.set()
+    await queue.aclose()
+
+
+async def test_put_waiting_for_space_fails_after_close(registered_mock_driver):
+    queue = WriteBehindQueue(max_pending=1)
+    await queue.put(registered_mock_driver, _INSERT, ["a", 1], partition_key="a")
+    second = asyncio.ensure_future(queue.put(registered_mock_driver, _INSERT, ["b", 1], partition_key="b"))
+    await asyncio.sleep(0)
+    await queue.aclose()
+    with pytest.raises(InvalidQueryError, match="closed"):
+        await second
+    assert registered_mock_driver.executed == [(_INSERT, ["a", 1])]
+
+
+async def test_failed_write_is_reported(registered_mock_driver, monkeypatch):
+    original = registered_mock_driver.execute_async
+
+    async def flaky(stmt, params, **kwargs):
+        if params and params[0] == "bad":
+            raise RuntimeError("write timeout")
+        return await original(stmt, params, **kwargs)
+
+    monkeypatch.setattr(registered_mock_driver, "execute_async", flaky)
+    failures = []
+    queue = WriteBehindQueue(on_error=failures.append)
+    await queue.put(registered_mock_driver, _INSERT, ["bad", 1], partition_key="bad")
+    await queue.put(registered_mock_driver, _INSERT, ["ok", 1], partition_key="ok")
+    await queue.aclose()
+
+    [failure] = failures
+    assert not failure.success
+    assert failure.partition_key == "bad"
+    assert failure.statements == [(_INSERT, ["bad", 1])]
+    assert isinstance(failure.error, RuntimeError)
+    assert registered_mock_driver.executed == [(_INSERT, ["ok", 1])]
+
+
+async def test_closed_queue_rejects_writes(registered_mock_driver):
+    queue = WriteBehindQueue()
+    await queue.aclose()
+    with pytest.raises(InvalidQueryError, match="closed"):
+        await queue.put(registered_mock_driver, _INSERT, ["a", 1])
+
+
+async def test_save_deferred(registered_mock_driver):
+    item = DeferredItem(name="A")
+    await item.save(deferred=True)
+    assert registered_mock_driver.executed == []
+    await get_write_behind().aclose()
+    [(cql, params)] = registered_mock_driver.executed
+    assert cql.startswith("INSERT INTO test_ks.deferred_items")
+    assert item.id in params
+
+
+async def test_save_deferred_rejects_batch(registered_mock_driver):
+    with pytest.raises(InvalidQueryError, match="deferred"):
+        await DeferredItem().save(batch=AsyncBatchQuery(), deferred=True)
+
+
+async def test_configure_write_behind(registered_mock_driver):
+    queue = configure_write_behind(max_pending=10)
+    assert get_write_behind() is queue
+    await DeferredItem().save(deferred=True)
+    with pytest.raises(ConfigurationError):
+        configure_write_behind()
+    await queue.aclose()
+    # A closed default queue is replaced, keeping the configured settings.
+    replacement = get_write_behind()
+    assert replacement is not queue
+    assert replacement._max_pending == 10
+    await replacement.aclose()
+
+
+def test_invalid_settings():
+    with pytest.raises(ConfigurationError):
+        WriteBehindQueue(max_pending=0)